@@ -204,10 +204,12 @@ class InvoiceDatabase:
                      drawing_regions=None, drawing_column_lines=None, extraction_regions=None,
                      extraction_column_lines=None, drawing_page_regions=None,
                      drawing_page_column_lines=None, extraction_page_regions=None,
-                     extraction_page_column_lines=None, extraction_method="pypdf_table_extraction"):
+                     extraction_page_column_lines=None, extraction_method="pypdf_table_extraction",
+                     commit=True):
         """
         Save a template to the database with dual coordinate format only.
         If template_id is provided, updates an existing template, otherwise creates a new one.
+        With commit=False the write is left in the open transaction for the caller to commit.
         """
         try:
             # Import dual coordinate storage system
@@ -306,7 +308,8 @@ class InvoiceDatabase:
                 template_id = self.cursor.lastrowid
                 print(f"Created new template '{name}' (ID: {template_id})")
 
-            self.conn.commit()
+            if commit:
+                self.conn.commit()
             return template_id
 
         except Exception as e:
@@ -316,6 +319,32 @@ class InvoiceDatabase:
             self.conn.rollback()
             return None
 
+    def save_template_replacing(self, old_template_id, name, description, config, **kwargs):
+        """
+        Replace a template with a newly created one (e.g. when it is renamed).
+        The delete and the insert run in a single transaction, so either both apply or neither does.
+        Takes the same keyword arguments as save_template and returns the new template ID, or None.
+        """
+        try:
+            self.cursor.execute("DELETE FROM templates WHERE id = ?", (old_template_id,))
+        except Exception as e:
+            print(f"Error deleting template: {str(e)}")
+            self.conn.rollback()
+            return None
+
+        # save_template rolls the whole transaction back, delete included, if the insert fails
+        template_id = self.save_template(name, description, config, commit=False, **kwargs)
+        if template_id is None:
+            return None
+
+        try:
+            self.conn.commit()
+        except Exception as e:
+            print(f"Error replacing template: {str(e)}")
+            self.conn.rollback()
+            return None
+        return template_id
+
     def get_template(self, template_id=None, template_name=None):
         """
         Get a template by ID or name.
@@ -449,15 +478,70 @@ class InvoiceDatabase:
 
     def delete_template(self, template_id):
         """Delete a template by ID"""
+        return self.delete_templates([template_id])
+
+    def delete_templates(self, template_ids):
+        """Delete several templates by ID with a single statement and commit"""
+        if not template_ids:
+            return True
+        placeholders = ", ".join("?" * len(template_ids))
         try:
-            self.cursor.execute("DELETE FROM templates WHERE id = ?", (template_id,))
+            self.cursor.execute(f"DELETE FROM templates WHERE id IN ({placeholders})", tuple(template_ids))
             self.conn.commit()
             return True
         except Exception as e:
-            print(f"Error deleting template: {str(e)}")
+            print(f"Error deleting templates: {str(e)}")
             self.conn.rollback()
             return False
 
+    def get_template_summaries(self, template_ids):
+        """
+        Get the name, type and drawing regions of several templates with a single query.
+        Returns a list of dictionaries in the order of template_ids; unknown IDs are skipped.
+        """
+        if not template_ids:
+            return []
+        placeholders = ", ".join("?" * len(template_ids))
+        try:
+            self.cursor.execute(f"""
+                SELECT id, name, template_type, drawing_regions
+                FROM templates
+                WHERE id IN ({placeholders})
+            """, tuple(template_ids))
+
+            from dual_coordinate_storage import DualCoordinateStorage
+            storage = DualCoordinateStorage()
+
+            summaries = {}
+            for row in self.cursor.fetchall():
+                summaries[row[0]] = {
+                    'id': row[0],
+                    'name': row[1],
+                    'template_type': row[2],
+                    'regions': storage.deserialize_regions(row[3]) if row[3] else {}
+                }
+            return [summaries[template_id] for template_id in template_ids if template_id in summaries]
+
+        except Exception as e:
+            print(f"Error getting template summaries: {str(e)}")
+            return []
+
+    def get_templates_version(self):
+        """
+        Get a cheap token that changes whenever the database is written to.
+        PRAGMA data_version moves on every commit made through another connection and
+        total_changes counts this connection's own writes, so unlike timestamps the token
+        also catches in-place updates. Returns None if it cannot be read, which callers
+        should treat as "changed".
+        """
+        try:
+            self.cursor.execute("PRAGMA data_version")
+            data_version = self.cursor.fetchone()[0]
+            return f"{data_version}_{self.conn.total_changes}"
+        except Exception as e:
+            print(f"Error getting templates version: {str(e)}")
+            return None
+
     def get_all_templates(self):
         """Get all templates from the database"""
         try:
@@ -4,14 +4,37 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QFormLayout, QMessageBox, QInputDialog, QDialogButtonBox,
                              QApplication, QTabWidget, QCheckBox, QComboBox, QGroupBox, QGridLayout, QSpinBox, QListWidget, QListWidgetItem,
                              QMainWindow, QStackedWidget, QFileDialog, QScrollArea, QFrame, QSplitter, QGridLayout, QLineEdit, QComboBox,
-                             QListWidget, QProgressBar, QTabWidget, QTextEdit, QCheckBox, QProgressDialog, QMenu)
-from PySide6.QtCore import Qt, Signal, QRect, QPoint
-from PySide6.QtGui import QFont, QIcon, QColor
+                             QListWidget, QProgressBar, QTabWidget, QTextEdit, QCheckBox, QProgressDialog, QMenu,
+                             QStyledItemDelegate, QStyleOptionViewItem, QStyle, QTableView)
+from PySide6.QtCore import (Qt, Signal, QRect, QPoint, QSize, QEvent, QTimer, QObject, QRunnable, QThreadPool,
+                            QAbstractTableModel, QModelIndex)
+from PySide6.QtGui import QFont, QFontDatabase, QIcon, QColor, QBrush, QTextCursor, QPainter, QCursor
 from database import InvoiceDatabase
 import os
+import re
+import logging
 import json
+import hashlib
+import functools
+import copy
 import sqlite3
+import traceback
 from datetime import datetime
+from operator import itemgetter
+
+import yaml
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson is optional; it only speeds up dumping configs for display
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import new factory modules for code deduplication
 from common_factories import (
@@ -19,6 +42,452 @@ from common_factories import (
     ValidationFactory, get_database_factory
 )
 from ui_component_factory import UIComponentFactory, LayoutFactory
+from dual_coordinate_storage import DualCoordinateRegion, DualCoordinateColumnLine, DualCoordinateStorage
+from standardized_coordinates import StandardRegion
+
+logger = logging.getLogger(__name__)
+
+# Page expressions such as "1,3-5,n-1,n". _PAGE_EXPR_RE matches one whole
+# comma-separated part (a single reference or a range) in the common lowercase
+# form; anything else falls back to the part-by-part _scan_page_expression.
+# Relative references ("n-2") are matched first so they are never read as ranges.
+_PAGE_REF = r'n-\d+|n|last|\d+'
+_PAGE_EXPR_RE = re.compile(r'\s*(' + _PAGE_REF + r')(?:\s*-\s*(' + _PAGE_REF + r'))?\s*(?:,|$)')
+_REF_RE = re.compile(r'\A(?:(\d+)|n|last|n-(\d+))\Z')
+
+# Table sections, in display order
+_SECTIONS = ('header', 'items', 'summary')
+# Region name prefix per section ("H1", "I1", "S1", ...)
+_SECTION_PREFIXES = {section: section[0].upper() for section in _SECTIONS}
+
+# Config keys get_config_data manages itself; anything else in a template's config is carried over as-is
+_KNOWN_CONFIG_PARAMS = frozenset({
+    'multi_table_mode', 'extraction_params', 'regex_patterns', 'use_middle_page',
+    'fixed_page_count', 'total_pages', 'page_indices', 'store_original_coords',
+    'original_regions', 'original_column_lines', 'scale_factors',
+})
+
+# Column line description cell, as written by the columns table: "Start: (x, y) End: (x, y)"
+_COLUMN_DESC_RE = re.compile(
+    r'\s*Start:\s*\(\s*([-+\d.eE]+)\s*,\s*([-+\d.eE]+)\s*\)'
+    r'\s*End:\s*\(\s*([-+\d.eE]+)\s*,\s*([-+\d.eE]+)\s*\)'
+)
+
+
+def _compile_page_ref(ref):
+    """Pre-parse a lowercase page reference into (text, absolute page, offset from the last page)"""
+    number, offset = _REF_RE.match(ref).groups()
+    if number is not None:
+        return ref, int(number), None
+    return ref, None, int(offset) if offset is not None else 0
+
+
+def _resolve_compiled_ref(compiled_ref, total_pages):
+    """Resolve a pre-parsed page reference against a document's page count"""
+    _, number, offset = compiled_ref
+    if number is not None:
+        return number
+    if offset == 0:
+        return total_pages
+    result = total_pages - offset
+    return result if result >= 1 else None
+
+
+def _resolve_page_ref(ref, total_pages):
+    """Resolve a lowercase page reference ("3", "n", "n-1", "last") to a page number"""
+    if _REF_RE.match(ref) is None:
+        return None
+    return _resolve_compiled_ref(_compile_page_ref(ref), total_pages)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_page_expression(expression):
+    """
+    Pre-parse a page expression into (start_ref, end_ref) parts.
+
+    The result does not depend on the page count, so one compile serves every
+    document size. end_ref is None for single references; None is returned when
+    the expression is not in the plain lowercase form, or when a part would be
+    read differently by _scan_page_expression (e.g. "n-2-n", "2-n-1", "n-n").
+    """
+    stripped = expression.strip()
+
+    # Fast path for the common single-reference input ("1", "n", "n-1", "last")
+    if ',' not in stripped and _REF_RE.match(stripped):
+        return ((_compile_page_ref(stripped), None),)
+
+    parts = []
+    position = 0
+    for match in _PAGE_EXPR_RE.finditer(expression):
+        if match.start() != position:
+            return None
+        position = match.end()
+        start_ref, end_ref = match.groups()
+        if end_ref is not None and ('-' in start_ref or '-' in end_ref or
+                                    (start_ref == 'n' and expression[match.end(1)] == '-')):
+            # More than one dash, or "n-..." which the scanner reads as one reference
+            return None
+        parts.append((_compile_page_ref(start_ref),
+                      _compile_page_ref(end_ref) if end_ref is not None else None))
+    if position != len(expression):
+        return None
+    return tuple(parts)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_page_expression_cached(expression, total_pages):
+    """
+    Parse a page expression and resolve it for a document of total_pages pages.
+
+    Results are memoized, so the returned page collection is an immutable tuple.
+
+    Returns:
+        tuple: (sorted tuple of page numbers, error message or None)
+    """
+    if not expression.strip():
+        return (), "Empty expression"
+
+    parts = _compile_page_expression(expression)
+    if parts is None:
+        # Not the plain form; parse part by part, which also gives the precise error
+        return _scan_page_expression(expression, total_pages)
+
+    # Bitmap of selected pages: deduplicated and already in order when read back
+    seen = bytearray(total_pages + 1)
+    for start_ref, end_ref in parts:
+        start_page = _resolve_compiled_ref(start_ref, total_pages)
+        if end_ref is None:
+            if start_page is None:
+                return (), f"Invalid page reference: {start_ref[0]}"
+            if 1 <= start_page <= total_pages:
+                seen[start_page] = 1
+            continue
+
+        end_page = _resolve_compiled_ref(end_ref, total_pages)
+        if start_page is None:
+            return (), f"Invalid start page: {start_ref[0]}"
+        if end_page is None:
+            return (), f"Invalid end page: {end_ref[0]}"
+        if start_page > end_page:
+            return (), f"Invalid range: {start_page} > {end_page}"
+        first, last = max(start_page, 1), min(end_page, total_pages)
+        if first <= last:
+            seen[first:last + 1] = b'\x01' * (last - first + 1)
+
+    return tuple(page for page, selected in enumerate(seen) if selected), None
+
+
+def _scan_page_expression(expression, total_pages):
+    """
+    Parse a page expression part by part.
+
+    A part containing a dash is a range unless it starts with "n-" ("n-2" is a
+    relative reference); a range must contain exactly one dash. References are
+    matched case-insensitively and empty parts are skipped.
+
+    Returns:
+        tuple: (sorted tuple of page numbers, error message or None)
+    """
+    # Bitmap of selected pages: deduplicated and already in order when read back
+    seen = bytearray(total_pages + 1)
+
+    for part in expression.split(','):
+        part = part.strip()
+        if not part:
+            continue
+
+        if '-' in part and not part.startswith('n-'):
+            if part.count('-') != 1:
+                return (), f"Invalid range format: {part}"
+            start_str, end_str = part.split('-')
+            start_page = _resolve_page_ref(start_str.strip().lower(), total_pages)
+            end_page = _resolve_page_ref(end_str.strip().lower(), total_pages)
+            if start_page is None:
+                return (), f"Invalid start page: {start_str}"
+            if end_page is None:
+                return (), f"Invalid end page: {end_str}"
+            if start_page > end_page:
+                return (), f"Invalid range: {start_page} > {end_page}"
+            first, last = max(start_page, 1), min(end_page, total_pages)
+            if first <= last:
+                seen[first:last + 1] = b'\x01' * (last - first + 1)
+        else:
+            page_num = _resolve_page_ref(part.lower(), total_pages)
+            if page_num is None:
+                return (), f"Invalid page reference: {part}"
+            if 1 <= page_num <= total_pages:
+                seen[page_num] = 1
+
+    return tuple(page for page, selected in enumerate(seen) if selected), None
+
+
+def _xywh_from_qrect(rect):
+    return rect.x(), rect.y(), rect.width(), rect.height()
+
+
+def _xywh_from_dual(region):
+    # Drawing coordinates are the ones shown in the UI
+    return region.drawing_x, region.drawing_y, region.drawing_width, region.drawing_height
+
+
+def _xywh_from_standard(region):
+    return _xywh_from_qrect(region.rect)
+
+
+def _xywh_from_dict(region):
+    if 'x' in region and 'y' in region and 'width' in region and 'height' in region:
+        return region['x'], region['y'], region['width'], region['height']
+    if 'x1' in region and 'y1' in region and 'x2' in region and 'y2' in region:
+        return region['x1'], region['y1'], region['x2'] - region['x1'], region['y2'] - region['y1']
+    return None
+
+
+def _line_from_dual(line):
+    return line.drawing_start_x, line.drawing_start_y, line.drawing_end_x, line.drawing_end_y, 0
+
+
+def _line_from_sequence(line):
+    # Old format: [QPoint, QPoint, region_index] or [dict, dict, region_index]
+    if len(line) < 2:
+        return None
+    points = []
+    for point in line[:2]:
+        if isinstance(point, dict) and 'x' in point:
+            points.append((point['x'], point['y']))
+        elif isinstance(point, QPoint):
+            points.append((point.x(), point.y()))
+        else:
+            return None
+    (start_x, start_y), (end_x, end_y) = points
+    return start_x, start_y, end_x, end_y, line[2] if len(line) > 2 else 0
+
+
+def _line_from_dict(line):
+    # New format: {'x1': float, 'y1': float, 'x2': float, 'y2': float, 'region_index': int}
+    if 'x1' in line and 'y1' in line and 'x2' in line and 'y2' in line:
+        return (int(line['x1']), int(line['y1']), int(line['x2']), int(line['y2']),
+                line.get('region_index', 0))
+    return None
+
+
+# Region/column line formats keyed by exact type -> (x, y, width, height) or
+# (start_x, start_y, end_x, end_y, region_index); None marks an unusable value
+_EXTRACT_XYWH = {
+    QRect: _xywh_from_qrect,
+    DualCoordinateRegion: _xywh_from_dual,
+    StandardRegion: _xywh_from_standard,
+    dict: _xywh_from_dict,
+}
+_EXTRACT_LINE = {
+    DualCoordinateColumnLine: _line_from_dual,
+    list: _line_from_sequence,
+    tuple: _line_from_sequence,
+    dict: _line_from_dict,
+}
+
+
+def _lookup_handler(table, value):
+    """Return the handler for value's type, falling back to isinstance for subclasses"""
+    handler = table.get(type(value))
+    if handler is None:
+        for kind, candidate in table.items():
+            if isinstance(value, kind):
+                return candidate
+    return handler
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalized_xywh(x, y, width, height):
+    """Integer (x, y, width, height) with a negative width or height flipped to extend the other way"""
+    if width < 0:
+        x += width
+        width = -width
+    if height < 0:
+        y += height
+        height = -height
+    return int(x), int(y), int(width), int(height)
+
+
+# Pull all coordinates out of a stored rect/point dict in one call
+_RECT_XYWH = itemgetter('x', 'y', 'width', 'height')
+_POINT_XY = itemgetter('x', 'y')
+
+
+def _rects_from_original(rects):
+    """QRects for a section of original unscaled {'x','y','width','height'} dicts, coerced in one pass"""
+    qrect = QRect
+    to_int = int
+    rect_xywh = _RECT_XYWH
+    return [qrect(*map(to_int, rect_xywh(d))) for d in rects]
+
+
+def _convert_rect_data(rect_data, pdf_height=None):
+    """
+    Convert coordinates from database format to PDF format (QRect)
+    Handles both original unscaled (x,y,width,height) and scaled (x1,y1,x2,y2) formats
+    Prioritizes using the original unscaled coordinates if available
+    """
+    # Stored rects are plain dicts as loaded from JSON/YAML
+    if type(rect_data) is dict:
+        # First check if we have original unscaled coordinates
+        if 'x' in rect_data and 'y' in rect_data and 'width' in rect_data and 'height' in rect_data:
+            return QRect(*_normalized_xywh(*map(float, _RECT_XYWH(rect_data))))
+
+        # Handle scaled format only (x1,y1,x2,y2)
+        if 'x1' in rect_data and 'y1' in rect_data and 'x2' in rect_data and 'y2' in rect_data:
+            x1 = float(rect_data['x1'])
+            y1 = float(rect_data['y1'])
+            return QRect(*_normalized_xywh(x1, y1, float(rect_data['x2']) - x1, float(rect_data['y2']) - y1))
+
+        logger.warning("Unknown rect format in template: %s", rect_data)
+        return QRect()
+    if isinstance(rect_data, QRect):
+        return QRect(*_normalized_xywh(rect_data.x(), rect_data.y(), rect_data.width(), rect_data.height()))
+    if isinstance(rect_data, StandardRegion):
+        # StandardRegion object - use its UI coordinates
+        return QRect(rect_data.rect)
+    logger.warning("Unknown rect type in template: %s", type(rect_data))
+    return QRect()
+
+
+def _convert_point(point, flip_y_height=None):
+    """QPoint for an {'x','y'} dict, y flipped to top-left origin when a height is given; None otherwise"""
+    if type(point) is dict:
+        try:
+            x, y = _POINT_XY(point)
+        except KeyError:
+            return None
+        if x is not None and y is not None:
+            y = int(y)
+            if flip_y_height is not None:
+                y = flip_y_height - y  # Convert to top-left origin
+            return QPoint(int(x), y)
+    return None
+
+
+def _convert_line(line_data, flip_y_height=None):
+    """
+    Convert a stored column line to [start QPoint, end QPoint] or [start, end, region index]
+    Handles both the [{'x','y'}, {'x','y'}, index] list format and the old
+    {'orig_start', 'orig_end', 'region_index'} dict format; returns None if it cannot be converted
+    """
+    if type(line_data) is dict:
+        # Old format with original coordinates, never flipped
+        start_point = _convert_point(line_data.get('orig_start'))
+        end_point = _convert_point(line_data.get('orig_end'))
+        region_index = line_data.get('region_index')
+    elif type(line_data) in (list, tuple) and len(line_data) >= 2:
+        start_point = _convert_point(line_data[0], flip_y_height)
+        end_point = _convert_point(line_data[1], flip_y_height)
+        region_index = line_data[2] if len(line_data) > 2 and type(line_data[2]) is int else None
+    else:
+        start_point = end_point = None
+
+    if start_point is None or end_point is None:
+        logger.warning("Could not convert column line: %s", line_data)
+        return None
+    if region_index is not None:
+        return [start_point, end_point, region_index]
+    return [start_point, end_point]
+
+
+class _LazyPageList:
+    """
+    Read-only list of a multi-page template's per-page data, converted on first access
+    convert(page_idx, raw_page) is called at most once per page; list(pages) converts them all
+    """
+
+    __slots__ = ('_raw_pages', '_convert', '_converted')
+
+    def __init__(self, raw_pages, convert):
+        self._raw_pages = list(raw_pages)
+        self._convert = convert
+        self._converted = {}
+
+    def __len__(self):
+        return len(self._raw_pages)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw_pages)))]
+        if index < 0:
+            index += len(self._raw_pages)
+        page = self._converted.get(index)
+        if page is None:
+            if not 0 <= index < len(self._raw_pages):
+                raise IndexError("page index out of range")
+            page = self._converted[index] = self._convert(index, self._raw_pages[index])
+        return page
+
+    def __iter__(self):
+        for index in range(len(self._raw_pages)):
+            yield self[index]
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def _fill_section_params(extraction_params):
+    """Give each table section its own params dict, filling missing keys from the global params in place"""
+    defaults = {
+        'flavor': extraction_params.get('flavor', 'stream'),
+        'split_text': extraction_params.get('split_text', True),
+        'strip_text': extraction_params.get('strip_text', '\n'),
+        'edge_tol': 0.5,
+    }
+    for section in _SECTIONS:
+        section_params = extraction_params.setdefault(section, {})
+        for key, value in defaults.items():
+            section_params.setdefault(key, value)
+
+
+def _split_extraction_params(extraction_params, skip_sections=(), skip_globals=()):
+    """Walk extraction params once, returning (formatted section lines, {global param: value})"""
+    section_parts = []
+    global_params = {}
+    for key, value in extraction_params.items():
+        # Each value is classified exactly once; no second isinstance walk for the globals
+        is_section = isinstance(value, dict)
+        if is_section and key not in skip_sections:
+            section_parts.append(f"\n{key.capitalize()}:\n")
+            section_parts += [f"  {param}: {param_value}\n" for param, param_value in value.items()]
+        elif not is_section and key not in skip_globals:
+            global_params[key] = value
+    return section_parts, global_params
+
+
+def _read_row(model, row, cols):
+    """Read the display text of one table row straight from the model; empty cells read as None"""
+    index = model.index
+    data = model.data
+    return [data(index(row, col)) for col in cols]
+
+
+def _format_config_param(key, value):
+    """One <li> of the 'Additional Parameters' list in the template preview"""
+    # bool before the others: it would otherwise be shown as str(True)
+    if isinstance(value, bool):
+        formatted_value = 'Yes' if value else 'No'
+    elif isinstance(value, (dict, list)):
+        formatted_value = "<i>(complex value)</i>"
+    else:
+        formatted_value = str(value)
+    return f"<li>{key}: {formatted_value}</li>"
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_creation_date(date_str):
+    """Format an ISO timestamp as 'DD/MM/YYYY h:MM AM/PM'; anything else is returned unchanged"""
+    if not isinstance(date_str, str) or "T" not in date_str:
+        return date_str
+    try:
+        parsed = datetime.fromisoformat(date_str)
+    except ValueError:
+        return date_str
+    hour = parsed.hour % 12 or 12
+    am_pm = "AM" if parsed.hour < 12 else "PM"
+    return f"{parsed:%d/%m/%Y} {hour}:{parsed:%M} {am_pm}"
+
 
 class SaveTemplateDialog(QDialog):
     """Dialog for saving a new template"""
@@ -148,6 +617,26 @@ class SaveTemplateDialog(QDialog):
 class EditTemplateDialog(QDialog):
     """Dialog for editing template settings and configuration"""
 
+    # Shared across dialog instances so fonts and style strings are built once
+    _MONO_FONT = None
+    _TEXT_BOX_QSS = "color: black; background-color: white;"
+    _PREVIEW_QSS = "color: black; background-color: #f9f9f9; border: 1px solid #ddd;"
+    _MUTED_STYLE = "color: #666; font-size: 11px; margin-left: 20px;"
+    _ERR_QSS = "color: #d32f2f; font-size: 11px; margin-left: 20px;"
+    _OK_QSS = "color: #388e3c; font-size: 11px; margin-left: 20px;"
+    # Default QTableWidgetItem flags without ItemIsEditable
+    _READONLY_FLAGS = (Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled |
+                       Qt.ItemIsDropEnabled | Qt.ItemIsUserCheckable)
+
+    @classmethod
+    def _mono_font(cls):
+        """Return the shared monospace font, creating it on first use"""
+        if cls._MONO_FONT is None:
+            # The platform's fixed-pitch font avoids a substitution scan where Courier New is missing
+            cls._MONO_FONT = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+            cls._MONO_FONT.setPointSize(10)
+        return cls._MONO_FONT
+
     def __init__(self, parent=None, template_data=None):
         super().__init__(parent)
         self.template_data = template_data
@@ -159,6 +648,32 @@ class EditTemplateDialog(QDialog):
         self.page_count = template_data.get('page_count', 1) if template_data else 1
         self.current_page = 0
 
+        # (digest of editor text, parsed template) from the last successful parse
+        self._parsed_cache = None
+
+        # section -> (source text, {total_pages: (pages, error)}) for region-wise inputs
+        self._last_parsed = {}
+        # id(validation label) -> 'ok' / 'err' style currently applied
+        self._label_state = {}
+
+        # Coalesce bursts of mapping edits (spin box scrolling, typing) into one preview refresh
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(80)
+        self._preview_timer.timeout.connect(self._do_update_mapping_preview)
+        self._preview_sig = None
+        self._preview_rendered = None
+        self._preview_widgets = None
+        # Raw configuration debug dialog and its text box, built on first use
+        self._raw_config_dialog = None
+        self._raw_config_text = None
+
+        # Validate region source inputs once typing pauses rather than on every keystroke
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(100)
+        self._validate_timer.timeout.connect(self.on_region_input_changed)
+
         # Initialize validation rules
         self.validation_rules = template_data.get('validation_rules', {}) if template_data else {}
 
@@ -261,6 +776,8 @@ class EditTemplateDialog(QDialog):
         tab_widget.addTab(self.create_validation_tab(), "YAML Template")
 
         main_layout.addWidget(tab_widget)
+        self._tab_widget = tab_widget
+        self._collect_navigation_widgets()
 
         # Add buttons
         buttons_layout = QHBoxLayout()
@@ -606,157 +1123,150 @@ class EditTemplateDialog(QDialog):
         # Multi-page options removed - using simplified page-wise approach
         # Page mapping features will be implemented later as a separate enhancement
 
-        # Add additional parameters section if they exist
-        if hasattr(self, 'template_data'):
-            additional_params = []
-
-            # Get the appropriate config based on template type and current page
-            if self.template_data.get('template_type') == 'multi' and 'page_configs' in self.template_data:
-                # For multi-page templates, show page-specific config if available
-                page_configs = self.template_data['page_configs']
-                if self.current_page < len(page_configs) and page_configs[self.current_page]:
-                    config = page_configs[self.current_page]
-                    print(f"[DEBUG] Using page-specific config for page {self.current_page + 1}: {list(config.keys())}")
-
-                    # Also include global config parameters
-                    if 'config' in self.template_data:
-                        global_config = self.template_data['config']
-                        print(f"[DEBUG] Also including global config parameters: {list(global_config.keys())}")
-
-                        # Add a special parameter to indicate this is page-specific config
-                        additional_params.append(("_page_specific_config", f"Page {self.current_page + 1} Configuration"))
-
-                        # Add global parameters that aren't in page-specific config
-                        for key, value in global_config.items():
-                            if key not in config:
-                                additional_params.append((f"global_{key}", value))
-                else:
-                    # If no page-specific config, use global config
-                    config = self.template_data.get('config', {})
-                    print(f"[DEBUG] No page-specific config for page {self.current_page + 1}, using global config")
-            else:
-                # For single-page templates, use the regular config
-                config = self.template_data.get('config', {})
-                print(f"[DEBUG] Using single-page template config: {list(config.keys())}")
-
-            # Check for any custom parameters (exclude known parameters)
-            known_params = ['multi_table_mode', 'extraction_params', 'regex_patterns', 'use_middle_page',
-                           'fixed_page_count', 'total_pages', 'page_indices', 'store_original_coords',
-                           'original_regions', 'original_column_lines', 'scale_factors']
-
-            # Add parameters from the selected config
-            for key, value in config.items():
-                if key not in known_params:
-                    # Add to additional parameters list
-                    additional_params.append((key, value))
-
-            # If we have additional parameters, add them to the UI
-            if additional_params:
-                additional_group = QGroupBox("Additional Parameters")
-                additional_layout = QVBoxLayout(additional_group)
-
-                # Create a table for additional parameters
-                params_table = QTableWidget()
-                params_table.setColumnCount(2)
-                params_table.setHorizontalHeaderLabels(["Parameter", "Value"])
-                params_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-                params_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-                params_table.setRowCount(len(additional_params))
-
-                # Add extraction parameters display
-                self.extraction_params_text = QTextEdit()
-                self.extraction_params_text.setReadOnly(True)
-                self.extraction_params_text.setStyleSheet("color: black; background-color: white;")
-                self.extraction_params_text.setMinimumHeight(200)
-
-                # Improve table styling
-                params_table.setAlternatingRowColors(True)
-                params_table.setShowGrid(True)
-                params_table.verticalHeader().setVisible(False)
-                params_table.setStyleSheet("""
-                    QTableWidget {
-                        border: 1px solid #ddd;
-                        gridline-color: #ddd;
-                        background-color: white;
-                        alternate-background-color: #f9f9f9;
-                    }
-                    QTableWidget::item {
-                        padding: 5px;
-                        color: black;
-                    }
-                    QHeaderView::section {
-                        background-color: #f0f0f0;
-                        padding: 5px;
-                        border: none;
-                        border-bottom: 1px solid #ddd;
-                        font-weight: bold;
-                        color: #333;
-                    }
-                """)
-
-                for i, (key, value) in enumerate(additional_params):
-                    # Parameter name
-                    key_item = QTableWidgetItem(key)
-                    params_table.setItem(i, 0, key_item)
-
-                    # Parameter value
-                    if isinstance(value, bool):
-                        value_item = QTableWidgetItem("Yes" if value else "No")
-                    elif isinstance(value, (dict, list)):
-                        # Convert complex values to a readable string format
-                        import json
-                        try:
-                            # Format the JSON with indentation for better readability
-                            formatted_value = json.dumps(value, indent=2)
-                            value_item = QTableWidgetItem(formatted_value)
-                        except:
-                            # Fallback if JSON conversion fails
-                            value_item = QTableWidgetItem(str(value))
-                    else:
-                        value_item = QTableWidgetItem(str(value))
-                    # Set text alignment and word wrap for better readability
-                    value_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    params_table.setItem(i, 1, value_item)
-
-                    # Adjust row height for complex values
-                    if isinstance(value, (dict, list)):
-                        # Set a taller row height for complex values
-                        params_table.setRowHeight(i, 80)
-                    else:
-                        # Standard row height for simple values
-                        params_table.setRowHeight(i, 30)
-
-                # Set word wrap mode for the value column
-                params_table.setWordWrap(True)
-
-                additional_layout.addWidget(params_table)
-                main_layout.addWidget(additional_group)
+        # Additional parameters and the extraction parameter summary depend on the
+        # current page; the widgets are built once and filled by populate_config_tab
+        self._additional_group = QGroupBox("Additional Parameters")
+        additional_layout = QVBoxLayout(self._additional_group)
+
+        # Create a table for additional parameters
+        params_table = QTableWidget()
+        params_table.setColumnCount(2)
+        params_table.setHorizontalHeaderLabels(["Parameter", "Value"])
+        params_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        params_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+
+        # Improve table styling
+        params_table.setAlternatingRowColors(True)
+        params_table.setShowGrid(True)
+        params_table.verticalHeader().setVisible(False)
+        # Fixed row height and elided text keep layout cost independent of value size
+        params_table.verticalHeader().setDefaultSectionSize(26)
+        params_table.setWordWrap(False)
+        params_table.setTextElideMode(Qt.ElideRight)
+        params_table.horizontalHeader().setTextElideMode(Qt.ElideRight)
+        params_table.setStyleSheet("""
+            QTableWidget {
+                border: 1px solid #ddd;
+                gridline-color: #ddd;
+                background-color: white;
+                alternate-background-color: #f9f9f9;
+            }
+            QTableWidget::item {
+                padding: 5px;
+                color: black;
+            }
+            QHeaderView::section {
+                background-color: #f0f0f0;
+                padding: 5px;
+                border: none;
+                border-bottom: 1px solid #ddd;
+                font-weight: bold;
+                color: #333;
+            }
+        """)
+        self._params_table = params_table
 
-            # Add extraction parameters display
-            self.extraction_params_text = QTextEdit()
-            self.extraction_params_text.setReadOnly(True)
-            self.extraction_params_text.setStyleSheet("color: black; background-color: white;")
-            self.extraction_params_text.setMinimumHeight(200)
+        additional_layout.addWidget(params_table)
+        main_layout.addWidget(self._additional_group)
 
-            # Add extraction parameters group
-            extraction_params_group = QGroupBox("Extraction Parameters")
-            extraction_params_layout = QVBoxLayout(extraction_params_group)
-            extraction_params_layout.addWidget(self.extraction_params_text)
-            main_layout.addWidget(extraction_params_group)
+        # Add extraction parameters display
+        self.extraction_params_text = QTextEdit()
+        self.extraction_params_text.setReadOnly(True)
+        self.extraction_params_text.setStyleSheet(self._TEXT_BOX_QSS)
+        self.extraction_params_text.setMinimumHeight(200)
 
-            # Display extraction parameters
-            self.display_extraction_parameters()
+        # Add extraction parameters group
+        extraction_params_group = QGroupBox("Extraction Parameters")
+        extraction_params_layout = QVBoxLayout(extraction_params_group)
+        extraction_params_layout.addWidget(self.extraction_params_text)
+        main_layout.addWidget(extraction_params_group)
 
         # Add a debug section to show the actual config structure
         debug_btn = QPushButton("Show Raw Config")
         debug_btn.setToolTip("Show the raw configuration structure for debugging")
-        debug_btn.clicked.connect(lambda: self.show_raw_config(config))
+        debug_btn.clicked.connect(lambda: self.show_raw_config(self._raw_config))
         main_layout.addWidget(debug_btn)
 
         main_layout.addStretch()
 
+        self.populate_config_tab()
+
         return tab
 
+    def populate_config_tab(self):
+        """Fill the page-dependent parts of the configuration tab for the current page"""
+        additional_params = []
+
+        # Get the appropriate config based on template type and current page
+        if self.template_data.get('template_type') == 'multi' and 'page_configs' in self.template_data:
+            # For multi-page templates, show page-specific config if available
+            page_configs = self.template_data['page_configs']
+            if self.current_page < len(page_configs) and page_configs[self.current_page]:
+                config = page_configs[self.current_page]
+                print(f"[DEBUG] Using page-specific config for page {self.current_page + 1}: {list(config.keys())}")
+
+                # Also include global config parameters
+                if 'config' in self.template_data:
+                    global_config = self.template_data['config']
+                    print(f"[DEBUG] Also including global config parameters: {list(global_config.keys())}")
+
+                    # Add a special parameter to indicate this is page-specific config
+                    additional_params.append(("_page_specific_config", f"Page {self.current_page + 1} Configuration"))
+
+                    # Add global parameters that aren't in page-specific config
+                    for key, value in global_config.items():
+                        if key not in config:
+                            additional_params.append((f"global_{key}", value))
+            else:
+                # If no page-specific config, use global config
+                config = self.template_data.get('config', {})
+                print(f"[DEBUG] No page-specific config for page {self.current_page + 1}, using global config")
+        else:
+            # For single-page templates, use the regular config
+            config = self.template_data.get('config', {})
+            print(f"[DEBUG] Using single-page template config: {list(config.keys())}")
+
+        # Add parameters from the selected config, excluding the known ones
+        for key, value in config.items():
+            if key not in _KNOWN_CONFIG_PARAMS:
+                # Add to additional parameters list
+                additional_params.append((key, value))
+
+        self._raw_config = config
+
+        params_table = self._params_table
+        params_table.setRowCount(len(additional_params))
+        for i, (key, value) in enumerate(additional_params):
+            # Parameter name
+            key_item = QTableWidgetItem(key)
+            params_table.setItem(i, 0, key_item)
+
+            # Parameter value
+            if isinstance(value, bool):
+                value_item = QTableWidgetItem("Yes" if value else "No")
+            elif isinstance(value, (dict, list)):
+                # Show a compact, elided summary; the full JSON lives in the tooltip
+                try:
+                    full_value = json.dumps(value, indent=2)
+                    compact_value = json.dumps(value, separators=(",", ":"))
+                except:
+                    # Fallback if JSON conversion fails
+                    full_value = compact_value = str(value)
+                if len(compact_value) > 120:
+                    compact_value = compact_value[:120] + "..."
+                value_item = QTableWidgetItem(compact_value)
+                value_item.setToolTip(full_value)
+                value_item.setData(Qt.UserRole, full_value)
+            else:
+                value_item = QTableWidgetItem(str(value))
+            value_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+            params_table.setItem(i, 1, value_item)
+
+        self._additional_group.setVisible(bool(additional_params))
+
+        # Display extraction parameters
+        self.display_extraction_parameters()
+
     def create_validation_tab(self):
         """Create the YAML template tab for invoice2data templates"""
         tab = QWidget()
@@ -781,7 +1291,7 @@ class EditTemplateDialog(QDialog):
 
         # Create YAML template editor
         self.json_template_editor = QTextEdit()  # Keep the same variable name for compatibility
-        self.json_template_editor.setFont(QFont("Courier New", 10))  # Use monospace font for better YAML editing
+        self.json_template_editor.setFont(self._mono_font())  # Use monospace font for better YAML editing
         self.json_template_editor.setLineWrapMode(QTextEdit.NoWrap)  # Disable line wrapping for better YAML editing
         layout.addWidget(self.json_template_editor)
 
@@ -801,16 +1311,15 @@ class EditTemplateDialog(QDialog):
                     print(f"[DEBUG] JSON template keys: {list(json_template.keys())}")
                     # Format as YAML (preferred)
                     try:
-                        import yaml
                         formatted_yaml = yaml.dump(json_template, default_flow_style=False, allow_unicode=True)
                         print(f"[DEBUG] Setting YAML template text (first 200 chars): {formatted_yaml[:200]}...")
-                        self.json_template_editor.setText(formatted_yaml)
+                        self.json_template_editor.setPlainText(formatted_yaml)
                     except Exception as e:
                         # Fallback to JSON if YAML formatting fails
                         print(f"[DEBUG] Failed to format as YAML, using JSON: {str(e)}")
                         formatted_json = json.dumps(json_template, indent=2)
                         print(f"[DEBUG] Setting JSON template text (first 200 chars): {formatted_json[:200]}...")
-                        self.json_template_editor.setText(formatted_json)
+                        self.json_template_editor.setPlainText(formatted_json)
                 else:
                     print(f"[DEBUG] JSON template is not a dictionary: {json_template}")
                     # Set default invoice_extractor template structure
@@ -832,13 +1341,12 @@ class EditTemplateDialog(QDialog):
 
                     # Format as YAML
                     try:
-                        import yaml
                         yaml_text = yaml.dump(default_template, default_flow_style=False, allow_unicode=True)
-                        self.json_template_editor.setText(yaml_text)
+                        self.json_template_editor.setPlainText(yaml_text)
                     except Exception as e:
                         # Fallback to JSON if YAML formatting fails
                         print(f"[DEBUG] Failed to format as YAML, using JSON: {str(e)}")
-                        self.json_template_editor.setText(json.dumps(default_template, indent=2))
+                        self.json_template_editor.setPlainText(json.dumps(default_template, indent=2))
             else:
                 print(f"[DEBUG] JSON template is None or empty, using default template")
                 # Set default invoice_extractor template structure
@@ -860,13 +1368,12 @@ class EditTemplateDialog(QDialog):
 
                 # Format as YAML
                 try:
-                    import yaml
                     yaml_text = yaml.dump(default_template, default_flow_style=False, allow_unicode=True)
-                    self.json_template_editor.setText(yaml_text)
+                    self.json_template_editor.setPlainText(yaml_text)
                 except Exception as e:
                     # Fallback to JSON if YAML formatting fails
                     print(f"[DEBUG] Failed to format as YAML, using JSON: {str(e)}")
-                    self.json_template_editor.setText(json.dumps(default_template, indent=2))
+                    self.json_template_editor.setPlainText(json.dumps(default_template, indent=2))
         else:
             print(f"[DEBUG] No JSON template found in template_data, using default template")
             # Use factory to create default template
@@ -874,13 +1381,12 @@ class EditTemplateDialog(QDialog):
 
             # Format as YAML
             try:
-                import yaml
                 yaml_text = yaml.dump(default_template, default_flow_style=False, allow_unicode=True)
-                self.json_template_editor.setText(yaml_text)
+                self.json_template_editor.setPlainText(yaml_text)
             except Exception as e:
                 # Fallback to JSON if YAML formatting fails
                 print(f"[DEBUG] Failed to format as YAML, using JSON: {str(e)}")
-                self.json_template_editor.setText(json.dumps(default_template, indent=2))
+                self.json_template_editor.setPlainText(json.dumps(default_template, indent=2))
 
 
 
@@ -995,13 +1501,13 @@ class EditTemplateDialog(QDialog):
         self.preview_text = QTextEdit()
         self.preview_text.setReadOnly(True)
         self.preview_text.setMaximumHeight(200)
-        self.preview_text.setStyleSheet("color: black; background-color: #f9f9f9; border: 1px solid #ddd;")
+        self.preview_text.setStyleSheet(self._PREVIEW_QSS)
         preview_layout.addWidget(self.preview_text)
 
         main_layout.addWidget(preview_group)
 
         # Update preview
-        self.update_mapping_preview()
+        self._do_update_mapping_preview()
 
         main_layout.addStretch()
         return tab
@@ -1090,16 +1596,14 @@ class EditTemplateDialog(QDialog):
 
         # Region mapping configuration
         config_group = QGroupBox("Region Mapping Configuration")
-        config_layout = QFormLayout(config_group)
+        config_layout = QGridLayout(config_group)
 
         region_wise_config = self.mapping_config.get('region_wise', {})
 
         # Header region mapping
-        self.header_source_input = QLineEdit()
-        self.header_source_input.setPlaceholderText("1")
-        header_source = region_wise_config.get('header', {}).get('source_page', '1')
-        self.header_source_input.setText(str(header_source))
-        self.header_source_input.setToolTip(
+        self.header_source_input, self.header_validation_label = self._add_region_row(
+            config_layout, "Header", "1",
+            region_wise_config.get('header', {}).get('source_page', '1'),
             "Specify pages for header regions:\n"
             "• Single page: 1\n"
             "• Multiple pages: 1,3,5\n"
@@ -1109,20 +1613,11 @@ class EditTemplateDialog(QDialog):
             "• Relative: n-1, n-2\n"
             "• Mixed: 1,3-5,n-1,n"
         )
-        self.header_source_input.textChanged.connect(self.on_region_input_changed)
-        config_layout.addRow("Header Regions Source:", self.header_source_input)
-
-        # Header validation label
-        self.header_validation_label = QLabel()
-        self.header_validation_label.setStyleSheet("color: #666; font-size: 11px; margin-left: 20px;")
-        config_layout.addRow("", self.header_validation_label)
 
         # Items region mapping
-        self.items_source_input = QLineEdit()
-        self.items_source_input.setPlaceholderText("1,3-5,n")
-        items_source = region_wise_config.get('items', {}).get('source_page', '1-n')
-        self.items_source_input.setText(str(items_source))
-        self.items_source_input.setToolTip(
+        self.items_source_input, self.items_validation_label = self._add_region_row(
+            config_layout, "Items", "1,3-5,n",
+            region_wise_config.get('items', {}).get('source_page', '1-n'),
             "Specify pages for items regions:\n"
             "• All pages: 1-n\n"
             "• Multiple pages: 1,3,5\n"
@@ -1132,20 +1627,11 @@ class EditTemplateDialog(QDialog):
             "• Relative: n-1, n-2\n"
             "• Mixed: 1,3-5,n-1,n"
         )
-        self.items_source_input.textChanged.connect(self.on_region_input_changed)
-        config_layout.addRow("Items Regions Source:", self.items_source_input)
-
-        # Items validation label
-        self.items_validation_label = QLabel()
-        self.items_validation_label.setStyleSheet("color: #666; font-size: 11px; margin-left: 20px;")
-        config_layout.addRow("", self.items_validation_label)
 
         # Summary region mapping
-        self.summary_source_input = QLineEdit()
-        self.summary_source_input.setPlaceholderText("n")
-        summary_source = region_wise_config.get('summary', {}).get('source_page', 'n')
-        self.summary_source_input.setText(str(summary_source))
-        self.summary_source_input.setToolTip(
+        self.summary_source_input, self.summary_validation_label = self._add_region_row(
+            config_layout, "Summary", "n",
+            region_wise_config.get('summary', {}).get('source_page', 'n'),
             "Specify pages for summary regions:\n"
             "• Last page: n or last\n"
             "• Multiple pages: 1,3,5\n"
@@ -1154,13 +1640,6 @@ class EditTemplateDialog(QDialog):
             "• Relative: n-1, n-2\n"
             "• Mixed: 1,3-5,n-1,n"
         )
-        self.summary_source_input.textChanged.connect(self.on_region_input_changed)
-        config_layout.addRow("Summary Regions Source:", self.summary_source_input)
-
-        # Summary validation label
-        self.summary_validation_label = QLabel()
-        self.summary_validation_label.setStyleSheet("color: #666; font-size: 11px; margin-left: 20px;")
-        config_layout.addRow("", self.summary_validation_label)
 
         layout.addWidget(config_group)
 
@@ -1191,6 +1670,24 @@ class EditTemplateDialog(QDialog):
         layout.addStretch()
         return widget
 
+    def _add_region_row(self, layout, name, placeholder, default, tooltip):
+        """Add a source-page input and its validation label to the region mapping grid"""
+        row = layout.rowCount() if layout.count() else 0
+
+        source_input = QLineEdit()
+        source_input.setPlaceholderText(placeholder)
+        source_input.setText(str(default))
+        source_input.setToolTip(tooltip)
+        source_input.textChanged.connect(self._schedule_validation)
+
+        validation_label = QLabel()
+        validation_label.setStyleSheet(self._MUTED_STYLE)
+
+        layout.addWidget(QLabel(f"{name} Regions Source:"), row, 0)
+        layout.addWidget(source_input, row, 1)
+        layout.addWidget(validation_label, row + 1, 1)
+        return source_input, validation_label
+
     def validate_json_template(self):
         """Validate the invoice2data YAML template"""
         try:
@@ -1201,9 +1698,8 @@ class EditTemplateDialog(QDialog):
                 return
 
             # Try to parse as YAML first
-            import yaml
             try:
-                template = yaml.safe_load(template_text)
+                template = yaml.load(template_text, Loader=_YamlLoader)
                 is_yaml = True
                 print(f"[DEBUG] Successfully parsed template as YAML")
             except yaml.YAMLError as yaml_err:
@@ -1244,19 +1740,50 @@ class EditTemplateDialog(QDialog):
             try:
                 # Format as YAML (preferred)
                 formatted_template = yaml.dump(template, default_flow_style=False, allow_unicode=True)
-                self.json_template_editor.setText(formatted_template)
+                self.json_template_editor.setPlainText(formatted_template)
                 format_type = "YAML"
             except Exception as yaml_format_err:
                 # Fallback to JSON if YAML formatting fails
                 formatted_template = json.dumps(template, indent=2, ensure_ascii=False)
-                self.json_template_editor.setText(formatted_template)
+                self.json_template_editor.setPlainText(formatted_template)
                 format_type = "JSON"
                 print(f"[DEBUG] YAML formatting failed, using JSON format: {str(yaml_format_err)}")
 
+            # Remember the parsed result for the formatted text so saving can skip re-parsing
+            self._parsed_cache = (self._template_digest(formatted_template), template)
+
             QMessageBox.information(self, "Valid Template", f"The invoice2data template is valid and has been formatted as {format_type}.")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred while validating the template: {str(e)}")
 
+    @staticmethod
+    def _template_digest(template_text):
+        """Return a digest identifying the given editor text"""
+        return hashlib.blake2b(template_text.encode('utf-8')).digest()
+
+    def get_parsed_template(self, template_text=None):
+        """
+        Return the parsed JSON/YAML template for the editor text.
+
+        JSON is tried first: it is far cheaper to parse and valid JSON is also valid
+        YAML. Reuses the result of the last successful parse when the text is
+        unchanged; otherwise parses again and raises yaml.YAMLError (chained from
+        the JSON error) on invalid input. Callers get their own copy of the template.
+        """
+        if template_text is None:
+            template_text = self.json_template_editor.toPlainText()
+        digest = self._template_digest(template_text)
+        if self._parsed_cache is None or self._parsed_cache[0] != digest:
+            try:
+                template = json.loads(template_text)
+            except json.JSONDecodeError as json_err:
+                try:
+                    template = yaml.load(template_text, Loader=_YamlLoader)
+                except yaml.YAMLError as yaml_err:
+                    raise yaml_err from json_err
+            self._parsed_cache = (digest, template)
+        return copy.deepcopy(self._parsed_cache[1])
+
     def reset_json_template(self):
         """Reset the template to the default structure in YAML format"""
         reply = QMessageBox.question(
@@ -1273,13 +1800,12 @@ class EditTemplateDialog(QDialog):
 
             # Format as YAML
             try:
-                import yaml
                 yaml_text = yaml.dump(default_template, default_flow_style=False, allow_unicode=True)
-                self.json_template_editor.setText(yaml_text)
+                self.json_template_editor.setPlainText(yaml_text)
             except Exception as e:
                 # Fallback to JSON if YAML formatting fails
                 print(f"[DEBUG] Failed to format as YAML, using JSON: {str(e)}")
-                self.json_template_editor.setText(json.dumps(default_template, indent=2))
+                self.json_template_editor.setPlainText(json.dumps(default_template, indent=2))
 
     # Removed add_validation_rule and remove_validation_rule functions as they are no longer needed
 
@@ -1336,48 +1862,81 @@ class EditTemplateDialog(QDialog):
 
         self.update_mapping_preview()
 
+    def _schedule_validation(self):
+        """Restart the region input validation timer"""
+        self._validate_timer.start()
+
     def on_region_input_changed(self):
         """Handle region input field changes with validation"""
         try:
+            # Inputs the region-wise preview depends on; unchanged inputs need no refresh
+            preview_sig = tuple(
+                getattr(self, name).text().strip() if hasattr(self, name) else None
+                for name in ('header_source_input', 'items_source_input', 'summary_source_input')
+            ) + (self.mapping_config.get('approach'),)
+
             # Validate header input
             if hasattr(self, 'header_source_input') and hasattr(self, 'header_validation_label'):
                 header_text = self.header_source_input.text().strip()
-                header_pages, header_error = self.parse_page_expression(header_text, 5)  # Test with 5 pages
+                header_pages, header_error = self._parsed_pages('header', header_text, 5)  # Test with 5 pages
                 if header_error:
                     self.header_validation_label.setText(f"❌ {header_error}")
-                    self.header_validation_label.setStyleSheet("color: #d32f2f; font-size: 11px; margin-left: 20px;")
+                    self._set_label_state(self.header_validation_label, 'err')
                 else:
-                    self.header_validation_label.setText(f"✓ Pages: {sorted(header_pages)}")
-                    self.header_validation_label.setStyleSheet("color: #388e3c; font-size: 11px; margin-left: 20px;")
+                    self.header_validation_label.setText(f"✓ Pages: {header_pages}")
+                    self._set_label_state(self.header_validation_label, 'ok')
 
             # Validate items input
             if hasattr(self, 'items_source_input') and hasattr(self, 'items_validation_label'):
                 items_text = self.items_source_input.text().strip()
-                items_pages, items_error = self.parse_page_expression(items_text, 5)  # Test with 5 pages
+                items_pages, items_error = self._parsed_pages('items', items_text, 5)  # Test with 5 pages
                 if items_error:
                     self.items_validation_label.setText(f"❌ {items_error}")
-                    self.items_validation_label.setStyleSheet("color: #d32f2f; font-size: 11px; margin-left: 20px;")
+                    self._set_label_state(self.items_validation_label, 'err')
                 else:
-                    self.items_validation_label.setText(f"✓ Pages: {sorted(items_pages)}")
-                    self.items_validation_label.setStyleSheet("color: #388e3c; font-size: 11px; margin-left: 20px;")
+                    self.items_validation_label.setText(f"✓ Pages: {items_pages}")
+                    self._set_label_state(self.items_validation_label, 'ok')
 
             # Validate summary input
             if hasattr(self, 'summary_source_input') and hasattr(self, 'summary_validation_label'):
                 summary_text = self.summary_source_input.text().strip()
-                summary_pages, summary_error = self.parse_page_expression(summary_text, 5)  # Test with 5 pages
+                summary_pages, summary_error = self._parsed_pages('summary', summary_text, 5)  # Test with 5 pages
                 if summary_error:
                     self.summary_validation_label.setText(f"❌ {summary_error}")
-                    self.summary_validation_label.setStyleSheet("color: #d32f2f; font-size: 11px; margin-left: 20px;")
+                    self._set_label_state(self.summary_validation_label, 'err')
                 else:
-                    self.summary_validation_label.setText(f"✓ Pages: {sorted(summary_pages)}")
-                    self.summary_validation_label.setStyleSheet("color: #388e3c; font-size: 11px; margin-left: 20px;")
+                    self.summary_validation_label.setText(f"✓ Pages: {summary_pages}")
+                    self._set_label_state(self.summary_validation_label, 'ok')
 
             # Update preview
-            self.update_mapping_preview()
+            if preview_sig != self._preview_sig:
+                self._preview_sig = preview_sig
+                self.update_mapping_preview()
 
         except Exception as e:
             print(f"Error in region input validation: {e}")
 
+    def _set_label_state(self, label, state):
+        """Style a validation label as 'ok' or 'err', skipping the style sheet when unchanged"""
+        if self._label_state.get(id(label)) != state:
+            label.setStyleSheet(self._OK_QSS if state == 'ok' else self._ERR_QSS)
+            self._label_state[id(label)] = state
+
+    def _parsed_pages(self, section, text, total_pages):
+        """
+        Return parse_page_expression(text, total_pages) for a region section input.
+
+        Results are kept per section until that section's text changes, so validation
+        and the preview rows share one parse per page count.
+        """
+        cached_text, results = self._last_parsed.get(section, (None, None))
+        if cached_text != text:
+            results = {}
+            self._last_parsed[section] = (text, results)
+        if total_pages not in results:
+            results[total_pages] = self.parse_page_expression(text, total_pages)
+        return results[total_pages]
+
     def parse_page_expression(self, expression, total_pages):
         """
         Parse a page expression and return the list of pages and any error message.
@@ -1389,61 +1948,16 @@ class EditTemplateDialog(QDialog):
         Returns:
             tuple: (list of page numbers, error message or None)
         """
-        if not expression.strip():
-            return [], "Empty expression"
-
         try:
-            pages = set()
-            parts = [part.strip() for part in expression.split(',')]
-
-            for part in parts:
-                if not part:
-                    continue
-
-                # Handle ranges (e.g., "2-4", "1-n", "n-2-n")
-                if '-' in part and not part.startswith('n-') and not part == 'n':
-                    # Split on dash, but be careful with negative relative references
-                    if part.count('-') == 1:
-                        start_str, end_str = part.split('-', 1)
-                    else:
-                        # Handle cases like "n-2" which should not be split
-                        if part.startswith('n-') and part.count('-') == 1:
-                            # This is a relative reference like "n-2", not a range
-                            page_num = self.resolve_page_reference(part, total_pages)
-                            if page_num is None:
-                                return [], f"Invalid page reference: {part}"
-                            if 1 <= page_num <= total_pages:
-                                pages.add(page_num)
-                            continue
-                        else:
-                            return [], f"Invalid range format: {part}"
-
-                    start_page = self.resolve_page_reference(start_str, total_pages)
-                    end_page = self.resolve_page_reference(end_str, total_pages)
-
-                    if start_page is None:
-                        return [], f"Invalid start page: {start_str}"
-                    if end_page is None:
-                        return [], f"Invalid end page: {end_str}"
-
-                    if start_page > end_page:
-                        return [], f"Invalid range: {start_page} > {end_page}"
-
-                    for page in range(start_page, end_page + 1):
-                        if 1 <= page <= total_pages:
-                            pages.add(page)
-                else:
-                    # Handle single page references
-                    page_num = self.resolve_page_reference(part, total_pages)
-                    if page_num is None:
-                        return [], f"Invalid page reference: {part}"
-                    if 1 <= page_num <= total_pages:
-                        pages.add(page_num)
-
-            return list(pages), None
-
+            pages, error = _parse_page_expression_cached(expression, total_pages)
         except Exception as e:
             return [], f"Parse error: {str(e)}"
+        return list(pages), error
+
+    def reset_page_caches(self):
+        """Clear memoized page expression results"""
+        _parse_page_expression_cached.cache_clear()
+        _compile_page_expression.cache_clear()
 
     def resolve_page_reference(self, ref, total_pages):
         """
@@ -1456,106 +1970,82 @@ class EditTemplateDialog(QDialog):
         Returns:
             int or None: Resolved page number, or None if invalid
         """
-        ref = ref.strip().lower()
-
-        if not ref:
-            return None
-
-        # Handle numeric references
-        if ref.isdigit():
-            return int(ref)
-
-        # Handle "last" keyword
-        if ref == 'last':
-            return total_pages
-
-        # Handle "n" (last page)
-        if ref == 'n':
-            return total_pages
-
-        # Handle relative references like "n-1", "n-2"
-        if ref.startswith('n-'):
-            try:
-                offset_str = ref[2:]  # Remove "n-"
-                if offset_str.isdigit():
-                    offset = int(offset_str)
-                    result = total_pages - offset
-                    return result if result >= 1 else None
-                else:
-                    return None
-            except:
-                return None
-
-        return None
+        return _resolve_page_ref(ref.strip().lower(), total_pages)
 
     def update_mapping_preview(self):
+        """Schedule a refresh of the mapping preview text"""
+        self._preview_timer.start()
+
+    def _do_update_mapping_preview(self):
         """Update the mapping preview text"""
         try:
-            preview_text = "Mapping Preview:\n\n"
+            parts = ["Mapping Preview:\n\n"]
 
             current_approach = self.mapping_config.get('approach', 'page_wise')
+            if current_approach == 'page_wise':
+                generate_preview = self.generate_page_wise_preview
+            else:
+                generate_preview = self.generate_region_wise_preview
 
             # Test with different document page counts
             test_page_counts = [1, 3, 5]
 
             for doc_pages in test_page_counts:
-                preview_text += f"📄 {doc_pages}-page document:\n"
-
-                if current_approach == 'page_wise':
-                    preview_text += self.generate_page_wise_preview(doc_pages)
-                else:
-                    preview_text += self.generate_region_wise_preview(doc_pages)
+                parts.append(f"📄 {doc_pages}-page document:\n")
+                parts.append(generate_preview(doc_pages))
+                parts.append("\n")
 
-                preview_text += "\n"
+            preview_text = "".join(parts)
 
-            self.preview_text.setText(preview_text)
+            # Skip the QTextEdit relayout when the rendered text is unchanged
+            if preview_text != self._preview_rendered:
+                self._preview_rendered = preview_text
+                self.preview_text.setPlainText(preview_text)
         except Exception as e:
             print(f"Error updating mapping preview: {e}")
-            self.preview_text.setText("Error generating preview")
+            self._preview_rendered = None
+            self.preview_text.setPlainText("Error generating preview")
+
+    def _page_wise_preview_widgets(self):
+        """Return (first_page_spin, middle_pages_combo, last_page_combo, last_page_spin), cached once all exist"""
+        widgets = self._preview_widgets
+        if widgets is None:
+            widgets = tuple(getattr(self, name, None) for name in
+                            ('first_page_spin', 'middle_pages_combo', 'last_page_combo', 'last_page_spin'))
+            if all(widget is not None for widget in widgets):
+                self._preview_widgets = widgets
+        return widgets
 
     def generate_page_wise_preview(self, doc_pages):
         """Generate preview text for page-wise mapping"""
-        preview = ""
+        first_page, middle_pages, last_page, last_page_spin = self._page_wise_preview_widgets()
 
         # Get current settings
-        first_page = getattr(self, 'first_page_spin', None)
         first_page_val = first_page.value() if first_page else 1
-
-        middle_pages = getattr(self, 'middle_pages_combo', None)
         middle_pages_val = middle_pages.currentText() if middle_pages else "Sequential"
-
-        last_page = getattr(self, 'last_page_combo', None)
         last_page_val = last_page.currentText() if last_page else "Last Template Page"
 
-        last_page_spin = getattr(self, 'last_page_spin', None)
-        last_page_spin_val = last_page_spin.value() if last_page_spin else self.page_count
-
-        for pdf_page in range(1, doc_pages + 1):
-            if pdf_page == 1:
-                template_page = first_page_val
-            elif pdf_page == doc_pages and doc_pages > 1:
-                if last_page_val == "Last Template Page":
-                    template_page = self.page_count
-                elif last_page_val == "Specific Page":
-                    template_page = last_page_spin_val
-                else:  # Same as First
-                    template_page = first_page_val
-            else:  # Middle pages
-                if middle_pages_val == "Sequential":
-                    template_page = min(pdf_page, self.page_count)
-                elif middle_pages_val == "Repeat Last":
-                    template_page = self.page_count
-                else:  # Repeat First
-                    template_page = first_page_val
-
-            preview += f"  Page {pdf_page} → Template Page {template_page}\n"
-
-        return preview
+        # Template page for the first, middle and last PDF pages
+        template_pages = [first_page_val]
+        if middle_pages_val == "Sequential":
+            template_pages.extend(min(pdf_page, self.page_count) for pdf_page in range(2, doc_pages))
+        elif middle_pages_val == "Repeat Last":
+            template_pages.extend([self.page_count] * max(doc_pages - 2, 0))
+        else:  # Repeat First
+            template_pages.extend([first_page_val] * max(doc_pages - 2, 0))
+        if doc_pages > 1:
+            if last_page_val == "Last Template Page":
+                template_pages.append(self.page_count)
+            elif last_page_val == "Specific Page":
+                template_pages.append(last_page_spin.value() if last_page_spin else self.page_count)
+            else:  # Same as First
+                template_pages.append(first_page_val)
+
+        return "".join(f"  Page {pdf_page} → Template Page {template_page}\n"
+                       for pdf_page, template_page in enumerate(template_pages, 1))
 
     def generate_region_wise_preview(self, doc_pages):
         """Generate preview text for region-wise mapping"""
-        preview = ""
-
         # Get current settings from text inputs
         header_input = getattr(self, 'header_source_input', None)
         header_text = header_input.text().strip() if header_input else "1"
@@ -1566,28 +2056,22 @@ class EditTemplateDialog(QDialog):
         summary_input = getattr(self, 'summary_source_input', None)
         summary_text = summary_input.text().strip() if summary_input else "n"
 
-        # Parse page expressions
-        header_pages, header_error = self.parse_page_expression(header_text, doc_pages)
-        items_pages, items_error = self.parse_page_expression(items_text, doc_pages)
-        summary_pages, summary_error = self.parse_page_expression(summary_text, doc_pages)
+        # Parse page expressions (reusing results computed during validation)
+        header_pages, header_error = self._parsed_pages('header', header_text, doc_pages)
+        items_pages, items_error = self._parsed_pages('items', items_text, doc_pages)
+        summary_pages, summary_error = self._parsed_pages('summary', summary_text, doc_pages)
 
         # Display results
-        if header_error:
-            preview += f"  Header regions: ❌ {header_error}\n"
-        else:
-            preview += f"  Header regions: {header_text} → Pages {sorted(header_pages)}\n"
-
-        if items_error:
-            preview += f"  Items regions: ❌ {items_error}\n"
-        else:
-            preview += f"  Items regions: {items_text} → Pages {sorted(items_pages)}\n"
-
-        if summary_error:
-            preview += f"  Summary regions: ❌ {summary_error}\n"
-        else:
-            preview += f"  Summary regions: {summary_text} → Pages {sorted(summary_pages)}\n"
+        lines = []
+        for label, text, pages, error in (("Header", header_text, header_pages, header_error),
+                                          ("Items", items_text, items_pages, items_error),
+                                          ("Summary", summary_text, summary_pages, summary_error)):
+            if error:
+                lines.append(f"  {label} regions: ❌ {error}\n")
+            else:
+                lines.append(f"  {label} regions: {text} → Pages {pages}\n")
 
-        return preview
+        return "".join(lines)
 
     def prev_page(self):
         """Navigate to previous page"""
@@ -1609,84 +2093,40 @@ class EditTemplateDialog(QDialog):
             # Refresh the config tab to show page-specific config
             self.refresh_config_tab()
 
+    def _collect_navigation_widgets(self):
+        """Cache the page labels and navigation buttons that exist on this dialog"""
+        def existing(*names):
+            return tuple(getattr(self, name) for name in names if hasattr(self, name))
+
+        self._page_labels = existing('page_label', 'page_label_cols', 'page_label_config')
+        self._prev_btns = existing('prev_page_btn', 'prev_page_btn_cols', 'prev_page_btn_config')
+        self._next_btns = existing('next_page_btn', 'next_page_btn_cols', 'next_page_btn_config')
+
     def update_page_navigation(self):
         """Update page navigation UI"""
-        if hasattr(self, 'page_label'):
-            self.page_label.setText(f"Page {self.current_page + 1} of {self.page_count}")
-        if hasattr(self, 'page_label_cols'):
-            self.page_label_cols.setText(f"Page {self.current_page + 1} of {self.page_count}")
-        if hasattr(self, 'page_label_config'):
-            self.page_label_config.setText(f"Page {self.current_page + 1} of {self.page_count}")
+        if not hasattr(self, '_page_labels'):
+            self._collect_navigation_widgets()
+
+        page_text = f"Page {self.current_page + 1} of {self.page_count}"
+        for label in self._page_labels:
+            label.setText(page_text)
 
         # Update button states
-        if hasattr(self, 'prev_page_btn'):
-            self.prev_page_btn.setEnabled(self.current_page > 0)
-        if hasattr(self, 'next_page_btn'):
-            self.next_page_btn.setEnabled(self.current_page < self.page_count - 1)
-        if hasattr(self, 'prev_page_btn_cols'):
-            self.prev_page_btn_cols.setEnabled(self.current_page > 0)
-        if hasattr(self, 'next_page_btn_cols'):
-            self.next_page_btn_cols.setEnabled(self.current_page < self.page_count - 1)
-        if hasattr(self, 'prev_page_btn_config'):
-            self.prev_page_btn_config.setEnabled(self.current_page > 0)
-        if hasattr(self, 'next_page_btn_config'):
-            self.next_page_btn_config.setEnabled(self.current_page < self.page_count - 1)
-
-        # Update config fields if page-specific config is enabled
-        if (hasattr(self, 'page_specific_config') and
-            self.page_specific_config.isChecked() and
-            'page_configs' in self.template_data):
-            pass  # This is handled by refresh_config_tab
+        has_prev = self.current_page > 0
+        has_next = self.current_page < self.page_count - 1
+        for button in self._prev_btns:
+            button.setEnabled(has_prev)
+        for button in self._next_btns:
+            button.setEnabled(has_next)
 
     def refresh_config_tab(self):
         """Refresh the configuration tab to show page-specific config"""
         try:
-            # Find the tab widget
-            tab_widget = None
-            for child in self.children():
-                if isinstance(child, QTabWidget):
-                    tab_widget = child
-                    break
-
-            if tab_widget:
-                # Find the config tab index
-                config_tab_index = -1
-                for i in range(tab_widget.count()):
-                    if tab_widget.tabText(i) == "Configuration":
-                        config_tab_index = i
-                        break
-
-                if config_tab_index >= 0:
-                    # Get the current tab index
-                    current_tab_index = tab_widget.currentIndex()
-
-                    # Remove the old config tab
-                    tab_widget.removeTab(config_tab_index)
-
-                    # Create a new config tab
-                    new_config_tab = self.create_config_tab()
-
-                    # Insert the new config tab at the same position
-                    tab_widget.insertTab(config_tab_index, new_config_tab, "Configuration")
-
-                    # Restore the current tab
-                    tab_widget.setCurrentIndex(current_tab_index)
-
-                    print(f"[DEBUG] Refreshed config tab for page {self.current_page + 1}")
-                else:
-                    print("[DEBUG] Could not find Configuration tab")
-            else:
-                print("[DEBUG] Could not find tab widget")
-        except Exception as e:
-            print(f"[ERROR] Failed to refresh config tab: {str(e)}")
-            import traceback
-            traceback.print_exc()
-
-            page_configs = self.template_data['page_configs']
-            if self.current_page < len(page_configs) and page_configs[self.current_page]:
-                # Load page-specific config
-                if hasattr(self, 'load_page_specific_config'):
-                    self.load_page_specific_config(page_configs[self.current_page])
+            # Only the page-dependent widgets change; keep the tab and any edits in place
+            self.populate_config_tab()
+            logger.debug("Refreshed config tab for page %s", self.current_page + 1)
+        except Exception:
+            logger.exception("Failed to refresh config tab")
 
     def load_regions_for_current_page(self):
         """Load regions for the current page"""
@@ -1694,72 +2134,46 @@ class EditTemplateDialog(QDialog):
 
         # Get regions for current page
         regions = self.get_regions_for_current_page()
-        print(f"\n[DEBUG] Loading regions for page {self.current_page + 1}")
-        print(f"[DEBUG] Regions data type: {type(regions)}")
-        print(f"[DEBUG] Regions keys: {list(regions.keys())}")
-        for section, rects in regions.items():
-            print(f"[DEBUG] Section '{section}' has {len(rects)} rectangles")
-            if rects and len(rects) > 0:
-                print(f"[DEBUG] First rect type: {type(rects[0])}")
-                print(f"[DEBUG] First rect data: {rects[0]}")
-
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loading regions for page %s (%s, keys: %s)",
+                         self.current_page + 1, type(regions), list(regions.keys()))
+            for section, rects in regions.items():
+                logger.debug("Section '%s' has %s rectangles", section, len(rects))
+                if rects:
+                    logger.debug("First rect: %s %r", type(rects[0]), rects[0])
+
+        # Size the table once and fill it with signals and repaints suspended
+        table = self.regions_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setRowCount(sum(len(rects) for rects in regions.values()))
+        try:
+            self._fill_regions_table(regions)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting_enabled)
+
+    def _fill_regions_table(self, regions):
+        """Fill the pre-sized regions table, trimming rows left unused by skipped regions"""
         row = 0
         for section, rects in regions.items():
             for i, rect in enumerate(rects):
-                self.regions_table.insertRow(row)
-                self.regions_table.setItem(row, 0, QTableWidgetItem(section.title()))
-                self.regions_table.setItem(row, 1, QTableWidgetItem(str(i + 1)))
-
                 # Handle different region formats
-                if isinstance(rect, QRect):
-                    # QRect format (x,y,width,height)
-                    x = rect.x()
-                    y = rect.y()
-                    width = rect.width()
-                    height = rect.height()
-                elif hasattr(rect, 'drawing_x') and hasattr(rect, 'drawing_y'):
-                    # DualCoordinateRegion format - use drawing coordinates for UI display
-                    from dual_coordinate_storage import DualCoordinateRegion
-                    if isinstance(rect, DualCoordinateRegion):
-                        x = rect.drawing_x
-                        y = rect.drawing_y
-                        width = rect.drawing_width
-                        height = rect.drawing_height
-                        print(f"[DEBUG] Displaying DualCoordinateRegion {rect.label}: UI({x},{y},{width},{height})")
-                    else:
-                        print(f"Warning: Unknown DualCoordinateRegion-like object in {section}: {type(rect)}")
-                        continue
-                elif hasattr(rect, 'rect') and hasattr(rect, 'label'):
-                    # StandardRegion format - use UI coordinates for display
-                    from standardized_coordinates import StandardRegion
-                    if isinstance(rect, StandardRegion):
-                        x = rect.rect.x()
-                        y = rect.rect.y()
-                        width = rect.rect.width()
-                        height = rect.rect.height()
-                        print(f"[DEBUG] Displaying StandardRegion {rect.label}: UI({x},{y},{width},{height})")
-                    else:
-                        print(f"Warning: Unknown StandardRegion-like object in {section}: {type(rect)}")
-                        continue
-                elif isinstance(rect, dict):
-                    if 'x' in rect and 'y' in rect and 'width' in rect and 'height' in rect:
-                        # Dictionary format (x,y,width,height)
-                        x = rect['x']
-                        y = rect['y']
-                        width = rect['width']
-                        height = rect['height']
-                    elif 'x1' in rect and 'y1' in rect and 'x2' in rect and 'y2' in rect:
-                        # Dictionary format (x1,y1,x2,y2)
-                        x = rect['x1']
-                        y = rect['y1']
-                        width = rect['x2'] - rect['x1']
-                        height = rect['y2'] - rect['y1']
-                    else:
-                        print(f"Warning: Unknown region format in {section}: {rect}")
-                        continue
-                else:
-                    print(f"Warning: Unknown region type in {section}: {type(rect)}")
+                handler = _lookup_handler(_EXTRACT_XYWH, rect)
+                if handler is None:
+                    logger.warning("Unknown region type in %s: %s", section, type(rect))
+                    continue
+                xywh = handler(rect)
+                if xywh is None:
+                    logger.warning("Unknown region format in %s: %s", section, rect)
                     continue
+                x, y, width, height = xywh
+
+                self.regions_table.setItem(row, 0, QTableWidgetItem(section.title()))
+                self.regions_table.setItem(row, 1, QTableWidgetItem(str(i + 1)))
 
                 # Store drawn format (x,y,width,height)
                 self.regions_table.setItem(row, 2, QTableWidgetItem(str(x)))
@@ -1779,6 +2193,8 @@ class EditTemplateDialog(QDialog):
 
                 row += 1
 
+        self.regions_table.setRowCount(row)
+
     def load_column_lines_for_current_page(self):
         """Load column lines for the current page"""
         try:
@@ -1787,119 +2203,88 @@ class EditTemplateDialog(QDialog):
 
             # Get current page's column lines
             column_lines = self.get_column_lines_for_current_page()
-            print(f"\n[DEBUG] Loading column lines for page {self.current_page + 1}")
-            print(f"[DEBUG] Column lines data type: {type(column_lines)}")
-            print(f"[DEBUG] Column lines keys: {list(column_lines.keys()) if isinstance(column_lines, dict) else 'Not a dict'}")
-
-            if isinstance(column_lines, dict):
-                for section, lines in column_lines.items():
-                    print(f"[DEBUG] Section '{section}' has {len(lines)} lines")
-                    if lines and len(lines) > 0:
-                        print(f"[DEBUG] First line type: {type(lines[0])}")
-                        print(f"[DEBUG] First line data: {lines[0]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Loading column lines for page %s (%s, keys: %s)",
+                             self.current_page + 1, type(column_lines),
+                             list(column_lines.keys()) if isinstance(column_lines, dict) else 'Not a dict')
+                if isinstance(column_lines, dict):
+                    for section, lines in column_lines.items():
+                        logger.debug("Section '%s' has %s lines", section, len(lines))
+                        if lines:
+                            logger.debug("First line: %s %r", type(lines[0]), lines[0])
 
             if not column_lines:
-                print("[DEBUG] No column lines found for this page")
+                logger.debug("No column lines found for this page")
                 return
 
-            # Add column lines to the table
-            for section, lines in column_lines.items():
-                if not lines:
-                    continue
+            # Size the table once and fill it with signals and repaints suspended
+            table = self.columns_table
+            sorting_enabled = table.isSortingEnabled()
+            table.setSortingEnabled(False)
+            table.setUpdatesEnabled(False)
+            table.blockSignals(True)
+            table.setRowCount(sum(len(lines) for lines in column_lines.values() if lines))
+            try:
+                self._fill_column_lines_table(column_lines)
+            finally:
+                table.blockSignals(False)
+                table.setUpdatesEnabled(True)
+                table.setSortingEnabled(sorting_enabled)
 
-                for line in lines:
-                    try:
-                        # Debug output to see the line data structure
-                        print(f"\nProcessing line in {section}:")
-                        print(f"Line type: {type(line)}")
-                        print(f"Line data: {line}")
-
-                        # Handle different column line formats
-                        if hasattr(line, 'drawing_start_x') and hasattr(line, 'drawing_start_y'):
-                            # DualCoordinateColumnLine format - use drawing coordinates for UI display
-                            from dual_coordinate_storage import DualCoordinateColumnLine
-                            if isinstance(line, DualCoordinateColumnLine):
-                                start_x = line.drawing_start_x
-                                start_y = line.drawing_start_y
-                                end_x = line.drawing_end_x
-                                end_y = line.drawing_end_y
-                                region_index = 0  # Default region index
-                                print(f"[DEBUG] Displaying DualCoordinateColumnLine {line.label}: UI({start_x},{start_y}) -> ({end_x},{end_y})")
-                            else:
-                                print(f"Warning: Unknown DualCoordinateColumnLine-like object in {section}: {type(line)}")
-                                continue
-                        elif isinstance(line, (list, tuple)):
-                            if len(line) >= 2:
-                                # Old format: [QPoint, QPoint, region_index] or [dict, dict, region_index]
-                                start_point = line[0]
-                                end_point = line[1]
-                                region_index = line[2] if len(line) > 2 else 0
-
-                                # Convert dictionary to QPoint if needed
-                                if isinstance(start_point, dict) and 'x' in start_point:
-                                    start_point = QPoint(start_point['x'], start_point['y'])
-                                if isinstance(end_point, dict) and 'x' in end_point:
-                                    end_point = QPoint(end_point['x'], end_point['y'])
-                                else:
-                                    print(f"Warning: Invalid line format in {section}, skipping")
-                                    continue
-                        elif isinstance(line, dict):
-                            # New format: {'x1': float, 'y1': float, 'x2': float, 'y2': float, 'region_index': int}
-                            if 'x1' in line and 'y1' in line and 'x2' in line and 'y2' in line:
-                                start_point = QPoint(int(line['x1']), int(line['y1']))
-                                end_point = QPoint(int(line['x2']), int(line['y2']))
-                                region_index = line.get('region_index', 0)
-                            else:
-                                print(f"Warning: Invalid dictionary format in {section}, missing coordinates")
-                                print(f"Available keys: {line.keys()}")
-                                continue
-                        else:
-                            print(f"Warning: Unknown line format in {section}, skipping")
-                            continue
-
-                        # Add row to table
-                        row = self.columns_table.rowCount()
-                        self.columns_table.insertRow(row)
-
-                        # Add section
-                        section_item = QTableWidgetItem(section)
-                        section_item.setFlags(section_item.flags() & ~Qt.ItemIsEditable)
-                        self.columns_table.setItem(row, 0, section_item)
-
-                        # Add table number (region index + 1)
-                        table_item = QTableWidgetItem(str(region_index + 1))
-                        table_item.setFlags(table_item.flags() & ~Qt.ItemIsEditable)
-                        self.columns_table.setItem(row, 1, table_item)
-
-                        # Handle different coordinate formats for display
-                        if hasattr(line, 'drawing_start_x'):
-                            # DualCoordinateColumnLine format
-                            x_pos_item = QTableWidgetItem(f"{start_x:.1f}")
-                            desc = f"Start: ({start_x}, {start_y}) End: ({end_x}, {end_y})"
-                        else:
-                            # Legacy QPoint format
-                            x_pos_item = QTableWidgetItem(f"{start_point.x():.1f}")
-                            desc = f"Start: ({start_point.x()}, {start_point.y()}) End: ({end_point.x()}, {end_point.y()})"
+            # Adjust column widths
+            self.columns_table.resizeColumnsToContents()
 
-                        x_pos_item.setFlags(x_pos_item.flags() & ~Qt.ItemIsEditable)
-                        self.columns_table.setItem(row, 2, x_pos_item)
+        except Exception:
+            logger.exception("Error loading column lines")
 
-                        # Add description with coordinates
-                        desc_item = QTableWidgetItem(desc)
-                        desc_item.setFlags(desc_item.flags() & ~Qt.ItemIsEditable)
-                        self.columns_table.setItem(row, 3, desc_item)
+    def _fill_column_lines_table(self, column_lines):
+        """Fill the pre-sized column lines table, trimming rows left unused by skipped lines"""
+        readonly_flags = self._READONLY_FLAGS
+        row = 0
+        for section, lines in column_lines.items():
+            if not lines:
+                continue
 
-                    except Exception as e:
-                        print(f"Error processing line in {section}: {str(e)}")
+            for line in lines:
+                try:
+                    logger.debug("Processing line in %s: %s %r", section, type(line), line)
+
+                    # Handle different column line formats
+                    handler = _lookup_handler(_EXTRACT_LINE, line)
+                    if handler is None:
+                        logger.warning("Unknown line format in %s, skipping", section)
                         continue
+                    coords = handler(line)
+                    if coords is None:
+                        logger.warning("Invalid line format in %s, skipping", section)
+                        continue
+                    start_x, start_y, end_x, end_y, region_index = coords
 
-            # Adjust column widths
-            self.columns_table.resizeColumnsToContents()
+                    # Add section
+                    section_item = QTableWidgetItem(section)
+                    section_item.setFlags(readonly_flags)
+                    self.columns_table.setItem(row, 0, section_item)
 
-        except Exception as e:
-            print(f"Error loading column lines: {str(e)}")
-            import traceback
-            traceback.print_exc()
+                    # Add table number (region index + 1)
+                    table_item = QTableWidgetItem(str(region_index + 1))
+                    table_item.setFlags(readonly_flags)
+                    self.columns_table.setItem(row, 1, table_item)
+
+                    x_pos_item = QTableWidgetItem(f"{start_x:.1f}")
+                    x_pos_item.setFlags(readonly_flags)
+                    self.columns_table.setItem(row, 2, x_pos_item)
+
+                    # Add description with coordinates
+                    desc_item = QTableWidgetItem(f"Start: ({start_x}, {start_y}) End: ({end_x}, {end_y})")
+                    desc_item.setFlags(readonly_flags)
+                    self.columns_table.setItem(row, 3, desc_item)
+                    row += 1
+
+                except Exception as e:
+                    logger.warning("Error processing line in %s: %s", section, e)
+                    continue
+
+        self.columns_table.setRowCount(row)
 
     def get_regions_for_current_page(self):
         """Get regions for the current page - prioritize dual coordinate data"""
@@ -1907,24 +2292,24 @@ class EditTemplateDialog(QDialog):
             # For multi-page templates, check dual coordinate data first
             drawing_page_regions = self.template_data.get("drawing_page_regions", [])
             if drawing_page_regions and self.current_page < len(drawing_page_regions):
-                print(f"[DEBUG] Using dual coordinate page regions for page {self.current_page + 1}")
+                logger.debug("Using dual coordinate page regions for page %s", self.current_page + 1)
                 return drawing_page_regions[self.current_page]
 
             # Fallback to legacy page_regions
             page_regions = self.template_data.get("page_regions", [])
             if self.current_page < len(page_regions):
-                print(f"[DEBUG] Using legacy page regions for page {self.current_page + 1}")
+                logger.debug("Using legacy page regions for page %s", self.current_page + 1)
                 return page_regions[self.current_page]
             return {}
         else:
             # For single-page templates, check dual coordinate data first
             drawing_regions = self.template_data.get("drawing_regions")
             if drawing_regions:
-                print(f"[DEBUG] Using dual coordinate regions for single-page template")
+                logger.debug("Using dual coordinate regions for single-page template")
                 return drawing_regions
 
             # No dual coordinate data found - return empty
-            print(f"[DEBUG] No dual coordinate regions found for single-page template")
+            logger.debug("No dual coordinate regions found for single-page template")
             return {'header': [], 'items': [], 'summary': []}
 
     def get_column_lines_for_current_page(self):
@@ -1933,24 +2318,24 @@ class EditTemplateDialog(QDialog):
             # For multi-page templates, check dual coordinate data first
             drawing_page_column_lines = self.template_data.get("drawing_page_column_lines", [])
             if drawing_page_column_lines and self.current_page < len(drawing_page_column_lines):
-                print(f"[DEBUG] Using dual coordinate page column lines for page {self.current_page + 1}")
+                logger.debug("Using dual coordinate page column lines for page %s", self.current_page + 1)
                 return drawing_page_column_lines[self.current_page]
 
             # Fallback to legacy page_column_lines
             page_column_lines = self.template_data.get("page_column_lines", [])
             if self.current_page < len(page_column_lines):
-                print(f"[DEBUG] Using legacy page column lines for page {self.current_page + 1}")
+                logger.debug("Using legacy page column lines for page %s", self.current_page + 1)
                 return page_column_lines[self.current_page]
             return {}
         else:
             # For single-page templates, check dual coordinate data first
             drawing_column_lines = self.template_data.get("drawing_column_lines")
             if drawing_column_lines:
-                print(f"[DEBUG] Using dual coordinate column lines for single-page template")
+                logger.debug("Using dual coordinate column lines for single-page template")
                 return drawing_column_lines
 
             # No dual coordinate data found - return empty
-            print(f"[DEBUG] No dual coordinate column lines found for single-page template")
+            logger.debug("No dual coordinate column lines found for single-page template")
             return {'header': [], 'items': [], 'summary': []}
 
     def get_template_data(self):
@@ -1963,67 +2348,60 @@ class EditTemplateDialog(QDialog):
         template_data['template_type'] = "multi" if self.type_combo.currentText() == "Multi-page" else "single"
         template_data['page_count'] = self.page_count
 
-        print(f"\nCollecting template data for {template_data['name']} (type: {template_data['template_type']})")
+        logger.debug("Collecting template data for %s (type: %s)", template_data['name'], template_data['template_type'])
 
         # Get dual coordinate regions data
-        from dual_coordinate_storage import DualCoordinateStorage
         storage = DualCoordinateStorage()
 
         if template_data['template_type'] == "multi":
-            # For multi-page templates, collect dual coordinate regions for each page
-            print(f"Collecting multi-page dual coordinate regions for {self.page_count} pages")
+            # For multi-page templates, collect dual coordinate regions and column lines
+            # for each page in a single pass over the pages
+            logger.debug("Collecting multi-page dual coordinate regions and column lines for %s pages", self.page_count)
             drawing_page_regions = []
-            extraction_page_regions = []
+            page_column_lines = []
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
             for page in range(self.page_count):
                 self.current_page = page
                 page_dual_regions = self.get_dual_regions_data()
+                page_column_line = self.get_column_lines_data()
 
-                # Log the regions collected for each page
-                region_counts = {section: len(rects) for section, rects in page_dual_regions.items()}
-                print(f"- Page {page+1}: collected dual coordinate regions = {region_counts}")
+                # Log the regions and column lines collected for each page
+                if debug_enabled:
+                    region_counts = {section: len(rects) for section, rects in page_dual_regions.items()}
+                    column_counts = {section: len(lines) for section, lines in page_column_line.items()}
+                    logger.debug("Page %d: collected dual coordinate regions = %r, column lines = %r",
+                                 page + 1, region_counts, column_counts)
 
                 drawing_page_regions.append(page_dual_regions)
-                extraction_page_regions.append(page_dual_regions)  # Same data, different usage
+                page_column_lines.append(page_column_line)
 
             template_data['drawing_page_regions'] = drawing_page_regions
-            template_data['extraction_page_regions'] = extraction_page_regions
-            print(f"Multi-page template: collected {len(drawing_page_regions)} page dual coordinate regions")
+            template_data['extraction_page_regions'] = drawing_page_regions  # Same data, different usage
+            logger.debug("Multi-page template: collected %s page dual coordinate regions", len(drawing_page_regions))
+
+            template_data['page_column_lines'] = page_column_lines
+            # Also include an empty 'column_lines' field to satisfy older code
+            template_data['column_lines'] = {}
+            logger.debug("Multi-page template: collected %s page_column_lines", len(page_column_lines))
         else:
             # For single-page templates
             dual_regions = self.get_dual_regions_data()
 
             # Log the regions collected
-            region_counts = {section: len(rects) for section, rects in dual_regions.items()}
-            print(f"Single-page template: collected dual coordinate regions = {region_counts}")
+            if logger.isEnabledFor(logging.DEBUG):
+                region_counts = {section: len(rects) for section, rects in dual_regions.items()}
+                logger.debug("Single-page template: collected dual coordinate regions = %s", region_counts)
 
             template_data['drawing_regions'] = dual_regions
             template_data['extraction_regions'] = dual_regions  # Same data, different usage
 
-        # Get column lines data
-        if template_data['template_type'] == "multi":
-            # For multi-page templates, collect column lines for each page
-            print(f"Collecting multi-page column lines for {self.page_count} pages")
-            page_column_lines = []
-            for page in range(self.page_count):
-                self.current_page = page
-                page_column_line = self.get_column_lines_data()
-                # Log the column lines collected for each page
-                column_counts = {section: len(lines) for section, lines in page_column_line.items()}
-                print(f"- Page {page+1}: collected column lines = {column_counts}")
-                page_column_lines.append(page_column_line)
-            template_data['page_column_lines'] = page_column_lines
-
-            # Also include an empty 'column_lines' field to satisfy older code
-            template_data['column_lines'] = {}
-            print(f"Multi-page template: collected {len(page_column_lines)} page_column_lines")
-        else:
-            # For single-page templates
             column_lines = self.get_column_lines_data()
             template_data['column_lines'] = column_lines
             # Log the column lines collected
-            column_counts = {section: len(lines) for section, lines in column_lines.items()}
-            print(f"Single-page template: collected column lines = {column_counts}")
+            if logger.isEnabledFor(logging.DEBUG):
+                column_counts = {section: len(lines) for section, lines in column_lines.items()}
+                logger.debug("Single-page template: collected column lines = %s", column_counts)
 
             # Initialize page_column_lines as an empty list to satisfy code that might look for it
             template_data['page_column_lines'] = []
@@ -2034,42 +2412,41 @@ class EditTemplateDialog(QDialog):
         # Get mapping configuration
         template_data['mapping_config'] = self.get_mapping_config_data()
 
-        # Get YAML/JSON template from editor
+        # Get YAML/JSON template from editor, skipping the document-to-string
+        # conversion entirely when the editor is empty
         try:
-            print(f"\n[DEBUG] Getting template from editor in get_template_data")
-            template_text = self.json_template_editor.toPlainText()
-            print(f"[DEBUG] Template text length: {len(template_text)}")
-            print(f"[DEBUG] Template text (first 100 chars): {template_text[:100]}...")
+            if self.json_template_editor.document().isEmpty():
+                template_text = ""
+            else:
+                template_text = self.json_template_editor.toPlainText()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Getting template from editor (length %s): %s...", len(template_text), template_text[:100])
 
             if template_text.strip():
-                # Try to parse as YAML first
-                import yaml
+                # Parsed as JSON or YAML, reusing the last parse when the editor is unchanged
                 try:
-                    template_data_obj = yaml.safe_load(template_text)
-                    print(f"[DEBUG] Template parsed successfully as YAML")
+                    template_data_obj = self.get_parsed_template(template_text)
+                    logger.debug("Template parsed successfully")
                 except yaml.YAMLError as yaml_err:
-                    # If YAML parsing fails, try JSON as fallback
-                    try:
-                        template_data_obj = json.loads(template_text)
-                        print(f"[DEBUG] YAML parsing failed, but JSON parsing succeeded")
-                    except json.JSONDecodeError as json_err:
-                        # Both YAML and JSON parsing failed
-                        print(f"[WARNING] Invalid template: YAML error: {str(yaml_err)}, JSON error: {str(json_err)}")
-                        QMessageBox.warning(
-                            self,
-                            "Invalid Template",
-                            f"The template contains invalid YAML and JSON syntax.\n\nYAML Error: {str(yaml_err)}\n\nJSON Error: {str(json_err)}"
-                        )
-                        template_data["json_template"] = None
-                        return template_data
+                    # Both YAML and JSON parsing failed
+                    json_err = yaml_err.__cause__
+                    logger.warning("Invalid template: YAML error: %s, JSON error: %s", yaml_err, json_err)
+                    QMessageBox.warning(
+                        self,
+                        "Invalid Template",
+                        f"The template contains invalid YAML and JSON syntax.\n\nYAML Error: {str(yaml_err)}\n\nJSON Error: {str(json_err)}"
+                    )
+                    template_data["json_template"] = None
+                    return template_data
 
-                print(f"[DEBUG] Template data type: {type(template_data_obj)}")
+                logger.debug("Template data type: %s", type(template_data_obj))
                 if isinstance(template_data_obj, dict):
-                    print(f"[DEBUG] Template keys: {list(template_data_obj.keys())}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Template keys: %s", list(template_data_obj.keys()))
                     template_data["json_template"] = template_data_obj
-                    print(f"[DEBUG] Added template to template_data")
+                    logger.debug("Added template to template_data")
                 else:
-                    print(f"[WARNING] Template is not a dictionary: {type(template_data_obj)}")
+                    logger.warning("Template is not a dictionary: %s", type(template_data_obj))
                     QMessageBox.warning(
                         self,
                         "Invalid Template",
@@ -2077,12 +2454,10 @@ class EditTemplateDialog(QDialog):
                     )
                     template_data["json_template"] = None
             else:
-                print(f"[DEBUG] Template text is empty, setting to None")
+                logger.debug("Template text is empty, setting to None")
                 template_data["json_template"] = None
         except Exception as e:
-            print(f"[ERROR] Error processing template: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error processing template")
             QMessageBox.warning(
                 self,
                 "Error Processing Template",
@@ -2093,226 +2468,197 @@ class EditTemplateDialog(QDialog):
         # For backward compatibility, keep empty validation_rules
         template_data["validation_rules"] = {}
 
-        # Ensure we have valid data before returning
-        try:
-            self.validate_template_data(template_data)
-            print("Template data validation successful")
-        except Exception as e:
-            print(f"Template data validation failed: {str(e)}")
-
         return template_data
 
     def get_regions_data(self):
         """Extract regions data from the regions table"""
-        regions = {
-            'header': [],
-            'items': [],
-            'summary': []
-        }
+        regions = {section: [] for section in _SECTIONS}
+        counters = dict.fromkeys(_SECTIONS, 0)
 
         # Iterate through all rows in the regions table
-        for row in range(self.regions_table.rowCount()):
-            # Get section, which should be in the first column
-            section_item = self.regions_table.item(row, 0)
-            if not section_item:
+        tbl = self.regions_table
+        model = tbl.model()
+        for row in range(tbl.rowCount()):
+            # Section is in the first column, coordinates in columns 2-5
+            texts = _read_row(model, row, (0, 2, 3, 4, 5))
+            if None in texts:
                 continue
+            section_text, x_text, y_text, width_text, height_text = texts
 
-            section = section_item.text().lower()
+            section = section_text.lower()
 
-            # Make sure section is valid
-            if section not in regions:
+            # Make sure section is valid; fetch its list once for the row
+            bucket = regions.get(section)
+            if bucket is None:
                 continue
 
             # Get coordinates
             try:
-                x_item = self.regions_table.item(row, 2)
-                y_item = self.regions_table.item(row, 3)
-                width_item = self.regions_table.item(row, 4)
-                height_item = self.regions_table.item(row, 5)
+                x = int(x_text)
+                y = int(y_text)
+                width = int(width_text)
+                height = int(height_text)
 
-                if x_item and y_item and width_item and height_item:
-                    x = int(x_item.text())
-                    y = int(y_item.text())
-                    width = int(width_item.text())
-                    height = int(height_item.text())
-
-                    # Create dual coordinate region
-                    from dual_coordinate_storage import DualCoordinateRegion
+                try:
+                    # Generate name for the region
+                    count = counters[section] + 1
+                    name = f"{_SECTION_PREFIXES[section]}{count}"
 
-                    try:
-                        # Generate name for the region
-                        name = f"{section[0].upper()}{len(regions[section]) + 1}"
-
-                        # Use default scale factors (these will be updated when template is applied)
-                        scale_x, scale_y = 1.0, 1.0
-                        page_height = 842.0  # A4 page height in points
+                    # Use default scale factors (these will be updated when template is applied)
+                    scale_x, scale_y = 1.0, 1.0
+                    page_height = 842.0  # A4 page height in points
 
-                        # Create dual coordinate region
-                        dual_region = DualCoordinateRegion.from_ui_input(
-                            x, y, width, height, name, scale_x, scale_y, page_height
-                        )
-                        regions[section].append(dual_region)
-                        print(f"Created dual coordinate region with name: {name}")
-                    except ValueError as e:
-                        print(f"Error creating dual coordinate region: {e}")
-                        continue
+                    # Create dual coordinate region
+                    dual_region = DualCoordinateRegion.from_ui_input(
+                        x, y, width, height, name, scale_x, scale_y, page_height
+                    )
+                    bucket.append(dual_region)
+                    counters[section] = count
+                    logger.debug("Created dual coordinate region with name: %s", name)
+                except ValueError as e:
+                    logger.warning("Error creating dual coordinate region: %s", e)
+                    continue
             except (ValueError, AttributeError) as e:
-                print(f"Error parsing region data: {str(e)}")
+                logger.warning("Error parsing region data: %s", e)
                 continue
 
         # If no regions were found, preserve the original regions based on template type
         if not any(regions.values()) and hasattr(self, 'template_data'):
-            print("No regions found in table, preserving original regions data")
+            logger.debug("No regions found in table, preserving original regions data")
 
             # Check if this is a multi-page template
             if self.template_data.get("template_type") == "multi":
                 # For multi-page templates, get page-specific regions
                 page_regions = self.template_data.get("page_regions", [])
                 if hasattr(self, 'current_page') and self.current_page < len(page_regions):
-                    print(f"Preserving multi-page regions for page {self.current_page}")
+                    logger.debug("Preserving multi-page regions for page %s", self.current_page)
                     return page_regions[self.current_page]
 
             # Otherwise fallback to dual coordinate regions (for single-page templates)
             drawing_regions = self.template_data.get('drawing_regions')
             if drawing_regions:
-                print("Preserving single-page dual coordinate regions")
+                logger.debug("Preserving single-page dual coordinate regions")
                 return drawing_regions
             else:
-                print("No regions found - returning empty")
+                logger.debug("No regions found - returning empty")
                 return {'header': [], 'items': [], 'summary': []}
 
         return regions
 
     def get_dual_regions_data(self):
         """Extract dual coordinate regions data from the regions table"""
-        from dual_coordinate_storage import DualCoordinateRegion
-
-        regions = {
-            'header': [],
-            'items': [],
-            'summary': []
-        }
+        regions = {section: [] for section in _SECTIONS}
+        counters = dict.fromkeys(_SECTIONS, 0)
 
         # Iterate through all rows in the regions table
-        for row in range(self.regions_table.rowCount()):
-            # Get section, which should be in the first column
-            section_item = self.regions_table.item(row, 0)
-            if not section_item:
+        tbl = self.regions_table
+        model = tbl.model()
+        for row in range(tbl.rowCount()):
+            # Section is in the first column, coordinates in columns 2-5
+            texts = _read_row(model, row, (0, 2, 3, 4, 5))
+            if None in texts:
                 continue
+            section_text, x_text, y_text, width_text, height_text = texts
 
-            section = section_item.text().lower()
+            section = section_text.lower()
 
-            # Make sure section is valid
-            if section not in regions:
+            # Make sure section is valid; fetch its list once for the row
+            bucket = regions.get(section)
+            if bucket is None:
                 continue
 
             # Get coordinates
             try:
-                x_item = self.regions_table.item(row, 2)
-                y_item = self.regions_table.item(row, 3)
-                width_item = self.regions_table.item(row, 4)
-                height_item = self.regions_table.item(row, 5)
-
-                if x_item and y_item and width_item and height_item:
-                    x = int(x_item.text())
-                    y = int(y_item.text())
-                    width = int(width_item.text())
-                    height = int(height_item.text())
-
-                    # Generate name for the region
-                    name = f"{section[0].upper()}{len(regions[section]) + 1}"
-
-                    # Use default scale factors (these will be updated when template is applied)
-                    scale_x, scale_y = 1.0, 1.0
-                    page_height = 842.0  # A4 page height in points
-
-                    # Create dual coordinate region
-                    dual_region = DualCoordinateRegion.from_ui_input(
-                        x, y, width, height, name, scale_x, scale_y, page_height
-                    )
-                    regions[section].append(dual_region)
+                x = int(x_text)
+                y = int(y_text)
+                width = int(width_text)
+                height = int(height_text)
+
+                # Generate name for the region
+                count = counters[section] + 1
+                name = f"{_SECTION_PREFIXES[section]}{count}"
+
+                # Use default scale factors (these will be updated when template is applied)
+                scale_x, scale_y = 1.0, 1.0
+                page_height = 842.0  # A4 page height in points
+
+                # Create dual coordinate region
+                dual_region = DualCoordinateRegion.from_ui_input(
+                    x, y, width, height, name, scale_x, scale_y, page_height
+                )
+                bucket.append(dual_region)
+                counters[section] = count
 
             except (ValueError, AttributeError) as e:
-                print(f"Error parsing dual coordinate region data: {str(e)}")
+                logger.warning("Error parsing dual coordinate region data: %s", e)
                 continue
 
         return regions
 
     def get_column_lines_data(self):
         """Extract column lines data from the columns table"""
-        column_lines = {
-            'header': [],
-            'items': [],
-            'summary': []
-        }
+        column_lines = {section: [] for section in _SECTIONS}
 
         # Iterate through all rows in the columns table
-        for row in range(self.columns_table.rowCount()):
-            # Get section, which should be in the first column
-            section_item = self.columns_table.item(row, 0)
-            if not section_item:
+        tbl = self.columns_table
+        model = tbl.model()
+        for row in range(tbl.rowCount()):
+            # Section, table index, x position and description columns
+            texts = _read_row(model, row, (0, 1, 2, 3))
+            if None in texts:
                 continue
+            section_text, table_idx_text, x_pos_text, desc = texts
 
-            section = section_item.text().lower()
+            section = section_text.lower()
 
-            # Make sure section is valid
-            if section not in column_lines:
+            # Make sure section is valid; fetch its list once for the row
+            bucket = column_lines.get(section)
+            if bucket is None:
                 continue
 
             # Get coordinates
             try:
-                table_idx_item = self.columns_table.item(row, 1)
-                x_pos_item = self.columns_table.item(row, 2)
-                desc_item = self.columns_table.item(row, 3)
-
-                if table_idx_item and x_pos_item and desc_item:
-                    table_idx = int(table_idx_item.text()) - 1  # Convert to 0-based index
-                    x_pos = float(x_pos_item.text())
-
-                    # Parse coordinates from description
-                    desc = desc_item.text()
-                    start_coords = desc.split("End:")[0].strip("Start: ()").split(",")
-                    end_coords = desc.split("End:")[1].strip(" ()").split(",")
-
-                    if len(start_coords) == 2 and len(end_coords) == 2:
-                        start_x = float(start_coords[0].strip())
-                        start_y = float(start_coords[1].strip())
-                        end_x = float(end_coords[0].strip())
-                        end_y = float(end_coords[1].strip())
-
-                        # Create start and end points as dictionaries
-                        start_point = {'x': start_x, 'y': start_y}
-                        end_point = {'x': end_x, 'y': end_y}
-
-                        # Add to column lines with table index
-                        column_lines[section].append([start_point, end_point, table_idx])
-                    else:
-                        print(f"Warning: Invalid coordinate format in description: {desc}")
-                continue
+                table_idx = int(table_idx_text) - 1  # Convert to 0-based index
+                x_pos = float(x_pos_text)
+
+                # Parse coordinates from description
+                match = _COLUMN_DESC_RE.match(desc)
+
+                if match:
+                    start_x, start_y, end_x, end_y = map(float, match.groups())
+
+                    # Create start and end points as dictionaries
+                    start_point = {'x': start_x, 'y': start_y}
+                    end_point = {'x': end_x, 'y': end_y}
+
+                    # Add to column lines with table index
+                    bucket.append([start_point, end_point, table_idx])
+                else:
+                    logger.warning("Invalid coordinate format in description: %s", desc)
 
             except Exception as e:
-                print(f"Error processing row {row}: {str(e)}")
+                logger.warning("Error processing row %s: %s", row, e)
                 continue
 
         # If no column lines were found, preserve the original ones based on template type
         if not any(column_lines.values()) and hasattr(self, 'template_data'):
-            print("No column lines found in table, preserving original column lines data")
+            logger.debug("No column lines found in table, preserving original column lines data")
 
             # Check if this is a multi-page template
             if self.template_data.get("template_type") == "multi":
                 # For multi-page templates, get page-specific column lines
                 page_column_lines = self.template_data.get("page_column_lines", [])
                 if hasattr(self, 'current_page') and self.current_page < len(page_column_lines):
-                    print(f"Preserving multi-page column lines for page {self.current_page}")
+                    logger.debug("Preserving multi-page column lines for page %s", self.current_page)
                     return page_column_lines[self.current_page]
 
             # Otherwise fallback to dual coordinate column lines (for single-page templates)
             drawing_column_lines = self.template_data.get('drawing_column_lines')
             if drawing_column_lines:
-                print("Preserving single-page dual coordinate column lines")
+                logger.debug("Preserving single-page dual coordinate column lines")
                 return drawing_column_lines
             else:
-                print("No column lines found - returning empty")
+                logger.debug("No column lines found - returning empty")
                 return {'header': [], 'items': [], 'summary': []}
 
         return column_lines
@@ -2321,10 +2667,14 @@ class EditTemplateDialog(QDialog):
         """Extract configuration data from the dialog"""
         config = {}
 
+        # Look the original config up once; it is consulted several times below
+        template_data = getattr(self, 'template_data', None)
+        original_config = template_data.get('config') if template_data else None
+
         # If we have a template_data, preserve any existing config data not overwritten
-        if hasattr(self, 'template_data') and 'config' in self.template_data:
+        if original_config is not None:
             # Start with a copy of the existing config to preserve any custom fields
-            config = self.template_data['config'].copy()
+            config = original_config.copy()
 
         # Add extraction parameters to config with proper section-specific structure
         # Get global parameters
@@ -2332,29 +2682,19 @@ class EditTemplateDialog(QDialog):
         strip_text = self.strip_text.text().replace('\\n', '\n')
         flavor = 'stream'  # This is fixed
 
+        # Parameters shared by every section; only row_tol differs between them
+        common = {
+            'flavor': flavor,
+            'split_text': split_text,
+            'strip_text': strip_text,
+            'edge_tol': 0.5
+        }
+
         # Create extraction parameters with section-specific parameters
         extraction_params = {
-            'header': {
-                'row_tol': self.header_row_tol.value(),
-                'flavor': flavor,
-                'split_text': split_text,
-                'strip_text': strip_text,
-                'edge_tol': 0.5  # Add edge_tol parameter
-            },
-            'items': {
-                'row_tol': self.items_row_tol.value(),
-                'flavor': flavor,
-                'split_text': split_text,
-                'strip_text': strip_text,
-                'edge_tol': 0.5  # Add edge_tol parameter
-            },
-            'summary': {
-                'row_tol': self.summary_row_tol.value(),
-                'flavor': flavor,
-                'split_text': split_text,
-                'strip_text': strip_text,
-                'edge_tol': 0.5  # Add edge_tol parameter
-            },
+            'header': {'row_tol': self.header_row_tol.value(), **common},
+            'items': {'row_tol': self.items_row_tol.value(), **common},
+            'summary': {'row_tol': self.summary_row_tol.value(), **common},
             # Keep global parameters for backward compatibility
             'split_text': split_text,
             'strip_text': strip_text,
@@ -2370,9 +2710,7 @@ class EditTemplateDialog(QDialog):
         config['extraction_params'] = extraction_params
 
         # Preserve original coordinates if they exist
-        if hasattr(self, 'template_data') and 'config' in self.template_data:
-            original_config = self.template_data['config']
-
+        if original_config is not None:
             # Preserve original_regions if they exist
             if 'original_regions' in original_config:
                 config['original_regions'] = original_config['original_regions']
@@ -2390,33 +2728,13 @@ class EditTemplateDialog(QDialog):
                 config['store_original_coords'] = original_config['store_original_coords']
 
             # Preserve any additional custom parameters
-            known_params = ['multi_table_mode', 'extraction_params', 'regex_patterns', 'use_middle_page',
-                           'fixed_page_count', 'total_pages', 'page_indices', 'store_original_coords',
-                           'original_regions', 'original_column_lines', 'scale_factors']
-
             for key, value in original_config.items():
-                if key not in known_params and key not in config:
+                if key not in _KNOWN_CONFIG_PARAMS and key not in config:
                     config[key] = value
 
-        # Preserve regex_patterns if they exist in the original config
-        if hasattr(self, 'template_data') and 'config' in self.template_data:
-            original_config = self.template_data['config']
-            if 'regex_patterns' in original_config:
-                config['regex_patterns'] = original_config['regex_patterns']
-            else:
-                # Add empty regex patterns structure for backward compatibility
-                config['regex_patterns'] = {
-                    'header': {},
-                    'items': {},
-                    'summary': {}
-                }
-        else:
-            # Add empty regex patterns structure for backward compatibility
-            config['regex_patterns'] = {
-                'header': {},
-                'items': {},
-                'summary': {}
-            }
+        # config started as a copy of the original, so regex_patterns is already preserved
+        # when present; otherwise add the empty structure for backward compatibility
+        config.setdefault('regex_patterns', {section: {} for section in _SECTIONS})
         # For multi-page templates with page-specific config
         if (self.template_data.get("template_type") == "multi" and
             hasattr(self, 'page_specific_config') and
@@ -2429,29 +2747,18 @@ class EditTemplateDialog(QDialog):
                 page_configs.append(None)
 
             # Create page-specific configs for each page
+            regex_patterns = config['regex_patterns']
+            current_page = self.current_page
             for page_idx in range(self.page_count):
-                # If this is the current page, use the current values
-                if page_idx == self.current_page:
-                    page_config = {
-                        'extraction_params': extraction_params.copy()
-                    }
-
-                    # Add regex_patterns if they exist in the original config
-                    if 'regex_patterns' in config:
-                        page_config['regex_patterns'] = config['regex_patterns'].copy()
-                    page_configs[page_idx] = page_config
-                # Otherwise, keep existing config or initialize
-                elif page_idx >= len(page_configs) or page_configs[page_idx] is None:
-                    # Initialize with global config
-                    page_config = {
-                        'extraction_params': config['extraction_params'].copy()
-                    }
-
-                    # Add regex_patterns if they exist in the original config
-                    if 'regex_patterns' in config:
-                        page_config['regex_patterns'] = config['regex_patterns'].copy()
+                # Keep existing configs of other pages untouched; only the current page
+                # (which takes the current values) and uninitialized pages are copied
+                if page_idx != current_page and page_configs[page_idx] is not None:
+                    continue
 
-                    page_configs[page_idx] = page_config
+                page_configs[page_idx] = {
+                    'extraction_params': extraction_params.copy(),
+                    'regex_patterns': regex_patterns.copy()
+                }
 
             # Save page_configs to template_data
             config['page_configs'] = page_configs
@@ -2519,7 +2826,7 @@ class EditTemplateDialog(QDialog):
                 mapping_config['region_wise']['summary']['source_page'] = summary_text or 'n'
 
         except Exception as e:
-            print(f"Error collecting mapping configuration: {e}")
+            logger.warning("Error collecting mapping configuration: %s", e)
             # Return default configuration on error
 
         return mapping_config
@@ -2531,7 +2838,7 @@ class EditTemplateDialog(QDialog):
     def display_extraction_parameters(self):
         """Display extraction parameters in the text edit"""
         try:
-            extraction_text = "Extraction Parameters:\n"
+            parts = ["Extraction Parameters:\n"]
 
             # Check for multi-page template with page-specific extraction parameters
             if (self.template_data.get('template_type') == 'multi' and
@@ -2542,40 +2849,32 @@ class EditTemplateDialog(QDialog):
 
                 # Get page-specific extraction parameters
                 extraction_params = self.template_data['page_configs'][self.current_page]['extraction_params']
-                extraction_text += f"\nPage {self.current_page + 1} Specific Parameters:\n"
+                parts.append(f"\nPage {self.current_page + 1} Specific Parameters:\n")
 
-                for section, params in extraction_params.items():
-                    if isinstance(params, dict):
-                        extraction_text += f"\n{section.capitalize()}:\n"
-                        for param, value in params.items():
-                            extraction_text += f"  {param}: {value}\n"
+                section_parts, global_params = _split_extraction_params(extraction_params)
+                parts.extend(section_parts)
 
                 # Add global parameters from page-specific config
-                global_params = {k: v for k, v in extraction_params.items()
-                               if not isinstance(v, dict)}
                 if global_params:
-                    extraction_text += "\nPage Global Parameters:\n"
+                    parts.append("\nPage Global Parameters:\n")
                     for param, value in global_params.items():
-                        extraction_text += f"  {param}: {value}\n"
+                        parts.append(f"  {param}: {value}\n")
 
                 # Also show global extraction parameters if available
                 if 'config' in self.template_data and 'extraction_params' in self.template_data['config']:
                     global_extraction_params = self.template_data['config']['extraction_params']
-                    extraction_text += "\nTemplate Global Parameters:\n"
+                    parts.append("\nTemplate Global Parameters:\n")
 
-                    for section, params in global_extraction_params.items():
-                        if isinstance(params, dict) and section not in extraction_params:
-                            extraction_text += f"\n{section.capitalize()}:\n"
-                            for param, value in params.items():
-                                extraction_text += f"  {param}: {value}\n"
+                    # Sections and global parameters that aren't in page-specific config
+                    section_parts, global_global_params = _split_extraction_params(
+                        global_extraction_params, extraction_params, global_params
+                    )
+                    parts.extend(section_parts)
 
-                    # Add global parameters that aren't in page-specific config
-                    global_global_params = {k: v for k, v in global_extraction_params.items()
-                                         if not isinstance(v, dict) and k not in global_params}
                     if global_global_params:
-                        extraction_text += "\nTemplate Global Parameters:\n"
+                        parts.append("\nTemplate Global Parameters:\n")
                         for param, value in global_global_params.items():
-                            extraction_text += f"  {param}: {value}\n"
+                            parts.append(f"  {param}: {value}\n")
 
             # For single-page templates or if no page-specific parameters
             elif 'config' in self.template_data and 'extraction_params' in self.template_data['config']:
@@ -2583,61 +2882,495 @@ class EditTemplateDialog(QDialog):
 
                 # Multi-page options removed - using simplified page-wise approach
 
-                for section, params in extraction_params.items():
-                    if isinstance(params, dict):
-                        extraction_text += f"\n{section.capitalize()}:\n"
-                        for param, value in params.items():
-                            extraction_text += f"  {param}: {value}\n"
+                section_parts, global_params = _split_extraction_params(extraction_params)
+                parts.extend(section_parts)
 
                 # Add global parameters
-                global_params = {k: v for k, v in extraction_params.items()
-                               if not isinstance(v, dict)}
                 if global_params:
-                    extraction_text += "\nGlobal Parameters:\n"
+                    parts.append("\nGlobal Parameters:\n")
                     for param, value in global_params.items():
-                        extraction_text += f"  {param}: {value}\n"
+                        parts.append(f"  {param}: {value}\n")
             else:
-                extraction_text += "\nNo extraction parameters found."
+                parts.append("\nNo extraction parameters found.")
 
-            self.extraction_params_text.setText(extraction_text)
+            self.extraction_params_text.setPlainText("".join(parts))
         except Exception as e:
             print(f"Error displaying extraction parameters: {str(e)}")
-            import traceback
             traceback.print_exc()
-            self.extraction_params_text.setText(f"Error displaying extraction parameters: {str(e)}")
+            self.extraction_params_text.setPlainText(f"Error displaying extraction parameters: {str(e)}")
 
     def show_raw_config(self, config):
         """Show the raw configuration in a dialog for debugging"""
         try:
-            import json
-            config_text = json.dumps(config, indent=2)
+            if self._raw_config_dialog is None:
+                dialog = QDialog(self)
+                dialog.setWindowTitle("Raw Configuration")
+                dialog.setMinimumWidth(600)
+                dialog.setMinimumHeight(400)
 
-            dialog = QDialog(self)
-            dialog.setWindowTitle("Raw Configuration")
-            dialog.setMinimumWidth(600)
-            dialog.setMinimumHeight(400)
+                layout = QVBoxLayout(dialog)
 
-            layout = QVBoxLayout(dialog)
+                text_edit = QTextEdit()
+                text_edit.setReadOnly(True)
+                text_edit.setUndoRedoEnabled(False)
+                text_edit.setFont(self._mono_font())
 
-            text_edit = QTextEdit()
-            text_edit.setReadOnly(True)
-            text_edit.setFont(QFont("Courier New", 10))
-            text_edit.setText(config_text)
+                layout.addWidget(text_edit)
 
-            layout.addWidget(text_edit)
+                close_btn = QPushButton("Close")
+                close_btn.clicked.connect(dialog.close)
+                layout.addWidget(close_btn)
 
-            close_btn = QPushButton("Close")
-            close_btn.clicked.connect(dialog.close)
-            layout.addWidget(close_btn)
+                self._raw_config_dialog = dialog
+                self._raw_config_text = text_edit
 
-            dialog.exec()
+            text_edit = self._raw_config_text
+            text_edit.setUpdatesEnabled(False)
+            try:
+                if orjson is not None:
+                    text_edit.setPlainText(orjson.dumps(
+                        config,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ).decode())
+                else:
+                    # Stream the encoder output in ~64 KB pieces rather than materializing
+                    # the whole document as one string first; non-JSON values are shown
+                    # via str() as on the orjson path
+                    text_edit.clear()
+                    cursor = text_edit.textCursor()
+                    pending = []
+                    pending_size = 0
+                    for chunk in json.JSONEncoder(indent=2, default=str).iterencode(config):
+                        pending.append(chunk)
+                        pending_size += len(chunk)
+                        if pending_size >= 65536:
+                            cursor.insertText("".join(pending))
+                            pending = []
+                            pending_size = 0
+                    cursor.insertText("".join(pending))
+                    text_edit.moveCursor(QTextCursor.Start)
+            finally:
+                text_edit.setUpdatesEnabled(True)
+
+            self._raw_config_dialog.exec()
         except Exception as e:
             print(f"Error showing raw config: {e}")
-            import traceback
             traceback.print_exc()
 
     # Removed clone_column_lines_to_another_page function as it is no longer needed
 
+
+# Body of the message shown after a template is updated, filled in with str.format_map
+_UPDATE_SUCCESS_HTML = """
+<h3>Template Updated Successfully</h3>
+<p>The template has been updated with the following information:</p>
+<ul>
+    <li><b>Name:</b> {name}</li>
+    <li><b>Description:</b> {description}</li>
+    <li><b>Type:</b> {template_type}</li>
+    <li><b>Multi-table Mode:</b> {multi_table_mode}</li>
+    <li><b>JSON Template:</b> {json_template}</li>
+</ul>
+<p><b>Regions:</b></p><ul>{regions_html}</ul><p><b>Column Lines:</b></p><ul>{column_lines_html}</ul>{regex_html}"""
+_JSON_INCLUDED_HTML = "<span style='color: green;'>✓ Included</span>"
+_JSON_NOT_INCLUDED_HTML = "<span style='color: gray;'>Not included</span>"
+
+# Body of the error dialogs shown by TemplateManager._show_error, filled in with str.format_map
+_ERROR_HTML = """
+<h3>{heading}</h3>
+<p>{intro}</p>
+<p style='color: #D32F2F;'>{detail}</p>
+<p>{footer}</p>
+"""
+
+# Most pages / patterns listed per section of the template updated message; the rest are summarized
+_SUMMARY_LIMIT = 20
+
+# Stylesheets for the template manager screen, built once at import and shared by every instance
+_MANAGER_QSS = """
+    QWidget {
+        color: black;
+        background-color: white;
+    }
+    QLabel {
+        color: #333333;
+    }
+    QTableWidgetItem {
+        color: black;
+    }
+    QMessageBox {
+        color: black;
+    }
+    QMessageBox QLabel {
+        color: black;
+    }
+"""
+
+_BACK_BTN_QSS = """
+    QPushButton {
+        background-color: #ffffff;
+        color: #000000;
+        padding: 5px 15px;
+        border-radius: 4px;
+        height: 25px;
+    }
+    QPushButton:hover {
+        background-color: #f0f0f0;
+    }
+"""
+
+_REFRESH_BTN_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        padding: 5px 15px;
+        border-radius: 4px;
+        height: 25px;
+    }
+    QPushButton:hover {
+        background-color: #3E8E41;
+    }
+"""
+
+_ADD_BTN_QSS = """
+    QPushButton {
+        background-color: #4169E1;
+        color: white;
+        padding: 5px 15px;
+        border-radius: 4px;
+        height: 25px;
+    }
+    QPushButton:hover {
+        background-color: #3158D3;
+    }
+"""
+
+_EXPORT_BTN_QSS = """
+    QPushButton {
+        background-color: #FF9800;
+        color: white;
+        padding: 5px 15px;
+        border-radius: 4px;
+        height: 25px;
+    }
+    QPushButton:hover {
+        background-color: #F57C00;
+    }
+"""
+
+_IMPORT_BTN_QSS = """
+    QPushButton {
+        background-color: #9C27B0;
+        color: white;
+        padding: 5px 15px;
+        border-radius: 4px;
+        height: 25px;
+    }
+    QPushButton:hover {
+        background-color: #7B1FA2;
+    }
+"""
+
+_RESET_DB_BTN_QSS = """
+    QPushButton {
+        background-color: #ffaaaa;
+        color: #aa0000;
+        padding: 5px 15px;
+        border-radius: 4px;
+        font-weight: bold;
+        height: 25px;
+    }
+    QPushButton:hover {
+        background-color: #ff8888;
+    }
+"""
+
+_TABLE_CONTAINER_QSS = """
+    QFrame {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 8px;
+        padding: 15px;
+    }
+"""
+
+_TEMPLATES_TABLE_QSS = """
+    QTableView {
+        border: none;
+        gridline-color: #e0e0e0;
+        selection-background-color: #f0f7ff;
+        selection-color: #000;
+        color: #000000; /* Ensuring text is black */
+        background-color: white;
+    }
+    QHeaderView::section {
+        background-color: #f8f8f8;
+        padding: 8px;
+        border: none;
+        border-bottom: 2px solid #e0e0e0;
+        font-weight: bold;
+        color: #333;
+        font-size: 13px;
+    }
+"""
+
+
+# Shared by every cell of the templates table instead of a new brush/alignment value per data() call
+_BLACK_BRUSH = QBrush(Qt.black)
+_CENTER_ALIGN = int(Qt.AlignCenter)
+
+
+class _TemplatesTableModel(QAbstractTableModel):
+    """Read-only model for the templates table, kept as one list per column
+
+    With no templates it exposes a single placeholder row whose first cell carries the message.
+    """
+
+    _HEADERS = ("Name", "Description", "Type", "Created Date/Time", "Actions")
+    _EMPTY_MESSAGE = "No templates found. Create your first template!"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._names = []
+        self._descriptions = []
+        self._types = []
+        self._dates = []
+        # Display columns in table order; the Actions column has no text
+        self._columns = (self._names, self._descriptions, self._types, self._dates)
+
+    def set_templates(self, templates):
+        """Replace the rows with templates as returned by get_all_templates, in one model reset"""
+        self.beginResetModel()
+        self._ids[:] = [template["id"] for template in templates]
+        self._names[:] = [template["name"] for template in templates]
+        self._descriptions[:] = [template["description"] or "" for template in templates]
+        self._types[:] = [
+            # Type with page count for multi-page templates
+            f"Multi-page ({template.get('page_count', 1)} pages)" if template["template_type"] == "multi"
+            else "Single-page"
+            for template in templates
+        ]
+        # Created date - Format for better readability with 12-hour time format
+        self._dates[:] = [_format_creation_date(template["creation_date"]) for template in templates]
+        self.endResetModel()
+
+    def is_empty(self):
+        return not self._ids
+
+    def template_id(self, row):
+        """Template ID shown on row, or None for rows without a template"""
+        if 0 <= row < len(self._ids):
+            return self._ids[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._ids) or 1
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if not self._ids:
+            if col == 0:
+                if role == Qt.DisplayRole:
+                    return self._EMPTY_MESSAGE
+                if role == Qt.TextAlignmentRole:
+                    return _CENTER_ALIGN
+            if role == Qt.ForegroundRole:
+                return _BLACK_BRUSH
+            return None
+
+        if role == Qt.DisplayRole:
+            return self._columns[col][row] if col < len(self._columns) else None
+        if role == Qt.UserRole:
+            # Every cell carries the template ID so rows resolve without a database query
+            return self._ids[row]
+        if role == Qt.ForegroundRole:
+            return _BLACK_BRUSH
+        if role == Qt.TextAlignmentRole and col == 3:
+            return _CENTER_ALIGN
+        if role == Qt.ToolTipRole:
+            if col in (0, 1):
+                return self._columns[col][row]
+            if col == 4:
+                return f"Apply, edit or delete template: {self._names[row]}"
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class _TemplateRowDelegate(QStyledItemDelegate):
+    """Paints templates table cell backgrounds directly instead of through ::item stylesheet rules"""
+
+    # [selected][odd row]
+    _BRUSHES = (
+        (QBrush(QColor("white")), QBrush(QColor("#f9f9f9"))),
+        (QBrush(QColor("#f0f7ff")), QBrush(QColor("#f0f7ff"))),
+    )
+    _PADDING = 8
+
+    def paint(self, painter, option, index):
+        selected = bool(option.state & QStyle.State_Selected)
+        painter.fillRect(option.rect, self._BRUSHES[selected][index.row() & 1])
+
+        # Background is already painted; let the base class draw only the text, black on any row
+        opt = QStyleOptionViewItem(option)
+        opt.state &= ~QStyle.State_Selected
+        opt.features &= ~QStyleOptionViewItem.Alternate
+        opt.rect = option.rect.adjusted(self._PADDING, 0, -self._PADDING, 0)
+        super().paint(painter, opt, index)
+
+
+class _TemplateActionDelegate(_TemplateRowDelegate):
+    """Paints the Apply/Edit/Delete buttons of the templates table and turns clicks on them into actions
+
+    One delegate serves every row, so rows carry no widgets, layouts or signal connections of their own.
+    """
+
+    # (label, colour, hover colour)
+    _BUTTONS = (
+        ("Apply", QColor("#4169E1"), QColor("#3158D3")),
+        ("Edit", QColor("#FF9800"), QColor("#F57C00")),
+        ("Delete", QColor("#D32F2F"), QColor("#B71C1C")),
+    )
+    _BUTTON_WIDTH = 82
+    _BUTTON_HEIGHT = 28
+    _SPACING = 8
+
+    def __init__(self, view, actions):
+        super().__init__(view)
+        self._view = view
+        # One callable per button, each taking the template ID of the clicked row
+        self._actions = actions
+
+    def _button_rects(self, rect):
+        count = len(self._BUTTONS)
+        total_width = count * self._BUTTON_WIDTH + (count - 1) * self._SPACING
+        x = rect.x() + (rect.width() - total_width) // 2
+        y = rect.y() + (rect.height() - self._BUTTON_HEIGHT) // 2
+        step = self._BUTTON_WIDTH + self._SPACING
+        return [QRect(x + i * step, y, self._BUTTON_WIDTH, self._BUTTON_HEIGHT) for i in range(count)]
+
+    def _button_at(self, rect, pos):
+        for i, button_rect in enumerate(self._button_rects(rect)):
+            if button_rect.contains(pos):
+                return i
+        return None
+
+    def paint(self, painter, option, index):
+        selected = bool(option.state & QStyle.State_Selected)
+        painter.fillRect(option.rect, self._BRUSHES[selected][index.row() & 1])
+
+        # Rows without a template (the "no templates" placeholder) get no buttons
+        if index.data(Qt.UserRole) is None:
+            return
+
+        hovered = None
+        if option.state & QStyle.State_MouseOver:
+            hovered = self._button_at(option.rect, self._view.viewport().mapFromGlobal(QCursor.pos()))
+
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(font)
+        for i, ((label, colour, hover_colour), rect) in enumerate(zip(self._BUTTONS, self._button_rects(option.rect))):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(hover_colour if i == hovered else colour)
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(Qt.white)
+            painter.drawText(rect, Qt.AlignCenter, label)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        count = len(self._BUTTONS)
+        width = count * self._BUTTON_WIDTH + (count - 1) * self._SPACING + 2 * self._PADDING
+        return QSize(width, self._BUTTON_HEIGHT + self._PADDING)
+
+    def editorEvent(self, event, model, option, index):
+        template_id = index.data(Qt.UserRole)
+        if template_id is None:
+            return False
+
+        event_type = event.type()
+        if event_type == QEvent.MouseMove:
+            # Repaint so the hover colour follows the pointer from button to button
+            self._view.viewport().update(option.rect)
+        elif event_type == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            button = self._button_at(option.rect, event.position().toPoint())
+            if button is not None:
+                self._actions[button](template_id)
+                return True
+        return False
+
+
+class _DbWorkerSignals(QObject):
+    """Signals a _DbWorker uses to report back to the UI thread"""
+
+    progress = Signal(int)
+    done = Signal(object)
+    failed = Signal(object)
+
+
+class _DbWorker(QRunnable):
+    """Runs a database call on the thread pool
+
+    sqlite3 connections are bound to the thread that opened them, so the worker opens
+    its own InvoiceDatabase on db_path and calls fn(db, *args); with report_progress,
+    fn(db, report_progress, *args) can emit progress values through signals.progress.
+    The return value is delivered through signals.done.
+    """
+
+    def __init__(self, db_path, fn, *args, report_progress=False):
+        super().__init__()
+        self.db_path = db_path
+        self.fn = fn
+        self.args = args
+        self.report_progress = report_progress
+        self.signals = _DbWorkerSignals()
+
+    def run(self):
+        db = None
+        try:
+            db = InvoiceDatabase(self.db_path)
+            if self.report_progress:
+                result = self.fn(db, self.signals.progress.emit, *self.args)
+            else:
+                result = self.fn(db, *self.args)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.done.emit(result)
+        finally:
+            if db is not None:
+                db.close()
+
+
+_APP = None
+
+
+def _ensure_app():
+    """Return the QApplication, creating it the first time if none exists yet"""
+    global _APP
+    if _APP is None:
+        _APP = QApplication.instance()
+        if _APP is None:
+            print("Creating QApplication instance because none exists")
+            _APP = QApplication([])
+    return _APP
+
+
 class TemplateManager(QWidget):
     """Widget for managing invoice templates"""
 
@@ -2646,11 +3379,7 @@ class TemplateManager(QWidget):
 
     def __init__(self, pdf_processor=None):
         # Ensure QApplication exists before creating widgets
-        if QApplication.instance() is None:
-            print("Creating QApplication instance because none exists")
-            self.app = QApplication([])
-        else:
-            self.app = QApplication.instance()
+        self.app = _ensure_app()
 
         super().__init__()
         self.pdf_processor = pdf_processor
@@ -2663,25 +3392,25 @@ class TemplateManager(QWidget):
             'summary': []
         }
 
+        # Message boxes shown via open() stay referenced here until they finish
+        self._active_dialogs = []
+
+        # Templates last shown in the table and the database version they were read at
+        self._templates_cache = None
+        self._templates_cache_version = None
+        # Fully loaded templates fetched since then, keyed by ID; dropped whenever the version changes
+        self._templates_by_id = {}
+
+        # apply_template's preview box, built on first use, and what to run when it closes
+        self._preview_box = None
+        self._preview_callback = None
+
+        # Thread pool workers for the latest save and delete, kept referenced while they run
+        self._save_worker = None
+        self._delete_worker = None
+
         # Set global stylesheet to ensure all text is visible
-        self.setStyleSheet("""
-            QWidget {
-                color: black;
-                background-color: white;
-            }
-            QLabel {
-                color: #333333;
-            }
-            QTableWidgetItem {
-                color: black;
-            }
-            QMessageBox {
-                color: black;
-            }
-            QMessageBox QLabel {
-                color: black;
-            }
-        """)
+        self.setStyleSheet(_MANAGER_QSS)
 
         self.initUI()
         self.load_templates()
@@ -2703,35 +3432,13 @@ class TemplateManager(QWidget):
 
         back_btn = QPushButton("← Back")
         back_btn.clicked.connect(self.go_back.emit)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ffffff;
-                color: #000000;
-                padding: 5px 15px;
-                border-radius: 4px;
-                height: 25px;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-        """)
+        back_btn.setStyleSheet(_BACK_BTN_QSS)
         nav_layout.addWidget(back_btn)
 
         # Refresh List button next to Back button
         refresh_btn = QPushButton("Refresh List")
         refresh_btn.clicked.connect(self.load_templates)
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 5px 15px;
-                border-radius: 4px;
-                height: 25px;
-            }
-            QPushButton:hover {
-                background-color: #3E8E41;
-            }
-        """)
+        refresh_btn.setStyleSheet(_REFRESH_BTN_QSS)
         nav_layout.addWidget(refresh_btn)
 
         nav_layout.addStretch()
@@ -2739,70 +3446,25 @@ class TemplateManager(QWidget):
         # Add Template button
         add_btn = QPushButton("Add Template")
         add_btn.clicked.connect(self.add_template)
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4169E1;
-                color: white;
-                padding: 5px 15px;
-                border-radius: 4px;
-                height: 25px;
-            }
-            QPushButton:hover {
-                background-color: #3158D3;
-            }
-        """)
+        add_btn.setStyleSheet(_ADD_BTN_QSS)
         nav_layout.addWidget(add_btn)
 
         # Export Template button
         export_btn = QPushButton("Export Template")
         export_btn.clicked.connect(self.export_template)
-        export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                padding: 5px 15px;
-                border-radius: 4px;
-                height: 25px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-        """)
+        export_btn.setStyleSheet(_EXPORT_BTN_QSS)
         nav_layout.addWidget(export_btn)
 
         # Import Template button
         import_btn = QPushButton("Import Template")
         import_btn.clicked.connect(self.import_template)
-        import_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9C27B0;
-                color: white;
-                padding: 5px 15px;
-                border-radius: 4px;
-                height: 25px;
-            }
-            QPushButton:hover {
-                background-color: #7B1FA2;
-            }
-        """)
+        import_btn.setStyleSheet(_IMPORT_BTN_QSS)
         nav_layout.addWidget(import_btn)
 
         # Add Reset Database button
         reset_db_btn = QPushButton("Reset Database")
         reset_db_btn.clicked.connect(self.reset_database)
-        reset_db_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ffaaaa;
-                color: #aa0000;
-                padding: 5px 15px;
-                border-radius: 4px;
-                font-weight: bold;
-                height: 25px;
-            }
-            QPushButton:hover {
-                background-color: #ff8888;
-            }
-        """)
+        reset_db_btn.setStyleSheet(_RESET_DB_BTN_QSS)
         nav_layout.addWidget(reset_db_btn)
 
         layout.addLayout(nav_layout)
@@ -2819,14 +3481,7 @@ class TemplateManager(QWidget):
         # Templates table
         table_container = QFrame()
         table_container.setFrameShape(QFrame.StyledPanel)
-        table_container.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        table_container.setStyleSheet(_TABLE_CONTAINER_QSS)
 
         table_layout = QVBoxLayout(table_container)
         table_layout.setContentsMargins(10, 10, 10, 10)
@@ -2837,9 +3492,9 @@ class TemplateManager(QWidget):
         templates_header.setStyleSheet("color: #333; margin-bottom: 10px;")
         table_layout.addWidget(templates_header)
 
-        self.templates_table = QTableWidget()
-        self.templates_table.setColumnCount(5)
-        self.templates_table.setHorizontalHeaderLabels(["Name", "Description", "Type", "Created Date/Time", "Actions"])
+        self.templates_model = _TemplatesTableModel(self)
+        self.templates_table = QTableView()
+        self.templates_table.setModel(self.templates_model)
         self.templates_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.templates_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.templates_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
@@ -2848,52 +3503,19 @@ class TemplateManager(QWidget):
 
         # Set a minimum width for the date/time column to ensure it can display the full date and time
         self.templates_table.setColumnWidth(3, 200)
-        self.templates_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.templates_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.templates_table.setSelectionBehavior(QTableView.SelectRows)
+        self.templates_table.setEditTriggers(QTableView.NoEditTriggers)
         self.templates_table.setAlternatingRowColors(True)
         self.templates_table.verticalHeader().setVisible(False)
+        # Increased row height for better button display
+        self.templates_table.verticalHeader().setDefaultSectionSize(50)
         self.templates_table.setShowGrid(True)
-        self.templates_table.setStyleSheet("""
-            QTableWidget {
-                border: none;
-                gridline-color: #e0e0e0;
-                selection-background-color: #f0f7ff;
-                selection-color: #000;
-                color: #000000; /* Ensuring text is black */
-                background-color: white;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #f0f0f0;
-                color: #000000; /* Ensuring text is black */
-                background-color: white;
-            }
-            QTableWidget::item:selected {
-                background-color: #f0f7ff;
-                color: #000000; /* Ensuring selected text is black */
-            }
-            QHeaderView::section {
-                background-color: #f8f8f8;
-                padding: 8px;
-                border: none;
-                border-bottom: 2px solid #e0e0e0;
-                font-weight: bold;
-                color: #333;
-                font-size: 13px;
-            }
-            QTableWidget::item:alternate {
-                background-color: #f9f9f9;
-                color: #000000; /* Ensuring text is black */
-            }
-            /* Fix for action buttons in table cells */
-            QTableWidget QWidget {
-                background-color: transparent;
-            }
-            QTableWidget::item:alternate:selected {
-                background-color: #f0f7ff;
-                color: #000000; /* Ensuring selected text is black */
-            }
-        """)
+        self.templates_table.setStyleSheet(_TEMPLATES_TABLE_QSS)
+        self.templates_table.setItemDelegate(_TemplateRowDelegate(self.templates_table))
+        # Row actions are painted and hit-tested by one delegate instead of per-row button widgets
+        self.templates_table.setItemDelegateForColumn(4, _TemplateActionDelegate(
+            self.templates_table, (self.apply_template, self.edit_template, self.delete_template)))
+        self.templates_table.setMouseTracking(True)
 
         table_layout.addWidget(self.templates_table)
 
@@ -2905,12 +3527,8 @@ class TemplateManager(QWidget):
 
     def get_template_id_from_row(self, row):
         """Get the template ID for the given row"""
-        if 0 <= row < self.templates_table.rowCount():
-            # Assuming template ID is stored in the table or can be retrieved from the database
-            templates = self.db.get_all_templates()
-            if row < len(templates):
-                return templates[row]["id"]
-        return None
+        # The template IDs are held by the table model, so no database query is needed
+        return self.templates_model.template_id(row)
 
     def show_context_menu(self, position):
         """Show context menu for the templates table"""
@@ -2926,14 +3544,66 @@ class TemplateManager(QWidget):
         edit_action.setEnabled(row >= 0)
         delete_action.setEnabled(row >= 0)
 
-        # Connect actions to slots with lambda functions that ignore the 'checked' parameter
-        if row >= 0:
-            template_id = self.get_template_id_from_row(row)
-            if template_id:
-                edit_action.triggered.connect(lambda checked=False: self.edit_template(template_id))
-                delete_action.triggered.connect(lambda checked=False: self.delete_template(template_id))
+        template_id = self.get_template_id_from_row(row) if row >= 0 else None
+
+        # Dispatch on the chosen action rather than wiring a fresh slot per menu open;
+        # this also sidesteps the 'checked' argument triggered() would pass
+        chosen = menu.exec_(self.templates_table.mapToGlobal(position))
+        if not template_id:
+            return
+        if chosen is edit_action:
+            self.edit_template(template_id)
+        elif chosen is delete_action:
+            # Delete the whole selection when the clicked row is part of it
+            selected_rows = [index.row() for index in self.templates_table.selectionModel().selectedRows()]
+            if row in selected_rows and len(selected_rows) > 1:
+                self._delete_template_ids([self.get_template_id_from_row(r) for r in selected_rows])
+            else:
+                self.delete_template(template_id)
+
+    def _get_template(self, template_id):
+        """
+        Fetch a fully loaded template, reusing the one read since the table was last reloaded.
+        Returns a deep copy the caller may modify freely, or None if there is no such template.
+        """
+        template = self._templates_by_id.get(template_id)
+        if template is None:
+            template = self.db.get_template(template_id=template_id)
+            if template is None:
+                return None
+            self._templates_by_id[template_id] = template
+        return copy.deepcopy(template)
+
+    def _show_error(self, *, title, text, intro, detail, footer, heading=None, icon=QMessageBox.Critical):
+        """Open an error dialog whose body is _ERROR_HTML; heading defaults to text"""
+        error_dialog = QMessageBox(self)
+        error_dialog.setWindowTitle(title)
+        error_dialog.setText(text)
+        error_dialog.setInformativeText(_ERROR_HTML.format_map({
+            'heading': text if heading is None else heading,
+            'intro': intro,
+            'detail': detail,
+            'footer': footer,
+        }))
+        error_dialog.setIcon(icon)
+        error_dialog.setStyleSheet("QLabel { color: black; }")
+        self._open_dialog(error_dialog)
+
+    def _open_dialog(self, dialog, on_finished=None):
+        """Show a dialog window-modally with open() rather than exec()'s nested event loop
+
+        on_finished, if given, is called with the dialog result once it closes.
+        """
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        self._active_dialogs.append(dialog)
+
+        def finished(result):
+            self._active_dialogs.remove(dialog)
+            if on_finished is not None:
+                on_finished(result)
 
-        menu.exec_(self.templates_table.mapToGlobal(position))
+        dialog.finished.connect(finished)
+        dialog.open()
 
     def edit_template(self, template_id):
         """Edit the selected template settings and configuration"""
@@ -2946,7 +3616,7 @@ class TemplateManager(QWidget):
                 msg_box.setText("The selected template could not be found.")
                 msg_box.setIcon(QMessageBox.Warning)
                 msg_box.setStyleSheet("QLabel { color: black; }")
-                msg_box.exec()
+                self._open_dialog(msg_box)
                 return
 
             # Show edit dialog
@@ -2968,15 +3638,89 @@ class TemplateManager(QWidget):
                     new_name = updated_data["name"]
                     new_description = updated_data["description"]
 
+                    # Per-page {section: count} summaries, shared by the save log and the success message
+                    page_region_counts = [
+                        {section: len(rects) for section, rects in page_region.items()}
+                        for page_region in updated_data.get("page_regions", [])
+                    ]
+                    page_column_counts = [
+                        {section: len(lines) for section, lines in page_column_line.items()}
+                        for page_column_line in updated_data.get("page_column_lines", [])
+                    ]
+
                     if not new_name:
                         msg_box = QMessageBox(self)
                         msg_box.setWindowTitle("Invalid Name")
                         msg_box.setText("Please provide a valid template name.")
                         msg_box.setIcon(QMessageBox.Warning)
                         msg_box.setStyleSheet("QLabel { color: black; }")
-                        msg_box.exec()
+                        self._open_dialog(msg_box)
                         return
 
+                    # Build the success message before anything is saved, so a malformed
+                    # config is reported here rather than after the save has gone through
+
+                    # Add regions information based on template type
+                    region_parts = []
+                    if updated_data["template_type"] == "multi":
+                        # For multi-page templates, show page-specific regions
+                        for page_idx, region_counts in enumerate(page_region_counts[:_SUMMARY_LIMIT]):
+                            region_parts.append(f"<li><b>Page {page_idx + 1}:</b><ul>")
+                            for section, count in region_counts.items():
+                                region_parts.append(f"<li>{section.title()}: {count} table(s)</li>")
+                            region_parts.append("</ul></li>")
+                        if len(page_region_counts) > _SUMMARY_LIMIT:
+                            region_parts.append(f"<li>… and {len(page_region_counts) - _SUMMARY_LIMIT} more pages</li>")
+                    else:
+                        # For single-page templates, use the regular regions
+                        for section, rects in updated_data["regions"].items():
+                            region_parts.append(f"<li>{section.title()}: {len(rects)} table(s)</li>")
+
+                    # Add column lines information based on template type
+                    column_parts = []
+                    if updated_data["template_type"] == "multi":
+                        # For multi-page templates, show page-specific column lines
+                        for page_idx, column_counts in enumerate(page_column_counts[:_SUMMARY_LIMIT]):
+                            column_parts.append(f"<li><b>Page {page_idx + 1}:</b><ul>")
+                            for section, count in column_counts.items():
+                                column_parts.append(f"<li>{section.title()}: {count} line(s)</li>")
+                            column_parts.append("</ul></li>")
+                        if len(page_column_counts) > _SUMMARY_LIMIT:
+                            column_parts.append(f"<li>… and {len(page_column_counts) - _SUMMARY_LIMIT} more pages</li>")
+                    else:
+                        # For single-page templates, use the regular column lines
+                        for section, lines in updated_data["column_lines"].items():
+                            column_parts.append(f"<li>{section.title()}: {len(lines)} line(s)</li>")
+
+                    # Add regex pattern information if available
+                    regex_parts = []
+                    if 'regex_patterns' in updated_data['config']:
+                        regex_parts.append("<p><b>Regex Patterns:</b></p><ul>")
+                        for section, patterns in updated_data['config']['regex_patterns'].items():
+                            pattern_list = []
+                            for pattern_type, pattern in patterns.items():
+                                if pattern:
+                                    pattern_list.append(f"{pattern_type}: '{pattern}'")
+                            if len(pattern_list) > _SUMMARY_LIMIT:
+                                hidden = len(pattern_list) - _SUMMARY_LIMIT
+                                pattern_list = pattern_list[:_SUMMARY_LIMIT]
+                                pattern_list.append(f"… +{hidden} more")
+                            if pattern_list:
+                                regex_parts.append(f"<li>{section.title()}: {', '.join(pattern_list)}</li>")
+                        regex_parts.append("</ul>")
+
+                    success_message = _UPDATE_SUCCESS_HTML.format_map({
+                        'name': new_name,
+                        'description': new_description or "No description",
+                        'template_type': updated_data["template_type"].title(),
+                        'multi_table_mode': "Enabled" if updated_data["config"]["multi_table_mode"] else "Disabled",
+                        'json_template': (_JSON_INCLUDED_HTML if updated_data.get("json_template")
+                                          else _JSON_NOT_INCLUDED_HTML),
+                        'regions_html': "".join(region_parts),
+                        'column_lines_html': "".join(column_parts),
+                        'regex_html': "".join(regex_parts),
+                    })
+
                     # Create a progress dialog instead of a message box
                     progress = QProgressDialog("Updating template...", None, 0, 100, self)
                     progress.setWindowTitle("Updating Template")
@@ -2990,32 +3734,27 @@ class TemplateManager(QWidget):
                     progress.setStyleSheet("QLabel { color: black; }")
                     progress.show()
 
-                    # Process events to ensure the dialog is displayed
-                    QApplication.processEvents()
+                    old_name = template["name"]
 
-                    try:
+                    def save_changes(db, report_progress):
+                        """Write the edited template; runs on a pool thread with its own connection"""
                         # Update progress to show we've started
-                        progress.setValue(10)
-                        QApplication.processEvents()
+                        report_progress(10)
 
                         # Debug output
                         print(f"\nAttempting to save template: {new_name}")
                         print(f"Template regions: {len(updated_data['regions'].get('header', []))} header, {len(updated_data['regions'].get('items', []))} items, {len(updated_data['regions'].get('summary', []))} summary")
                         print(f"Config has regex_patterns: {'regex_patterns' in updated_data['config']}")
 
-                        # Update progress
-                        progress.setValue(30)
-                        QApplication.processEvents()
+                        report_progress(30)
 
                         # Check if new name exists (if changed)
-                        if new_name != template["name"]:
-                            # Need to delete old template and create new one with new name
-                            print(f"Name changed from '{template['name']}' to '{new_name}', deleting old template")
-                            self.db.delete_template(template_id=template_id)
+                        if new_name != old_name:
+                            # Need to replace the old template with a new one under the new name;
+                            # save_template_replacing deletes and inserts in one transaction
+                            print(f"Name changed from '{old_name}' to '{new_name}', replacing old template")
 
-                            # Update progress
-                            progress.setValue(50)
-                            QApplication.processEvents()
+                            report_progress(50)
 
                             # Save the new template with appropriate data based on template type
                             if updated_data["template_type"] == "multi":
@@ -3024,21 +3763,18 @@ class TemplateManager(QWidget):
                                 print(f"- Page count: {updated_data['page_count']}")
 
                                 # Log regions data
-                                page_regions = updated_data.get("page_regions", [])
-                                print(f"- Page regions: {len(page_regions)} pages")
-                                for i, page_region in enumerate(page_regions):
-                                    region_counts = {section: len(rects) for section, rects in page_region.items()}
+                                print(f"- Page regions: {len(page_region_counts)} pages")
+                                for i, region_counts in enumerate(page_region_counts):
                                     print(f"  - Page {i+1}: {region_counts}")
 
                                 # Log column lines data
-                                page_column_lines = updated_data.get("page_column_lines", [])
-                                print(f"- Page column lines: {len(page_column_lines)} pages")
-                                for i, page_column_line in enumerate(page_column_lines):
-                                    column_counts = {section: len(lines) for section, lines in page_column_line.items()}
+                                print(f"- Page column lines: {len(page_column_counts)} pages")
+                                for i, column_counts in enumerate(page_column_counts):
                                     print(f"  - Page {i+1}: {column_counts}")
 
                                 # Create template with page-specific data
-                                new_id = self.db.save_template(
+                                new_id = db.save_template_replacing(
+                                    template_id,
                                     name=new_name,
                                     description=new_description,
                                     config=updated_data["config"],
@@ -3062,30 +3798,28 @@ class TemplateManager(QWidget):
                                 column_counts = {section: len(lines) for section, lines in updated_data["column_lines"].items()}
                                 print(f"- Column lines: {column_counts}")
 
-                            new_id = self.db.save_template(
-                                name=new_name,
-                                description=new_description,
-                                config=updated_data["config"],
-                                template_type=updated_data["template_type"],
-                                json_template=updated_data.get("json_template"),
-                                drawing_regions=updated_data.get("drawing_regions"),
-                                drawing_column_lines=updated_data.get("drawing_column_lines"),
-                                extraction_regions=updated_data.get("extraction_regions"),
-                                extraction_column_lines=updated_data.get("extraction_column_lines")
-                            )
-                            print(f"Created new template with ID: {new_id}")
+                                new_id = db.save_template_replacing(
+                                    template_id,
+                                    name=new_name,
+                                    description=new_description,
+                                    config=updated_data["config"],
+                                    template_type=updated_data["template_type"],
+                                    json_template=updated_data.get("json_template"),
+                                    drawing_regions=updated_data.get("drawing_regions"),
+                                    drawing_column_lines=updated_data.get("drawing_column_lines"),
+                                    extraction_regions=updated_data.get("extraction_regions"),
+                                    extraction_column_lines=updated_data.get("extraction_column_lines")
+                                )
                         else:
                             # Just update the template data
                             print(f"Updating existing template with ID: {template_id}")
 
-                            # Update progress
-                            progress.setValue(50)
-                            QApplication.processEvents()
+                            report_progress(50)
 
                             # Update the template with dual coordinate data
                             if updated_data["template_type"] == "multi":
                                 # For multi-page templates, include page-specific dual coordinate data
-                                self.db.save_template(
+                                new_id = db.save_template(
                                     name=new_name,
                                     description=new_description,
                                     regions={'header': [], 'items': [], 'summary': []},  # Legacy - empty
@@ -3104,7 +3838,7 @@ class TemplateManager(QWidget):
                                 )
                             else:
                                 # For single-page templates, use dual coordinate data
-                                self.db.save_template(
+                                new_id = db.save_template(
                                     name=new_name,
                                     description=new_description,
                                     config=updated_data["config"],
@@ -3116,70 +3850,17 @@ class TemplateManager(QWidget):
                                     extraction_column_lines=updated_data.get("extraction_column_lines")
                                 )
 
+                        # The save helpers roll back and return None rather than raising
+                        if new_id is None:
+                            raise sqlite3.Error(f"The template '{new_name}' could not be saved; no changes were made.")
+                        print(f"Saved template with ID: {new_id}")
+
                         # Update progress to completion
-                        progress.setValue(100)
-                        QApplication.processEvents()
+                        report_progress(100)
 
+                    def on_saved(_result):
                         # Make sure dialog is closed
                         progress.close()
-                        QApplication.processEvents()
-
-                        # Show success message with details
-                        success_message = f"""
-<h3>Template Updated Successfully</h3>
-<p>The template has been updated with the following information:</p>
-<ul>
-    <li><b>Name:</b> {new_name}</li>
-    <li><b>Description:</b> {new_description or "No description"}</li>
-    <li><b>Type:</b> {updated_data["template_type"].title()}</li>
-    <li><b>Multi-table Mode:</b> {"Enabled" if updated_data["config"]["multi_table_mode"] else "Disabled"}</li>
-    <li><b>JSON Template:</b> {"<span style='color: green;'>✓ Included</span>" if updated_data.get("json_template") else "<span style='color: gray;'>Not included</span>"}</li>
-</ul>
-"""
-
-                        # Add regions information based on template type
-                        success_message += "<p><b>Regions:</b></p><ul>"
-                        if updated_data["template_type"] == "multi":
-                            # For multi-page templates, show page-specific regions
-                            page_regions = updated_data.get("page_regions", [])
-                            for page_idx, page_region in enumerate(page_regions):
-                                success_message += f"<li><b>Page {page_idx + 1}:</b><ul>"
-                                for section, rects in page_region.items():
-                                    success_message += f"<li>{section.title()}: {len(rects)} table(s)</li>"
-                                success_message += "</ul></li>"
-                        else:
-                            # For single-page templates, use the regular regions
-                            for section, rects in updated_data["regions"].items():
-                                success_message += f"<li>{section.title()}: {len(rects)} table(s)</li>"
-                        success_message += "</ul>"
-
-                        # Add column lines information based on template type
-                        success_message += "<p><b>Column Lines:</b></p><ul>"
-                        if updated_data["template_type"] == "multi":
-                            # For multi-page templates, show page-specific column lines
-                            page_column_lines = updated_data.get("page_column_lines", [])
-                            for page_idx, page_column_line in enumerate(page_column_lines):
-                                success_message += f"<li><b>Page {page_idx + 1}:</b><ul>"
-                                for section, lines in page_column_line.items():
-                                    success_message += f"<li>{section.title()}: {len(lines)} line(s)</li>"
-                                success_message += "</ul></li>"
-                        else:
-                            # For single-page templates, use the regular column lines
-                            for section, lines in updated_data["column_lines"].items():
-                                success_message += f"<li>{section.title()}: {len(lines)} line(s)</li>"
-                            success_message += "</ul>"
-
-                        # Add regex pattern information if available
-                        if 'regex_patterns' in updated_data['config']:
-                            success_message += "<p><b>Regex Patterns:</b></p><ul>"
-                            for section, patterns in updated_data['config']['regex_patterns'].items():
-                                pattern_list = []
-                                for pattern_type, pattern in patterns.items():
-                                    if pattern:
-                                        pattern_list.append(f"{pattern_type}: '{pattern}'")
-                                if pattern_list:
-                                    success_message += f"<li>{section.title()}: {', '.join(pattern_list)}</li>"
-                            success_message += "</ul>"
 
                         success_msg = QMessageBox(self)
                         success_msg.setWindowTitle("Template Updated")
@@ -3187,157 +3868,135 @@ class TemplateManager(QWidget):
                         success_msg.setInformativeText(success_message)
                         success_msg.setIcon(QMessageBox.Information)
                         success_msg.setStyleSheet("QLabel { color: black; }")
-                        success_msg.exec()
+                        self._open_dialog(success_msg)
 
-                        # Refresh the template list
+                        # Refresh the template list; the save is known to have changed it
+                        self._invalidate_templates_cache()
                         self.load_templates()
 
-                    except sqlite3.Error as db_e:
-                        # Handle database-specific errors
+                    def on_failed(error):
+                        # Close the progress dialog before reporting the error
                         progress.close()
-                        QApplication.processEvents()
 
-                        error_message = f"""
-<h3>Database Error</h3>
-<p>A database error occurred while trying to save the template:</p>
-<p style='color: #D32F2F;'>{str(db_e)}</p>
-<p>This might be due to database corruption, permissions issues, or disk space limitations.</p>
-"""
-                        error_dialog = QMessageBox(self)
-                        error_dialog.setWindowTitle("Database Error")
-                        error_dialog.setText("Error Saving Template")
-                        error_dialog.setInformativeText(error_message)
-                        error_dialog.setIcon(QMessageBox.Critical)
-                        error_dialog.setStyleSheet("QLabel { color: black; }")
-                        error_dialog.exec()
-
-                        print(f"Database error in edit_template: {str(db_e)}")
-                        import traceback
-                        traceback.print_exc()
-
-                    except Exception as inner_e:
-                        # Close the progress dialog for any other error
-                        progress.close()
-                        QApplication.processEvents()
+                        if isinstance(error, sqlite3.Error):
+                            self._show_error(
+                                title="Database Error",
+                                text="Error Saving Template",
+                                heading="Database Error",
+                                intro="A database error occurred while trying to save the template:",
+                                detail=str(error),
+                                footer="This might be due to database corruption, permissions issues, or disk space limitations.",
+                            )
 
-                        error_message = f"""
-<h3>Error Saving Template</h3>
-<p>An error occurred while saving the template:</p>
-<p style='color: #D32F2F;'>{str(inner_e)}</p>
-<p>The template may not have been updated properly.</p>
-"""
-                        error_dialog = QMessageBox(self)
-                        error_dialog.setWindowTitle("Save Error")
-                        error_dialog.setText("Error Saving Template")
-                        error_dialog.setInformativeText(error_message)
-                        error_dialog.setIcon(QMessageBox.Critical)
-                        error_dialog.setStyleSheet("QLabel { color: black; }")
-                        error_dialog.exec()
-
-                        print(f"Error in edit_template save operation: {str(inner_e)}")
-                        import traceback
-                        traceback.print_exc()
-
-                    finally:
-                        # Make sure progress dialog is closed in all cases
-                        try:
-                            progress.close()
-                            QApplication.processEvents()
-                        except Exception as close_e:
-                            print(f"Error closing progress dialog: {str(close_e)}")
+                            print(f"Database error in edit_template: {str(error)}")
+                        else:
+                            self._show_error(
+                                title="Save Error",
+                                text="Error Saving Template",
+                                intro="An error occurred while saving the template:",
+                                detail=str(error),
+                                footer="The template may not have been updated properly.",
+                            )
+
+                            print(f"Error in edit_template save operation: {str(error)}")
+
+                        traceback.print_exception(type(error), error, error.__traceback__)
+
+                    # Save off the UI thread; progress and the outcome come back as queued signals
+                    worker = _DbWorker(self.db.db_path, save_changes, report_progress=True)
+                    worker.signals.progress.connect(progress.setValue, Qt.QueuedConnection)
+                    worker.signals.done.connect(on_saved, Qt.QueuedConnection)
+                    worker.signals.failed.connect(on_failed, Qt.QueuedConnection)
+                    self._save_worker = worker
+                    QThreadPool.globalInstance().start(worker)
 
                 except AttributeError as attr_e:
-                    error_message = f"""
-<h3>Template Update Error</h3>
-<p>There was a problem accessing template data:</p>
-<p style='color: #D32F2F;'>{str(attr_e)}</p>
-<p>This could be due to missing or corrupted template information.</p>
-"""
-                    error_dialog = QMessageBox(self)
-                    error_dialog.setWindowTitle("Error")
-                    error_dialog.setText("Error Updating Template")
-                    error_dialog.setInformativeText(error_message)
-                    error_dialog.setIcon(QMessageBox.Critical)
-                    error_dialog.setStyleSheet("QLabel { color: black; }")
-                    error_dialog.exec()
+                    self._show_error(
+                        title="Error",
+                        text="Error Updating Template",
+                        heading="Template Update Error",
+                        intro="There was a problem accessing template data:",
+                        detail=str(attr_e),
+                        footer="This could be due to missing or corrupted template information.",
+                    )
 
                     print(f"AttributeError in edit_template: {str(attr_e)}")
-                    import traceback
                     traceback.print_exc()
 
                 except ValueError as val_e:
-                    error_message = f"""
-<h3>Template Value Error</h3>
-<p>There was a problem with the template data values:</p>
-<p style='color: #D32F2F;'>{str(val_e)}</p>
-<p>Please check that all fields contain valid information.</p>
-"""
-                    error_dialog = QMessageBox(self)
-                    error_dialog.setWindowTitle("Error")
-                    error_dialog.setText("Error Updating Template")
-                    error_dialog.setInformativeText(error_message)
-                    error_dialog.setIcon(QMessageBox.Critical)
-                    error_dialog.setStyleSheet("QLabel { color: black; }")
-                    error_dialog.exec()
+                    self._show_error(
+                        title="Error",
+                        text="Error Updating Template",
+                        heading="Template Value Error",
+                        intro="There was a problem with the template data values:",
+                        detail=str(val_e),
+                        footer="Please check that all fields contain valid information.",
+                    )
 
                     print(f"ValueError in edit_template: {str(val_e)}")
-                    import traceback
                     traceback.print_exc()
 
         except Exception as e:
-            error_message = f"""
-<h3>Error Updating Template</h3>
-<p>An error occurred while trying to update the template:</p>
-<p style='color: #D32F2F;'>{str(e)}</p>
-<p>Please try again or contact support if this issue persists.</p>
-"""
-            error_dialog = QMessageBox(self)
-            error_dialog.setWindowTitle("Error")
-            error_dialog.setText("Error Updating Template")
-            error_dialog.setInformativeText(error_message)
-            error_dialog.setIcon(QMessageBox.Critical)
-            error_dialog.setStyleSheet("QLabel { color: black; }")
-            error_dialog.exec()
+            self._show_error(
+                title="Error",
+                text="Error Updating Template",
+                intro="An error occurred while trying to update the template:",
+                detail=str(e),
+                footer="Please try again or contact support if this issue persists.",
+            )
 
             # Print detailed error information to help with debugging
             print(f"Error in edit_template: {str(e)}")
-            import traceback
             traceback.print_exc()
 
     def delete_template(self, template_id):
         """Delete the selected template from the database"""
+        self._delete_template_ids([template_id])
+
+    def _delete_template_ids(self, template_ids):
+        """Confirm and delete one or more templates, fetched and deleted with one query each"""
         try:
-            # Get template name for confirmation
-            template = self.db.get_template(template_id=template_id)
-            if not template:
+            # Get template names for confirmation, from already loaded templates when all are at hand
+            loaded = [self._templates_by_id.get(template_id) for template_id in template_ids]
+            if all(loaded):
+                templates = [{
+                    'id': template['id'],
+                    'name': template['name'],
+                    'template_type': template['template_type'],
+                    'regions': template.get('drawing_regions', {}),
+                } for template in loaded]
+            else:
+                templates = self.db.get_template_summaries(template_ids)
+            if not templates:
                 msg_box = QMessageBox(self)
                 msg_box.setWindowTitle("Template Not Found")
                 msg_box.setText("The selected template could not be found.")
                 msg_box.setIcon(QMessageBox.Warning)
                 msg_box.setStyleSheet("QLabel { color: black; }")
-                msg_box.exec()
+                self._open_dialog(msg_box)
                 return
 
             # Create a more detailed confirmation message
-            confirmation_message = f"""
-<h3>Confirm Template Deletion</h3>
-
-<p style='color: #D32F2F;'><b>Warning:</b> This action cannot be undone.</p>
-
-<p>You are about to delete the following template:</p>
-<ul>
+            details = "".join(f"""<ul>
     <li><b>Name:</b> {template.get('name', 'Unnamed Template')}</li>
     <li><b>Type:</b> {template.get('template_type', 'Unknown').title()}</li>
     <li><b>Regions:</b> {sum(len(rects) for rects in template.get('regions', {}).values())} table(s)</li>
 </ul>
+""" for template in templates)
+            confirmation_message = f"""
+<h3>Confirm Template Deletion</h3>
+
+<p style='color: #D32F2F;'><b>Warning:</b> This action cannot be undone.</p>
 
+<p>You are about to delete the following {'templates' if len(templates) > 1 else 'template'}:</p>
+{details}
 <p>Are you sure you want to proceed?</p>
 """
 
             # Create a custom confirmation dialog
             confirm_dialog = QMessageBox(self)
             confirm_dialog.setWindowTitle("Confirm Deletion")
-            confirm_dialog.setText("Delete Template?")
+            confirm_dialog.setText("Delete Templates?" if len(templates) > 1 else "Delete Template?")
             confirm_dialog.setInformativeText(confirmation_message)
             confirm_dialog.setIcon(QMessageBox.Warning)
             confirm_dialog.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
@@ -3350,1194 +4009,700 @@ class TemplateManager(QWidget):
             no_button = confirm_dialog.button(QMessageBox.No)
             no_button.setText("Cancel")
 
-            # Show the dialog
-            result = confirm_dialog.exec()
+            # Show the dialog; the deletion runs once the user confirms
+            ids = [template['id'] for template in templates]
+            names = [template.get('name', 'Unnamed Template') for template in templates]
+            self._open_dialog(
+                confirm_dialog,
+                lambda result: self._do_delete(ids, names) if result == QMessageBox.Yes else None,
+            )
 
-            if result == QMessageBox.Yes:
-                # Delete the template
-                self.db.delete_template(template_id=template_id)
+        except Exception as e:
+            self._report_delete_error(e)
+
+    def _do_delete(self, template_ids, names):
+        """Delete confirmed templates in one batch off the UI thread, then report and refresh"""
+        def on_deleted(deleted):
+            # delete_templates rolls back and returns False rather than raising
+            if not deleted:
+                self._report_delete_error("The database rolled back the deletion; no templates were deleted.")
+                return
 
-                # Show success message
-                success_msg = QMessageBox(self)
-                success_msg.setWindowTitle("Template Deleted")
+            # Show success message
+            quoted_names = ", ".join(f"'{name}'" for name in names)
+            success_msg = QMessageBox(self)
+            success_msg.setWindowTitle("Template Deleted")
+            if len(names) > 1:
+                success_msg.setText("Templates Successfully Deleted")
+                success_msg.setInformativeText(f"The templates {quoted_names} have been permanently deleted.")
+            else:
                 success_msg.setText("Template Successfully Deleted")
-                success_msg.setInformativeText(f"The template '{template.get('name', 'Unnamed Template')}' has been permanently deleted.")
-                success_msg.setIcon(QMessageBox.Information)
-                success_msg.setStyleSheet("QLabel { color: black; }")
-                success_msg.exec()
-
-                # Refresh the template list
-                self.load_templates()
+                success_msg.setInformativeText(f"The template {quoted_names} has been permanently deleted.")
+            success_msg.setIcon(QMessageBox.Information)
+            success_msg.setStyleSheet("QLabel { color: black; }")
+            self._open_dialog(success_msg)
+
+            # Refresh the template list; the delete is known to have changed it
+            self._invalidate_templates_cache()
+            self.load_templates()
+
+        # Delete the templates; the commit happens on a pool thread with its own connection
+        worker = _DbWorker(self.db.db_path, InvoiceDatabase.delete_templates, list(template_ids))
+        worker.signals.done.connect(on_deleted, Qt.QueuedConnection)
+        worker.signals.failed.connect(self._report_delete_error, Qt.QueuedConnection)
+        self._delete_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _report_delete_error(self, e):
+        """Show the error dialog for a failed template deletion"""
+        self._show_error(
+            title="Error",
+            text="Error Deleting Template",
+            intro="An error occurred while trying to delete the template:",
+            detail=str(e),
+            footer="Please try again or contact support if this issue persists.",
+        )
 
-        except Exception as e:
-            error_message = f"""
-<h3>Error Deleting Template</h3>
-<p>An error occurred while trying to delete the template:</p>
-<p style='color: #D32F2F;'>{str(e)}</p>
-<p>Please try again or contact support if this issue persists.</p>
-"""
-            error_dialog = QMessageBox(self)
-            error_dialog.setWindowTitle("Error")
-            error_dialog.setText("Error Deleting Template")
-            error_dialog.setInformativeText(error_message)
-            error_dialog.setIcon(QMessageBox.Critical)
-            error_dialog.setStyleSheet("QLabel { color: black; }")
-            error_dialog.exec()
+    def _invalidate_templates_cache(self):
+        """Make the next load_templates re-read the table and drop the fully loaded templates"""
+        self._templates_cache_version = None
+        self._templates_by_id = {}
 
     def load_templates(self):
         """Load all templates from the database and display them in the table"""
-        templates = self.db.get_all_templates()
-
-        self.templates_table.setRowCount(len(templates))
-
-        for row, template in enumerate(templates):
-            # Template name
-            name_item = QTableWidgetItem(template["name"])
-            name_item.setToolTip(template["name"])
-            name_item.setForeground(Qt.black)  # Explicitly set text color to black
-            self.templates_table.setItem(row, 0, name_item)
-
-            # Description
-            desc_item = QTableWidgetItem(template["description"] if template["description"] else "")
-            desc_item.setToolTip(template["description"] if template["description"] else "")
-            desc_item.setForeground(Qt.black)  # Explicitly set text color to black
-            self.templates_table.setItem(row, 1, desc_item)
-
-            # Type with page count for multi-page templates
-            if template["template_type"] == "multi":
-                page_count = template.get("page_count", 1)
-                type_text = f"Multi-page ({page_count} pages)"
-            else:
-                type_text = "Single-page"
+        # Nothing to rebuild if no template was added, updated or deleted since the last load
+        version = self.db.get_templates_version()
+        if version is not None and version == self._templates_cache_version:
+            return
 
-            type_item = QTableWidgetItem(type_text)
-            type_item.setForeground(Qt.black)  # Explicitly set text color to black
-            self.templates_table.setItem(row, 2, type_item)
+        templates = self.db.get_all_templates()
+        self._templates_cache = templates
+        self._templates_cache_version = version
+        self._templates_by_id = {}
 
-            # Created date - Format for better readability with 12-hour time format
-            try:
-                # Try to parse and format the date with time in 12-hour format
-                date_str = template["creation_date"]
-                if "T" in date_str:  # ISO format
-                    # Split into date and time parts
-                    date_time_parts = date_str.split("T")
-                    date_parts = date_time_parts[0].split("-")
-
-                    # Format date as DD/MM/YYYY
-                    formatted_date = f"{date_parts[2]}/{date_parts[1]}/{date_parts[0]}"
-
-                    # Add time in 12-hour format if available
-                    if len(date_time_parts) > 1:
-                        time_part = date_time_parts[1].split(".")[0]  # Remove milliseconds if present
-                        time_parts = time_part.split(":")
-                        if len(time_parts) >= 2:
-                            # Convert to 12-hour format with AM/PM
-                            hour = int(time_parts[0])
-                            minute = time_parts[1]
-                            am_pm = "AM" if hour < 12 else "PM"
-
-                            # Convert hour from 24-hour to 12-hour format
-                            if hour == 0:
-                                hour = 12  # 00:00 becomes 12:00 AM
-                            elif hour > 12:
-                                hour = hour - 12  # 13:00 becomes 1:00 PM
-
-                            formatted_time = f"{hour}:{minute} {am_pm}"
-                            formatted_date = f"{formatted_date} {formatted_time}"
-                else:
-                    formatted_date = date_str
-            except:
-                formatted_date = template["creation_date"]
-
-            date_item = QTableWidgetItem(formatted_date)
-            date_item.setTextAlignment(Qt.AlignCenter)
-            date_item.setForeground(Qt.black)  # Explicitly set text color to black
-            self.templates_table.setItem(row, 3, date_item)
-
-            # Action buttons
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(4, 0, 4, 0)
-            actions_layout.setSpacing(8)
-            actions_layout.setAlignment(Qt.AlignCenter)
-
-            # Set explicit background color for the widget
-            if row % 2 == 0:
-                actions_widget.setStyleSheet("background-color: white;")
-            else:
-                actions_widget.setStyleSheet("background-color: #f9f9f9;")
-
-            # Apply button with icon
-            apply_btn = QPushButton("Apply")
-            apply_btn.setProperty("template_id", template["id"])
-            apply_btn.setProperty("action", "apply")
-            apply_btn.setToolTip(f"Apply template: {template['name']}")
-            apply_btn.clicked.connect(lambda checked=False, tid=template["id"]: self.apply_template(tid))
-            apply_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4169E1;
-                    color: white;
-                    padding: 5px 12px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    min-width: 70px;
-                }
-                QPushButton:hover {
-                    background-color: #3158D3;
-                }
-            """)
-
-            # Edit button with icon
-            edit_btn = QPushButton("Edit")
-            edit_btn.setProperty("template_id", template["id"])
-            edit_btn.setProperty("action", "edit")
-            edit_btn.setToolTip(f"Edit template: {template['name']}")
-            edit_btn.clicked.connect(lambda checked=False, tid=template["id"]: self.edit_template(tid))
-            edit_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF9800;
-                    color: white;
-                    padding: 5px 12px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    min-width: 70px;
-                }
-                QPushButton:hover {
-                    background-color: #F57C00;
-                }
-            """)
-
-            # Delete button with icon
-            delete_btn = QPushButton("Delete")
-            delete_btn.setProperty("template_id", template["id"])
-            delete_btn.setProperty("action", "delete")
-            delete_btn.setToolTip(f"Delete template: {template['name']}")
-            delete_btn.clicked.connect(lambda checked=False, tid=template["id"]: self.delete_template(tid))
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #D32F2F;
-                    color: white;
-                    padding: 5px 12px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    min-width: 70px;
-                }
-                QPushButton:hover {
-                    background-color: #B71C1C;
-                }
-            """)
-
-            actions_layout.addWidget(apply_btn)
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-
-            # Set fixed height for the actions widget to ensure proper display
-            actions_widget.setFixedHeight(40)
-
-            # Set the cell widget
-            self.templates_table.setCellWidget(row, 4, actions_widget)
-
-        # If no templates, show a message
-        if len(templates) == 0:
-            self.templates_table.setRowCount(1)
-            no_templates_item = QTableWidgetItem("No templates found. Create your first template!")
-            no_templates_item.setTextAlignment(Qt.AlignCenter)
-            no_templates_item.setForeground(Qt.black)  # Explicitly set text color to black
-            self.templates_table.setItem(0, 0, no_templates_item)
-            self.templates_table.setSpan(0, 0, 1, 5)
-
-            # Set background color for the empty row
-            for col in range(5):
-                if col == 0:  # Skip the first column as it already has the message
-                    continue
-                empty_item = QTableWidgetItem("")
-                empty_item.setBackground(QColor(240, 240, 240))  # Light gray background
-                self.templates_table.setItem(0, col, empty_item)
+        # One model reset replaces every row
+        self.templates_model.set_templates(templates)
 
-        # Adjust row heights for better spacing
-        for row in range(self.templates_table.rowCount()):
-            self.templates_table.setRowHeight(row, 50)  # Increased height for better button display
+        # If no templates, the placeholder message spans the whole row
+        self.templates_table.clearSpans()
+        if self.templates_model.is_empty():
+            self.templates_table.setSpan(0, 0, 1, self.templates_model.columnCount())
 
     def apply_template(self, template_id):
         """Apply the selected template to the current PDF processor"""
         try:
-            from PySide6.QtCore import QRect, QPoint
-
             # Get the template from the database - this will be the source of truth
-            db_template = self.db.get_template(template_id=template_id)
+            db_template = self._get_template(template_id)
             if not db_template:
                 msg_box = QMessageBox(self)
                 msg_box.setWindowTitle("Template Not Found")
                 msg_box.setText("The selected template could not be found.")
                 msg_box.setIcon(QMessageBox.Warning)
                 msg_box.setStyleSheet("QLabel { color: black; }")
-                msg_box.exec()
+                self._open_dialog(msg_box)
                 return
 
             # Use the database template as our primary template
             template = db_template
-            print(f"[DEBUG] Using template from database: {template['name']}")
+            logger.debug("Using template from database: %s", template['name'])
 
             # Show a preview of the template settings
-            template_preview = f"""
+            # Collect the HTML in parts and join once at the end
+            preview_parts = [f"""
 <h3>Template: {template['name']}</h3>
 
 <p><b>Description:</b> {template['description'] or 'No description'}</p>
 <p><b>Type:</b> {"Multi-page" if template.get('template_type') == 'multi' else "Single-page"}</p>
-"""
+"""]
 
             # Show additional parameters if they exist in the config
             if 'config' in template and isinstance(template['config'], dict):
-                config = template['config']
-                additional_params = []
-
-                # Original coordinates are always stored by default, no need to show this parameter
-
                 # Check for any custom parameters (exclude known parameters)
-                known_params = ['multi_table_mode', 'extraction_params', 'regex_patterns', 'use_middle_page',
-                               'fixed_page_count', 'total_pages', 'page_indices', 'store_original_coords',
-                               'original_regions', 'original_column_lines', 'scale_factors']
-
-                for key, value in config.items():
-                    if key not in known_params:
-                        # Format the value based on its type
-                        if isinstance(value, bool):
-                            formatted_value = 'Yes' if value else 'No'
-                        elif isinstance(value, (dict, list)):
-                            formatted_value = f"<i>(complex value)</i>"
-                        else:
-                            formatted_value = str(value)
-
-                        additional_params.append(f"<li>{key}: {formatted_value}</li>")
+                additional_params = {key: value for key, value in template['config'].items()
+                                     if key not in _KNOWN_CONFIG_PARAMS}
 
                 # Add additional parameters section if any were found
                 if additional_params:
-                    template_preview += "<p><b>Additional Parameters:</b></p><ul>"
-                    template_preview += '\n'.join(additional_params)
-                    template_preview += "</ul>"
+                    preview_parts.append("<p><b>Additional Parameters:</b></p><ul>")
+                    preview_parts.append('\n'.join(_format_config_param(key, value)
+                                                   for key, value in additional_params.items()))
+                    preview_parts.append("</ul>")
 
             if template.get('template_type') == 'multi':
-                template_preview += f"<p><b>Number of Pages:</b> {template.get('page_count', 1)}</p>"
+                preview_parts.append(f"<p><b>Number of Pages:</b> {template.get('page_count', 1)}</p>")
 
                 # For multi-page templates, show info for each page
-                template_preview += "<p><b>Pages:</b></p><ul>"
+                preview_parts.append("<p><b>Pages:</b></p><ul>")
 
                 # Get page-specific data if available
                 page_regions = template.get('page_regions', [])
                 page_column_lines = template.get('page_column_lines', [])
 
+                # Count each page's regions and column lines once, up front
+                page_region_counts = [
+                    {section: len(rects) for section, rects in page_region.items()}
+                    for page_region in page_regions
+                ]
+                page_column_counts = [
+                    sum(map(len, page_column_line.values())) for page_column_line in page_column_lines
+                ]
+
                 for page_idx in range(template.get('page_count', 1)):
-                    template_preview += f"<li><b>Page {page_idx + 1}:</b><ul>"
+                    preview_parts.append(f"<li><b>Page {page_idx + 1}:</b><ul>")
 
                     # Regions for this page
-                    if page_idx < len(page_regions):
-                        regions = page_regions[page_idx]
-                        region_count = sum(len(rects) for rects in regions.values())
-                        template_preview += f"<li>Regions: {region_count}</li>"
+                    if page_idx < len(page_region_counts):
+                        section_counts = page_region_counts[page_idx]
+                        preview_parts.append(f"<li>Regions: {sum(section_counts.values())}</li>")
 
                         # Add details about regions
-                        if regions:
-                            template_preview += "<ul>"
-                            for section, rects in regions.items():
-                                if rects:
-                                    template_preview += f"<li>{section.title()}: {len(rects)} table(s)</li>"
-                            template_preview += "</ul>"
+                        if section_counts:
+                            preview_parts.append("<ul>")
+                            for section, count in section_counts.items():
+                                if count:
+                                    preview_parts.append(f"<li>{section.title()}: {count} table(s)</li>")
+                            preview_parts.append("</ul>")
 
                     # Column lines for this page
-                    if page_idx < len(page_column_lines):
-                        column_lines = page_column_lines[page_idx]
-                        column_line_count = sum(len(lines) for lines in column_lines.values())
-                        template_preview += f"<li>Column Lines: {column_line_count}</li>"
+                    if page_idx < len(page_column_counts):
+                        preview_parts.append(f"<li>Column Lines: {page_column_counts[page_idx]}</li>")
 
-                    template_preview += "</ul></li>"
+                    preview_parts.append("</ul></li>")
 
-                template_preview += "</ul>"
+                preview_parts.append("</ul>")
             else:
                 # Show information for single-page template
-                region_count = 0
                 if 'regions' in template and template['regions']:
-                    template_preview += "<p><b>Tables:</b></p><ul>"
-                    for section, rects in template['regions'].items():
-                        if rects:
-                            region_count += len(rects)
-                            template_preview += f"<li>{section.title()}: {len(rects)} table(s)</li>"
-                    template_preview += f"</ul><p><b>Total Regions:</b> {region_count}</p>"
+                    section_counts = {section: len(rects) for section, rects in template['regions'].items()}
+                    preview_parts.append("<p><b>Tables:</b></p><ul>")
+                    for section, count in section_counts.items():
+                        if count:
+                            preview_parts.append(f"<li>{section.title()}: {count} table(s)</li>")
+                    preview_parts.append(f"</ul><p><b>Total Regions:</b> {sum(section_counts.values())}</p>")
 
                 # Column lines info
                 # Check dual coordinate column lines first, then legacy
-                drawing_column_lines = template.get('drawing_column_lines', template.get('column_lines', {}))
+                drawing_column_lines = template.get('drawing_column_lines') or template.get('column_lines') or {}
                 has_column_lines = any(drawing_column_lines.values()) if drawing_column_lines else False
-                template_preview += f"<p><b>Column Lines:</b> {'Yes' if has_column_lines else 'No'}</p>"
+                preview_parts.append(f"<p><b>Column Lines:</b> {'Yes' if has_column_lines else 'No'}</p>")
 
             # Show configuration info
-            template_preview += f"<p><b>Multi-table Mode:</b> {'Yes' if template.get('config', {}).get('multi_table_mode', False) else 'No'}</p>"
+            preview_parts.append(f"<p><b>Multi-table Mode:</b> {'Yes' if template.get('config', {}).get('multi_table_mode', False) else 'No'}</p>")
+
+            template_preview = "".join(preview_parts)
 
             # Show the preview dialog
-            preview = QMessageBox(self)
-            preview.setWindowTitle("Template Preview")
-            preview.setText("Template Preview")
+            preview = self._get_preview_box()
             preview.setInformativeText(template_preview)
-            preview.setStandardButtons(QMessageBox.Apply | QMessageBox.Cancel)
-            preview.setDefaultButton(QMessageBox.Apply)
-            preview.setStyleSheet("QLabel { color: black; }")
 
-            # If the user confirms, apply the template
-            if preview.exec() == QMessageBox.Apply:
-                # Clear the existing PDF in pdf_processor if it exists
-                if self.pdf_processor and hasattr(self.pdf_processor, 'clear_all'):
-                    print("Clearing existing PDF and regions before applying template")
-                    self.pdf_processor.clear_all()
-
-                # Helper function to convert coordinates from database format to PDF format
-                def convert_coordinates(rect_data, pdf_height=None):
-                    """
-                    Convert coordinates from database format to PDF format (QRect)
-                    Handles both original unscaled (x,y,width,height) and scaled (x1,y1,x2,y2) formats
-                    Prioritizes using the original unscaled coordinates if available
-                    """
-                    if isinstance(rect_data, dict):
-                        # First check if we have original unscaled coordinates
-                        if 'x' in rect_data and 'y' in rect_data and 'width' in rect_data and 'height' in rect_data:
-                            # Use the original unscaled coordinates (x,y,width,height) directly without conversion
-                            x = float(rect_data['x'])
-                            y = float(rect_data['y'])
-                            width = float(rect_data['width'])
-                            height = float(rect_data['height'])
-
-                            # Ensure width and height are positive
-                            if width < 0:
-                                x += width
-                                width = abs(width)
-                            if height < 0:
-                                y += height
-                                height = abs(height)
-
-                            print(f"Using original unscaled coordinates directly: x={x}, y={y}, width={width}, height={height}")
-                            return QRect(int(x), int(y), int(width), int(height))
-
-                        # Handle scaled format only (x1,y1,x2,y2)
-                        elif 'x1' in rect_data and 'y1' in rect_data and 'x2' in rect_data and 'y2' in rect_data:
-                            # Get coordinates from scaled database format
-                            x1 = float(rect_data['x1'])
-                            y1 = float(rect_data['y1'])
-                            x2 = float(rect_data['x2'])
-                            y2 = float(rect_data['y2'])
-
-                            # Calculate width and height
-                            width = x2 - x1
-                            height = y2 - y1
-
-                            # Ensure width and height are positive
-                            if width < 0:
-                                x1 += width
-                                width = abs(width)
-                            if height < 0:
-                                y1 += height
-                                height = abs(height)
-
-                            print(f"Using scaled coordinates: x1={x1}, y1={y1}, width={width}, height={height}")
-                            return QRect(int(x1), int(y1), int(width), int(height))
-                        else:
-                            print(f"Warning: Unknown rect format in template: {rect_data}")
-                            return QRect()
-                    elif isinstance(rect_data, QRect):
-                        # Already a QRect, ensure width and height are positive
-                        x = rect_data.x()
-                        y = rect_data.y()
-                        width = rect_data.width()
-                        height = rect_data.height()
-
-                        # Ensure width and height are positive
-                        if width < 0:
-                            x += width
-                            width = abs(width)
-                        if height < 0:
-                            y += height
-                            height = abs(height)
-
-                        return QRect(x, y, width, height)
-                    elif hasattr(rect_data, 'rect') and hasattr(rect_data, 'label'):
-                        # StandardRegion object - extract the UI coordinates
-                        from standardized_coordinates import StandardRegion
-                        if isinstance(rect_data, StandardRegion):
-                            ui_rect = rect_data.rect
-                            x = ui_rect.x()
-                            y = ui_rect.y()
-                            width = ui_rect.width()
-                            height = ui_rect.height()
-                            print(f"Converted StandardRegion {rect_data.label}: UI({x},{y},{width},{height})")
-                            return QRect(x, y, width, height)
-                        else:
-                            print(f"Warning: Unknown StandardRegion-like object: {type(rect_data)}")
-                            return QRect()
-                    elif hasattr(rect_data, 'rect') and hasattr(rect_data, 'label'):
-                        # StandardRegion object - extract the UI coordinates
-                        from standardized_coordinates import StandardRegion
-                        if isinstance(rect_data, StandardRegion):
-                            ui_rect = rect_data.rect
-                            x = ui_rect.x()
-                            y = ui_rect.y()
-                            width = ui_rect.width()
-                            height = ui_rect.height()
-                            print(f"Converted StandardRegion {rect_data.label}: UI({x},{y},{width},{height})")
-                            return QRect(x, y, width, height)
-                        else:
-                            print(f"Warning: Unknown StandardRegion-like object: {type(rect_data)}")
-                            return QRect()
-                    else:
-                        print(f"Warning: Unknown rect type in template: {type(rect_data)}")
-                        return QRect()
-
-                # Get PDF dimensions if available
-                pdf_height = None
-                if self.pdf_processor and hasattr(self.pdf_processor, 'pdf_label') and self.pdf_processor.pdf_label.pixmap():
-                    pdf_height = self.pdf_processor.pdf_label.pixmap().height()
-                    print(f"Using PDF height for coordinate conversion: {pdf_height}")
-                else:
-                    print("Warning: Could not determine PDF height, using raw coordinates")
-
-                # For single-page templates
-                if template.get('template_type') == 'single':
-                    # Check if we have original coordinates in the config
-                    config = template.get('config', {})
-                    if 'original_regions' in config and config['original_regions']:
-                        print("Using original regions from config")
-                        # Use original coordinates directly
-                        converted_regions = {}
-                        for section, rects in config['original_regions'].items():
-                            converted_regions[section] = []
-                            for rect_data in rects:
-                                converted_rect = QRect(
-                                    int(rect_data['x']),
-                                    int(rect_data['y']),
-                                    int(rect_data['width']),
-                                    int(rect_data['height'])
-                                )
-                                converted_regions[section].append(converted_rect)
-                                print(f"Using original region: {rect_data} -> {converted_rect}")
-
-                        template['regions'] = converted_regions
-                    # Fallback to converting serialized regions if original coordinates not available
-                    elif 'regions' in template and template['regions']:
-                        print("Original regions not found in config, converting serialized regions")
-                        converted_regions = {}
-                        for section, rects in template['regions'].items():
-                            converted_regions[section] = []
-                            for rect_data in rects:
-                                converted_rect = convert_coordinates(rect_data, pdf_height)
-                                converted_regions[section].append(converted_rect)
-                                print(f"Converted region: {rect_data} -> {converted_rect}")
-
-                        template['regions'] = converted_regions
-
-                    # Check if we have original column lines in the config
-                    config = template.get('config', {})
-                    if 'original_column_lines' in config and config['original_column_lines']:
-                        print("Using original column lines from config")
-                        # Use original coordinates directly
-                        converted_column_lines = {}
-                        for section, lines in config['original_column_lines'].items():
-                            converted_column_lines[section] = []
-                            for line_data in lines:
-                                if isinstance(line_data, list) and len(line_data) >= 2:
-                                    # Check if the first two elements are dictionaries with x,y coordinates
-                                    if (isinstance(line_data[0], dict) and 'x' in line_data[0] and 'y' in line_data[0] and
-                                        isinstance(line_data[1], dict) and 'x' in line_data[1] and 'y' in line_data[1]):
-                                        # Use original coordinates
-                                        start_point = QPoint(int(line_data[0]['x']), int(line_data[0]['y']))
-                                        end_point = QPoint(int(line_data[1]['x']), int(line_data[1]['y']))
-                                        print(f"Using original column line coordinates from config: {start_point} -> {end_point}")
-
-                                        # Check if we have a region index
-                                        region_index = None
-                                        if len(line_data) > 2 and isinstance(line_data[2], int):
-                                            region_index = line_data[2]
-
-                                        # Create line data with region index if present
-                                        if region_index is not None:
-                                            converted_line = [start_point, end_point, region_index]
-                                        else:
-                                            converted_line = [start_point, end_point]
+            # If the user confirms, apply the template once the preview closes
+            def apply_confirmed(result):
+                if result != QMessageBox.Apply:
+                    return
+                try:
+                    pdf_processor = self.pdf_processor
 
-                                        converted_column_lines[section].append(converted_line)
-                                    else:
-                                        print(f"Warning: Could not convert original column line from config: {line_data}")
-                                else:
-                                    print(f"Warning: Could not convert original column line from config: {line_data}")
-
-                        # Store in dual coordinate format instead of legacy
-                        template['drawing_column_lines'] = converted_column_lines
-                    # Fallback to converting serialized column lines if original coordinates not available
-                    elif template.get('drawing_column_lines') or template.get('column_lines'):
-                        print("Original column lines not found in config, converting serialized column lines")
-                        converted_column_lines = {}
-                        # Use dual coordinate data if available, otherwise legacy
-                        source_column_lines = template.get('drawing_column_lines', template.get('column_lines', {}))
-                        for section, lines in source_column_lines.items():
-                            converted_column_lines[section] = []
-                            for line_data in lines:
-                                # Check if we have original coordinates in the line data
-                                if isinstance(line_data, list) and len(line_data) >= 2:
-                                    # Check if the first two elements are dictionaries with x,y coordinates
-                                    if (isinstance(line_data[0], dict) and 'x' in line_data[0] and 'y' in line_data[0] and
-                                        isinstance(line_data[1], dict) and 'x' in line_data[1] and 'y' in line_data[1]):
-                                        # Use original coordinates
-                                        start_point = QPoint(int(line_data[0]['x']), int(line_data[0]['y']))
-                                        end_point = QPoint(int(line_data[1]['x']), int(line_data[1]['y']))
-                                        print(f"Using original column line coordinates: {start_point} -> {end_point}")
-
-                                        # Check if we have a region index
-                                        region_index = None
-                                        if len(line_data) > 2 and isinstance(line_data[2], int):
-                                            region_index = line_data[2]
-
-                                        # Create line data with region index if present
-                                        if region_index is not None:
-                                            converted_line = [start_point, end_point, region_index]
-                                        else:
-                                            converted_line = [start_point, end_point]
+                    # Clear the existing PDF in pdf_processor if it exists
+                    if pdf_processor and hasattr(pdf_processor, 'clear_all'):
+                        logger.debug("Clearing existing PDF and regions before applying template")
+                        pdf_processor.clear_all()
 
-                                        converted_column_lines[section].append(converted_line)
-                                        continue
+                    # Checked once; the conversion loops below log per rect and per line
+                    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+                    # Get PDF dimensions if available
+                    pdf_height = None
+                    if pdf_processor and hasattr(pdf_processor, 'pdf_label') and pdf_processor.pdf_label.pixmap():
+                        pdf_height = pdf_processor.pdf_label.pixmap().height()
+                        logger.debug("Using PDF height for coordinate conversion: %s", pdf_height)
+                    else:
+                        logger.warning("Could not determine PDF height, using raw coordinates")
+
+                    # Looked up once for all the conversion loops below
+                    config = template.get('config') or {}
+                    flip_y = pdf_height is not None and template.get('uses_bottom_left', True)
+
+                    # For single-page templates
+                    if template.get('template_type') == 'single':
+                        # Check if we have original coordinates in the config
+                        if 'original_regions' in config and config['original_regions']:
+                            logger.info("Using original regions from config")
+                            # Use original coordinates directly
+                            converted_regions = {}
+                            for section, rects in config['original_regions'].items():
+                                converted_regions[section] = section_rects = _rects_from_original(rects)
+                                if debug_enabled:
+                                    for rect_data, converted_rect in zip(rects, section_rects):
+                                        logger.debug("Using original region: %s -> %s", rect_data, converted_rect)
+
+                            template['regions'] = converted_regions
+                        # Fallback to converting serialized regions if original coordinates not available
+                        elif 'regions' in template and template['regions']:
+                            logger.info("Original regions not found in config, converting serialized regions")
+                            converted_regions = {}
+                            for section, rects in template['regions'].items():
+                                converted_regions[section] = section_rects = [_convert_rect_data(rect_data, pdf_height) for rect_data in rects]
+                                if debug_enabled:
+                                    for rect_data, converted_rect in zip(rects, section_rects):
+                                        logger.debug("Converted region: %s -> %s", rect_data, converted_rect)
+
+                            template['regions'] = converted_regions
+
+                        # Check if we have original column lines in the config
+                        source_column_lines = config.get('original_column_lines')
+                        if source_column_lines:
+                            logger.info("Using original column lines from config")
+                        else:
+                            # Fallback to converting serialized column lines if original coordinates not available,
+                            # using dual coordinate data if available, otherwise legacy
+                            source_column_lines = template.get('drawing_column_lines') or template.get('column_lines')
+                            if source_column_lines:
+                                logger.info("Original column lines not found in config, converting serialized column lines")
+
+                        if source_column_lines:
+                            converted_column_lines = {
+                                section: [cl for ld in lines if (cl := _convert_line(ld)) is not None]
+                                for section, lines in source_column_lines.items()
+                            }
+                            if debug_enabled:
+                                logger.debug("Converted column lines: %s", converted_column_lines)
 
-                                # Handle old format or fallback
-                                # First try to extract start and end points
-                                start_point = None
-                                end_point = None
-                                region_index = None
+                            # Store in dual coordinate format instead of legacy
+                            template['drawing_column_lines'] = converted_column_lines
 
-                                # Handle dictionary format
-                                if isinstance(line_data, dict):
-                                    if 'orig_start' in line_data and 'orig_end' in line_data:
-                                        # Old format with original coordinates
-                                        start_point_data = line_data['orig_start']
-                                        end_point_data = line_data['orig_end']
+                    # For multi-page templates
+                    else:
+                        # Pages are converted on first access; most callers only ever read the first one
+                        page_configs = template.get('page_configs') or []
+                        # Serialized lines in list format are stored bottom-left; original ones are not
+                        serialized_flip_height = pdf_height if flip_y else None
+
+                        def convert_page_regions(page_idx, page_regions):
+                            # Check if we have page_config for this page
+                            page_config = page_configs[page_idx] if page_idx < len(page_configs) else None
+                            if page_config and 'original_regions' in page_config:
+                                # Use original coordinates from page_config
+                                converted_regions = {section: _rects_from_original(rects)
+                                                     for section, rects in page_config['original_regions'].items()}
+                            else:
+                                # Fallback to converting serialized regions
+                                converted_regions = {section: [_convert_rect_data(rect_data, pdf_height) for rect_data in rects]
+                                                     for section, rects in page_regions.items()}
+                            if debug_enabled:
+                                logger.debug("Converted page %s regions: %s", page_idx + 1, converted_regions)
+                            return converted_regions
+
+                        def convert_page_column_lines(page_idx, page_column_lines):
+                            # Check if we have page_config for this page
+                            page_config = page_configs[page_idx] if page_idx < len(page_configs) else None
+                            if page_config and 'original_column_lines' in page_config:
+                                # Use original column lines from page_config
+                                source_column_lines = page_config['original_column_lines']
+                                flip_height = None
+                            else:
+                                # Fallback to converting serialized column lines
+                                source_column_lines = page_column_lines
+                                flip_height = serialized_flip_height
+                            converted_column_lines = {
+                                section: [cl for ld in lines if (cl := _convert_line(ld, flip_height)) is not None]
+                                for section, lines in source_column_lines.items()
+                            }
+                            if debug_enabled:
+                                logger.debug("Converted page %s column lines: %s", page_idx + 1, converted_column_lines)
+                            return converted_column_lines
+
+                        if 'page_regions' in template and template['page_regions']:
+                            if page_configs:
+                                logger.info("Using original coordinates from page_configs")
+                            else:
+                                logger.info("Page configs not found, converting serialized page regions")
+                            template['page_regions'] = _LazyPageList(template['page_regions'], convert_page_regions)
+
+                        # Process page column lines with coordinate conversion
+                        if 'page_column_lines' in template and template['page_column_lines']:
+                            if page_configs:
+                                logger.info("Using original column lines from page_configs")
+                            template['page_column_lines'] = _LazyPageList(template['page_column_lines'], convert_page_column_lines)
+
+                    # Unconverted copy of the stored template for the extraction method, extraction
+                    # parameters, config and YAML/JSON template below; served from the entry
+                    # apply_template loaded, which is dropped whenever the templates change
+                    db_template = self._get_template(template_id)
+
+                    # Set configuration in PDF processor
+                    if pdf_processor:
+                        # Set multi-table mode
+                        if hasattr(pdf_processor, 'multi_table_mode'):
+                            multi_table_mode = config.get('multi_table_mode', False)
+                            pdf_processor.multi_table_mode = multi_table_mode
+                            logger.debug("Setting multi-table mode to %s based on template config", multi_table_mode)
+
+                        # Set extraction method if available
+                        if hasattr(pdf_processor, 'current_extraction_method'):
+                            if db_template and 'extraction_method' in db_template:
+                                extraction_method = db_template['extraction_method']
+                                pdf_processor.current_extraction_method = extraction_method
+                                logger.debug("Set extraction method from template: %s", extraction_method)
+
+                                # Update the UI dropdown if it exists
+                                if hasattr(pdf_processor, 'extraction_method_combo'):
+                                    pdf_processor.extraction_method_combo.setCurrentText(extraction_method)
+                                    logger.debug("Updated extraction method dropdown to: %s", extraction_method)
+                            else:
+                                logger.debug("No extraction method found in template, using default")
 
-                                        if isinstance(start_point_data, dict) and 'x' in start_point_data and 'y' in start_point_data:
-                                            start_point = QPoint(int(start_point_data['x']), int(start_point_data['y']))
+                        # Set extraction parameters - ALWAYS fetch from database
+                        if hasattr(pdf_processor, 'extraction_params'):
+                            # Print the entire db_template for debugging
+                            logger.debug("Database template: %s", db_template)
 
-                                        if isinstance(end_point_data, dict) and 'x' in end_point_data and 'y' in end_point_data:
-                                            end_point = QPoint(int(end_point_data['x']), int(end_point_data['y']))
+                            if db_template and 'config' in db_template and 'extraction_params' in db_template['config']:
+                                # Use extraction parameters from database WITHOUT adding any defaults
+                                extraction_params = db_template['config']['extraction_params']
+                                logger.debug("Setting extraction parameters from database exactly as stored: %s", extraction_params)
 
-                                        if 'region_index' in line_data:
-                                            region_index = line_data['region_index']
+                                # Verify extraction parameters structure
+                                if not isinstance(extraction_params, dict):
+                                    logger.warning("Extraction parameters from database are not a dictionary: %s", type(extraction_params))
+                                    extraction_params = {}
 
-                                # Handle list format
-                                elif isinstance(line_data, list) and len(line_data) >= 2:
-                                    # Try to extract points from list format
-                                    if isinstance(line_data[0], dict) and 'x' in line_data[0] and 'y' in line_data[0]:
-                                        start_point = QPoint(int(line_data[0]['x']), int(line_data[0]['y']))
+                                # Ensure all section parameters exist, inheriting missing ones from the globals
+                                _fill_section_params(extraction_params)
 
-                                    if isinstance(line_data[1], dict) and 'x' in line_data[1] and 'y' in line_data[1]:
-                                        end_point = QPoint(int(line_data[1]['x']), int(line_data[1]['y']))
+                                # Set the extraction parameters exactly as they are in the database
+                                pdf_processor.extraction_params = extraction_params
 
-                                    if len(line_data) > 2 and isinstance(line_data[2], int):
-                                        region_index = line_data[2]
+                                # Print the extraction parameters that were set
+                                logger.debug("Final extraction parameters set: %s", pdf_processor.extraction_params)
 
-                                # Create the converted line if we have valid points
-                                if start_point and end_point:
-                                    if region_index is not None:
-                                        converted_column_lines[section].append([start_point, end_point, region_index])
+                                # Verify row_tol values
+                                for section in ['header', 'items', 'summary']:
+                                    if 'row_tol' in extraction_params.get(section, {}):
+                                        logger.debug("%s row_tol: %s", section, extraction_params[section]['row_tol'])
                                     else:
-                                        converted_column_lines[section].append([start_point, end_point])
-                                else:
-                                    print(f"Warning: Could not convert column line: {line_data}")
+                                        logger.debug("%s row_tol not found in extraction parameters", section)
 
-                        # Store in dual coordinate format instead of legacy
-                        template['drawing_column_lines'] = converted_column_lines
+                            elif 'extraction_params' in config:
+                                # Fallback to template config if database doesn't have extraction parameters
+                                # Use exactly as stored without adding defaults
+                                extraction_params = config['extraction_params']
+                                logger.debug("Setting extraction parameters from template config exactly as stored: %s", extraction_params)
 
-                # For multi-page templates
-                else:
-                    # Check if we have page_configs with original coordinates
-                    if 'page_configs' in template and template['page_configs']:
-                        print("Using original coordinates from page_configs")
-                        page_configs = template['page_configs']
+                                # Verify extraction parameters structure
+                                if not isinstance(extraction_params, dict):
+                                    logger.warning("Extraction parameters from template are not a dictionary: %s", type(extraction_params))
+                                    extraction_params = {}
 
-                        # Process page regions using original coordinates from page_configs
-                        if 'page_regions' in template and template['page_regions']:
-                            converted_page_regions = []
-                            for page_idx, page_regions in enumerate(template['page_regions']):
-                                # Check if we have page_config for this page
-                                if page_idx < len(page_configs) and page_configs[page_idx] and 'original_regions' in page_configs[page_idx]:
-                                    # Use original coordinates from page_config
-                                    original_regions = page_configs[page_idx]['original_regions']
-                                    converted_regions = {}
-                                    for section, rects in original_regions.items():
-                                        converted_regions[section] = []
-                                        for rect_data in rects:
-                                            converted_rect = QRect(
-                                                int(rect_data['x']),
-                                                int(rect_data['y']),
-                                                int(rect_data['width']),
-                                                int(rect_data['height'])
-                                            )
-                                            converted_regions[section].append(converted_rect)
-                                            print(f"Using original multi-page region from page_config: {rect_data} -> {converted_rect}")
-                                    converted_page_regions.append(converted_regions)
-                                else:
-                                    # Fallback to converting serialized regions
-                                    converted_regions = {}
-                                    for section, rects in page_regions.items():
-                                        converted_regions[section] = []
-                                        for rect_data in rects:
-                                            converted_rect = convert_coordinates(rect_data, pdf_height)
-                                            converted_regions[section].append(converted_rect)
-                                            print(f"Converted multi-page region: {rect_data} -> {converted_rect}")
-                                    converted_page_regions.append(converted_regions)
-                            template['page_regions'] = converted_page_regions
-
-                    # Fallback to converting serialized page regions if page_configs not available
-                    elif 'page_regions' in template and template['page_regions']:
-                        print("Page configs not found, converting serialized page regions")
-                        converted_page_regions = []
-                        for page_regions in template['page_regions']:
-                            converted_regions = {}
-                            for section, rects in page_regions.items():
-                                converted_regions[section] = []
-                                for rect_data in rects:
-                                    converted_rect = convert_coordinates(rect_data, pdf_height)
-                                    converted_regions[section].append(converted_rect)
-                                    print(f"Converted multi-page region: {rect_data} -> {converted_rect}")
-                            converted_page_regions.append(converted_regions)
-                        template['page_regions'] = converted_page_regions
-
-                    # Process page column lines with coordinate conversion
-                    if 'page_column_lines' in template and template['page_column_lines']:
-                        # Check if we have page_configs with original coordinates
-                        if 'page_configs' in template and template['page_configs']:
-                            print("Using original column lines from page_configs")
-                            page_configs = template['page_configs']
-                            converted_page_column_lines = []
-
-                            for page_idx, page_column_lines in enumerate(template['page_column_lines']):
-                                # Check if we have page_config for this page
-                                if page_idx < len(page_configs) and page_configs[page_idx] and 'original_column_lines' in page_configs[page_idx]:
-                                    # Use original column lines from page_config
-                                    original_column_lines = page_configs[page_idx]['original_column_lines']
-                                    converted_column_lines = {}
-
-                                    for section, lines in original_column_lines.items():
-                                        converted_column_lines[section] = []
-                                        for line_data in lines:
-                                            if isinstance(line_data, list) and len(line_data) >= 2:
-                                                # Check if the first two elements are dictionaries with x,y coordinates
-                                                if (isinstance(line_data[0], dict) and 'x' in line_data[0] and 'y' in line_data[0] and
-                                                    isinstance(line_data[1], dict) and 'x' in line_data[1] and 'y' in line_data[1]):
-                                                    # Use original coordinates
-                                                    start_point = QPoint(int(line_data[0]['x']), int(line_data[0]['y']))
-                                                    end_point = QPoint(int(line_data[1]['x']), int(line_data[1]['y']))
-                                                    print(f"Using original multi-page column line from page_config: {start_point} -> {end_point}")
-
-                                                    # Check if we have a region index
-                                                    region_index = None
-                                                    if len(line_data) > 2 and isinstance(line_data[2], int):
-                                                        region_index = line_data[2]
-
-                                                    # Create line data with region index if present
-                                                    if region_index is not None:
-                                                        converted_line = [start_point, end_point, region_index]
-                                                    else:
-                                                        converted_line = [start_point, end_point]
-
-                                                    converted_column_lines[section].append(converted_line)
-                                                else:
-                                                    print(f"Warning: Could not convert original column line from page_config: {line_data}")
-                                            else:
-                                                print(f"Warning: Could not convert original column line from page_config: {line_data}")
-
-                                    converted_page_column_lines.append(converted_column_lines)
-                                else:
-                                    # Fallback to converting serialized column lines
-                                    converted_column_lines = {}
-                                    for section, lines in page_column_lines.items():
-                                        converted_column_lines[section] = []
-                                        for line_data in lines:
-                                            # Handle new format with both original and scaled coordinates
-                                            if isinstance(line_data, dict) and 'orig_start' in line_data and 'orig_end' in line_data:
-                                                # Prioritize using original unscaled coordinates
-                                                start_point = line_data['orig_start']
-                                                end_point = line_data['orig_end']
-
-                                                # Convert dictionary to QPoint
-                                                if isinstance(start_point, dict) and 'x' in start_point and 'y' in start_point:
-                                                    x = int(start_point['x'])
-                                                    y = int(start_point['y'])
-                                                    start_point = QPoint(x, y)
-
-                                                if isinstance(end_point, dict) and 'x' in end_point and 'y' in end_point:
-                                                    x = int(end_point['x'])
-                                                    y = int(end_point['y'])
-                                                    end_point = QPoint(x, y)
-
-                                                # Create line data with region index if present
-                                                if 'region_index' in line_data:
-                                                    converted_column_lines[section].append([start_point, end_point, line_data['region_index']])
-                                                else:
-                                                    converted_column_lines[section].append([start_point, end_point])
-                                            # Handle old format with list of points
-                                            elif isinstance(line_data, list) or isinstance(line_data, tuple):
-                                                if len(line_data) == 2:
-                                                    start_point = line_data[0]
-                                                    end_point = line_data[1]
-
-                                                    # Convert dictionary to QPoint if needed
-                                                    if isinstance(start_point, dict) and 'x' in start_point and 'y' in start_point:
-                                                        x = int(start_point['x'])
-                                                        y = int(start_point['y'])
-                                                        if pdf_height is not None and template.get('uses_bottom_left', True):
-                                                            y = pdf_height - y  # Convert to top-left origin
-                                                        start_point = QPoint(x, y)
-
-                                                    if isinstance(end_point, dict) and 'x' in end_point and 'y' in end_point:
-                                                        x = int(end_point['x'])
-                                                        y = int(end_point['y'])
-                                                        if pdf_height is not None and template.get('uses_bottom_left', True):
-                                                            y = pdf_height - y  # Convert to top-left origin
-                                                        end_point = QPoint(x, y)
-
-                                                    converted_column_lines[section].append([start_point, end_point])
-                                                elif len(line_data) == 3:
-                                                    start_point = line_data[0]
-                                                    end_point = line_data[1]
-                                                    rect_index = line_data[2]
-
-                                                    # Convert dictionary to QPoint if needed
-                                                    if isinstance(start_point, dict) and 'x' in start_point and 'y' in start_point:
-                                                        x = int(start_point['x'])
-                                                        y = int(start_point['y'])
-                                                        if pdf_height is not None and template.get('uses_bottom_left', True):
-                                                            y = pdf_height - y  # Convert to top-left origin
-                                                        start_point = QPoint(x, y)
-
-                                                    if isinstance(end_point, dict) and 'x' in end_point and 'y' in end_point:
-                                                        x = int(end_point['x'])
-                                                        y = int(end_point['y'])
-                                                        if pdf_height is not None and template.get('uses_bottom_left', True):
-                                                            y = pdf_height - y  # Convert to top-left origin
-                                                        end_point = QPoint(x, y)
-
-                                                    converted_column_lines[section].append([start_point, end_point, rect_index])
-                                            else:
-                                                # Unknown format, log error and continue
-                                                print(f"Warning: Unknown column line format in multi-page template: {line_data}")
-                                    converted_page_column_lines.append(converted_column_lines)
-                        template['page_column_lines'] = converted_page_column_lines
-
-                # Set configuration in PDF processor
-                if self.pdf_processor:
-                    # Set multi-table mode
-                    if hasattr(self.pdf_processor, 'multi_table_mode'):
-                        multi_table_mode = template.get('config', {}).get('multi_table_mode', False)
-                        self.pdf_processor.multi_table_mode = multi_table_mode
-                        print(f"Setting multi-table mode to {multi_table_mode} based on template config")
-
-                    # Set extraction method if available
-                    if hasattr(self.pdf_processor, 'current_extraction_method'):
-                        # Get the latest template data from the database to ensure we have the most up-to-date extraction method
-                        db_template = self.db.get_template(template_id=template_id)
-
-                        if db_template and 'extraction_method' in db_template:
-                            extraction_method = db_template['extraction_method']
-                            self.pdf_processor.current_extraction_method = extraction_method
-                            print(f"[DEBUG] Set extraction method from template: {extraction_method}")
-
-                            # Update the UI dropdown if it exists
-                            if hasattr(self.pdf_processor, 'extraction_method_combo'):
-                                self.pdf_processor.extraction_method_combo.setCurrentText(extraction_method)
-                                print(f"[DEBUG] Updated extraction method dropdown to: {extraction_method}")
-                        else:
-                            print(f"[DEBUG] No extraction method found in template, using default")
-
-                    # Set extraction parameters - ALWAYS fetch from database
-                    if hasattr(self.pdf_processor, 'extraction_params'):
-                        # Get the latest template data from the database to ensure we have the most up-to-date extraction parameters
-                        if 'db_template' not in locals():
-                            db_template = self.db.get_template(template_id=template_id)
-
-                        # Print the entire db_template for debugging
-                        print(f"[DEBUG] Database template: {db_template}")
-
-                        if db_template and 'config' in db_template and 'extraction_params' in db_template['config']:
-                            # Use extraction parameters from database WITHOUT adding any defaults
-                            extraction_params = db_template['config']['extraction_params']
-                            print(f"[DEBUG] Setting extraction parameters from database exactly as stored: {extraction_params}")
-
-                            # Verify extraction parameters structure
-                            if not isinstance(extraction_params, dict):
-                                print(f"[WARNING] Extraction parameters from database are not a dictionary: {type(extraction_params)}")
-                                extraction_params = {}
-
-                            # Ensure all section parameters exist but don't add default values
-                            for section in ['header', 'items', 'summary']:
-                                if section not in extraction_params:
-                                    extraction_params[section] = {}
-                                    print(f"[DEBUG] Added empty section {section} without defaults")
-
-                                # Ensure section parameters have the required structure
-                                section_params = extraction_params[section]
-
-                                # Get global parameters
-                                global_flavor = extraction_params.get('flavor', 'stream')
-                                global_split_text = extraction_params.get('split_text', True)
-                                global_strip_text = extraction_params.get('strip_text', '\n')
-
-                                # Add missing parameters to section if they don't exist
-                                if 'flavor' not in section_params:
-                                    section_params['flavor'] = global_flavor
-                                    print(f"[DEBUG] Added flavor={global_flavor} to {section} section")
-
-                                if 'split_text' not in section_params:
-                                    section_params['split_text'] = global_split_text
-                                    print(f"[DEBUG] Added split_text={global_split_text} to {section} section")
-
-                                if 'strip_text' not in section_params:
-                                    section_params['strip_text'] = global_strip_text
-                                    print(f"[DEBUG] Added strip_text={global_strip_text} to {section} section")
-
-                                if 'edge_tol' not in section_params:
-                                    section_params['edge_tol'] = 0.5
-                                    print(f"[DEBUG] Added edge_tol=0.5 to {section} section")
-
-                            # Set the extraction parameters exactly as they are in the database
-                            self.pdf_processor.extraction_params = extraction_params
-
-                            # Print the extraction parameters that were set
-                            print(f"[DEBUG] Final extraction parameters set: {self.pdf_processor.extraction_params}")
-
-                            # Verify row_tol values
-                            for section in ['header', 'items', 'summary']:
-                                if 'row_tol' in extraction_params.get(section, {}):
-                                    print(f"[DEBUG] {section} row_tol: {extraction_params[section]['row_tol']}")
-                                else:
-                                    print(f"[DEBUG] {section} row_tol not found in extraction parameters")
-
-                        elif 'config' in template and 'extraction_params' in template['config']:
-                            # Fallback to template config if database doesn't have extraction parameters
-                            # Use exactly as stored without adding defaults
-                            extraction_params = template['config']['extraction_params']
-                            print(f"[DEBUG] Setting extraction parameters from template config exactly as stored: {extraction_params}")
-
-                            # Verify extraction parameters structure
-                            if not isinstance(extraction_params, dict):
-                                print(f"[WARNING] Extraction parameters from template are not a dictionary: {type(extraction_params)}")
-                                extraction_params = {}
-
-                            # Ensure all section parameters exist but don't add default values
-                            for section in ['header', 'items', 'summary']:
-                                if section not in extraction_params:
-                                    extraction_params[section] = {}
-                                    print(f"[DEBUG] Added empty section {section} without defaults")
-
-                                # Ensure section parameters have the required structure
-                                section_params = extraction_params[section]
-
-                                # Get global parameters
-                                global_flavor = extraction_params.get('flavor', 'stream')
-                                global_split_text = extraction_params.get('split_text', True)
-                                global_strip_text = extraction_params.get('strip_text', '\n')
-
-                                # Add missing parameters to section if they don't exist
-                                if 'flavor' not in section_params:
-                                    section_params['flavor'] = global_flavor
-                                    print(f"[DEBUG] Added flavor={global_flavor} to {section} section")
-
-                                if 'split_text' not in section_params:
-                                    section_params['split_text'] = global_split_text
-                                    print(f"[DEBUG] Added split_text={global_split_text} to {section} section")
-
-                                if 'strip_text' not in section_params:
-                                    section_params['strip_text'] = global_strip_text
-                                    print(f"[DEBUG] Added strip_text={global_strip_text} to {section} section")
-
-                                if 'edge_tol' not in section_params:
-                                    section_params['edge_tol'] = 0.5
-                                    print(f"[DEBUG] Added edge_tol=0.5 to {section} section")
-
-                            # Set the extraction parameters exactly as they are in the template
-                            self.pdf_processor.extraction_params = extraction_params
-
-                            # Print the extraction parameters that were set
-                            print(f"[DEBUG] Final extraction parameters set: {self.pdf_processor.extraction_params}")
-
-                            # Verify row_tol values
-                            for section in ['header', 'items', 'summary']:
-                                if 'row_tol' in extraction_params.get(section, {}):
-                                    print(f"[DEBUG] {section} row_tol: {extraction_params[section]['row_tol']}")
-                                else:
-                                    print(f"[DEBUG] {section} row_tol not found in extraction parameters")
+                                # Ensure all section parameters exist, inheriting missing ones from the globals
+                                _fill_section_params(extraction_params)
 
-                        else:
-                            # If no extraction parameters found, initialize with empty structure
-                            # Do not add any default values
-                            self.pdf_processor.extraction_params = {
-                                'header': {},
-                                'items': {},
-                                'summary': {},
-                                'flavor': 'stream'  # Only add flavor as it's required for extraction
-                            }
-                            print(f"[DEBUG] No extraction parameters found, initializing with empty structure without defaults")
+                                # Set the extraction parameters exactly as they are in the template
+                                pdf_processor.extraction_params = extraction_params
 
-                            # Print the extraction parameters that were set
-                            print(f"[DEBUG] Final extraction parameters set: {self.pdf_processor.extraction_params}")
+                                # Print the extraction parameters that were set
+                                logger.debug("Final extraction parameters set: %s", pdf_processor.extraction_params)
 
-                    # Set the entire config object for reference - always use the latest from database
-                    if hasattr(self.pdf_processor, 'template_config'):
-                        # Use the db_template we already fetched above if available
-                        if 'db_template' in locals() and db_template and 'config' in db_template:
-                            self.pdf_processor.template_config = db_template['config']
-                            print(f"[DEBUG] Setting complete template config from database")
-                        else:
-                            # Fallback to template config if database fetch failed
-                            self.pdf_processor.template_config = template.get('config', {})
-                            print(f"[DEBUG] Setting complete template config from template (fallback)")
-
-                # Set up table_areas dictionary in the pdf_processor for structured storage
-                if self.pdf_processor:
-                    template_type = template.get('template_type', 'single')
-                    if template_type == 'single' and 'regions' in template:
-                        self.pdf_processor.table_areas = {}
-
-                        # Build table_areas for each section - handle standard format
-                        for section, region_list in template['regions'].items():
-                            for i, region_item in enumerate(region_list):
-                                table_label = f"{section}_table_{i+1}"
-
-                                # Extract coordinates from clean dual coordinates format
-                                try:
-                                    from clean_region_utils import get_drawing_coordinates, get_region_name
-                                    rect = get_drawing_coordinates(region_item)
-                                    name = get_region_name(region_item)
-                                except ImportError:
-                                    # Fallback for when clean_region_utils is not available
-                                    print(f"[WARNING] clean_region_utils not available, using fallback for {section}[{i}]")
-                                    # Handle StandardRegion objects from database
-                                    if hasattr(region_item, 'rect') and hasattr(region_item, 'label'):
-                                        rect = region_item.rect
-                                        name = region_item.label
-                                    elif isinstance(region_item, dict) and 'rect' in region_item:
-                                        rect = region_item['rect']
-                                        name = region_item.get('label', f"{section}_{i}")
+                                # Verify row_tol values
+                                for section in ['header', 'items', 'summary']:
+                                    if 'row_tol' in extraction_params.get(section, {}):
+                                        logger.debug("%s row_tol: %s", section, extraction_params[section]['row_tol'])
                                     else:
-                                        print(f"Skipping invalid region in {section}[{i}]: unsupported format")
-                                        continue
-                                except ValueError as e:
-                                    print(f"Skipping invalid region in {section}[{i}]: {e}")
-                                    continue
-
-                                # Get columns for this table - use dual coordinate data if available
-                                columns = []
-                                # Check dual coordinate column lines first, then legacy
-                                drawing_column_lines = template.get('drawing_column_lines', template.get('column_lines', {}))
-                                if section in drawing_column_lines:
-                                    for line_data in drawing_column_lines[section]:
-                                        if len(line_data) >= 2:
-                                            if len(line_data) == 2 or (len(line_data) == 3 and line_data[2] == i):
-                                                # This line belongs to the current table
-                                                columns.append(line_data[0].x())
-
-                                # Create the table area entry
-                                self.pdf_processor.table_areas[table_label] = {
-                                    'type': section,
-                                    'index': i,
-                                    'rect': rect,
-                                    'name': name,
-                                    'columns': sorted(columns) if columns else []
+                                        logger.debug("%s row_tol not found in extraction parameters", section)
+
+                            else:
+                                # If no extraction parameters found, initialize with empty structure
+                                # Do not add any default values
+                                pdf_processor.extraction_params = {
+                                    'header': {},
+                                    'items': {},
+                                    'summary': {},
+                                    'flavor': 'stream'  # Only add flavor as it's required for extraction
                                 }
-                                print(f"Created table_area: {table_label} with {len(columns)} columns, name='{name}'")
-
-                    # For multi-page templates, table_areas will be set up when pages are displayed
-
-                # Check for YAML/JSON template - always use the latest from database
-                yaml_template = None
-
-                # First try to get the template from the database
-                if 'db_template' in locals() and db_template and 'json_template' in db_template:
-                    yaml_template = db_template['json_template']
-                    print(f"\n[DEBUG] YAML template found in database: {yaml_template is not None}")
-                    template_source = "database"
-                # Fallback to template data if database doesn't have it
-                elif 'json_template' in template:
-                    yaml_template = template['json_template']
-                    print(f"\n[DEBUG] YAML template found in template data: {yaml_template is not None}")
-                    template_source = "template data"
-
-                if yaml_template:
-                    print(f"[DEBUG] YAML template type: {type(yaml_template)}")
-                    if isinstance(yaml_template, dict):
-                        print(f"[DEBUG] YAML template keys: {list(yaml_template.keys())}")
-
-                        # Format as YAML (preferred)
-                        try:
-                            import yaml
-                            formatted_yaml = yaml.dump(yaml_template, default_flow_style=False, allow_unicode=True)
-                            print(f"[DEBUG] YAML template preview from {template_source} (first 200 chars): {formatted_yaml[:200]}...")
-
-                            # Set the YAML template in the PDF processor if it has the attribute
-                            if self.pdf_processor and hasattr(self.pdf_processor, 'template_preview'):
-                                print(f"[DEBUG] Setting YAML template in PDF processor's template_preview")
-                                self.pdf_processor.template_preview.setText(formatted_yaml)
-                        except Exception as e:
-                            # Fallback to JSON if YAML formatting fails
-                            print(f"[DEBUG] Failed to format as YAML, using JSON: {str(e)}")
-                            formatted_json = json.dumps(yaml_template, indent=2)
-                            print(f"[DEBUG] JSON template preview from {template_source} (first 200 chars): {formatted_json[:200]}...")
-
-                            # Set the JSON template in the PDF processor if it has the attribute
-                            if self.pdf_processor and hasattr(self.pdf_processor, 'template_preview'):
-                                print(f"[DEBUG] Setting JSON template in PDF processor's template_preview")
-                                self.pdf_processor.template_preview.setText(formatted_json)
-                else:
-                    print(f"[DEBUG] YAML/JSON template is None or empty")
-
-                # Add debugging information
-                print("\n[DEBUG] Template data that will be applied:")
-                if template.get('template_type') == 'single':
-                    # Use dual coordinate regions if available, otherwise use legacy regions
-                    regions_data = template.get('drawing_regions', template.get('regions', {}))
-                    for section, rects in regions_data.items():
-                        print(f"Section: {section} - {len(rects)} regions")
-                        for i, rect_item in enumerate(rects):
-                            # Handle clean dual coordinates format
-                            try:
-                                from clean_region_utils import get_drawing_coordinates, get_region_name
-                                rect = get_drawing_coordinates(rect_item)
-                                name = get_region_name(rect_item)
-                                print(f"  Region {i}: x={rect.x()}, y={rect.y()}, width={rect.width()}, height={rect.height()}, name='{name}'")
-                            except ImportError:
-                                # Fallback for when clean_region_utils is not available
-                                print(f"  Region {i}: clean_region_utils not available, using fallback")
-                                # Handle StandardRegion objects from database
-                                if hasattr(rect_item, 'rect') and hasattr(rect_item, 'label'):
-                                    rect = rect_item.rect
-                                    name = rect_item.label
-                                    print(f"  Region {i}: x={rect.x()}, y={rect.y()}, width={rect.width()}, height={rect.height()}, name='{name}'")
-                                elif isinstance(rect_item, dict) and 'rect' in rect_item:
-                                    rect = rect_item['rect']
-                                    name = rect_item.get('label', f"{section}_{i}")
-                                    print(f"  Region {i}: x={rect.x()}, y={rect.y()}, width={rect.width()}, height={rect.height()}, name='{name}'")
-                                else:
-                                    print(f"  Region {i}: Unable to parse region format")
-                            except ValueError:
-                                # Fallback for any format issues
-                                print(f"  Region {i}: Unable to parse region format")
-
-                    # Use dual coordinate column lines if available, otherwise use legacy column lines
-                    column_lines_data = template.get('drawing_column_lines', template.get('column_lines', {}))
-                    for section, lines in column_lines_data.items():
-                        print(f"Column lines for section: {section} - {len(lines)} lines")
-                        for i, line in enumerate(lines):
-                            if hasattr(line, 'drawing_start_x'):  # DualCoordinateColumnLine
-                                print(f"  Line {i}: start=({line.drawing_start_x}, {line.drawing_start_y}), end=({line.drawing_end_x}, {line.drawing_end_y})")
-                            elif len(line) == 2:  # Legacy format
-                                print(f"  Line {i}: start=({line[0].x()}, {line[0].y()}), end=({line[1].x()}, {line[1].y()})")
-                            elif len(line) == 3:  # Legacy format with rect_index
-                                print(f"  Line {i}: start=({line[0].x()}, {line[0].y()}), end=({line[1].x()}, {line[1].y()}), rect_index={line[2]}")
-                else:
-                    print(f"Multi-page template with {template.get('page_count', 1)} pages")
-                    for page_idx, page_regions in enumerate(template.get('page_regions', [])):
-                        print(f"Page {page_idx + 1} regions:")
-                        for section, rects in page_regions.items():
-                            print(f"  Section: {section} - {len(rects)} regions")
-                            for i, rect_item in enumerate(rects):
-                                # Handle clean dual coordinates format
-                                try:
-                                    from clean_region_utils import get_drawing_coordinates, get_region_name
-                                    rect = get_drawing_coordinates(rect_item)
-                                    name = get_region_name(rect_item)
-                                    print(f"    Region {i}: x={rect.x()}, y={rect.y()}, width={rect.width()}, height={rect.height()}, name='{name}'")
-                                except ImportError:
-                                    # Fallback for when clean_region_utils is not available
-                                    print(f"    Region {i}: clean_region_utils not available, using fallback")
-                                    # Handle StandardRegion objects from database
-                                    if hasattr(rect_item, 'rect') and hasattr(rect_item, 'label'):
-                                        rect = rect_item.rect
-                                        name = rect_item.label
-                                        print(f"    Region {i}: x={rect.x()}, y={rect.y()}, width={rect.width()}, height={rect.height()}, name='{name}'")
-                                    elif isinstance(rect_item, dict) and 'rect' in rect_item:
-                                        rect = rect_item['rect']
-                                        name = rect_item.get('label', f"{section}_{i}")
-                                        print(f"    Region {i}: x={rect.x()}, y={rect.y()}, width={rect.width()}, height={rect.height()}, name='{name}'")
-                                    else:
-                                        print(f"    Region {i}: Unable to parse region format")
-                                except ValueError:
-                                    # Fallback for any format issues
-                                    print(f"    Region {i}: Unable to parse region format")
+                                logger.debug("No extraction parameters found, initializing with empty structure without defaults")
 
+                                # Print the extraction parameters that were set
+                                logger.debug("Final extraction parameters set: %s", pdf_processor.extraction_params)
 
+                        # Set the entire config object for reference - always use the latest from database
+                        if hasattr(pdf_processor, 'template_config'):
+                            # Use the db_template we already fetched above if available
+                            if db_template and 'config' in db_template:
+                                pdf_processor.template_config = db_template['config']
+                                logger.debug("Setting complete template config from database")
+                            else:
+                                # Fallback to template config if database fetch failed
+                                pdf_processor.template_config = config
+                                logger.debug("Setting complete template config from template (fallback)")
+
+                    # Set up table_areas dictionary in the pdf_processor for structured storage
+                    if pdf_processor:
+                        template_type = template.get('template_type', 'single')
+                        if template_type == 'single' and 'regions' in template:
+                            pdf_processor.table_areas = {}
+                            # Check dual coordinate column lines first, then legacy
+                            drawing_column_lines = template.get('drawing_column_lines') or template.get('column_lines') or {}
+
+                            # Build table_areas for each section - handle standard format
+                            for section, region_list in template['regions'].items():
+                                for i, region_item in enumerate(region_list):
+                                    table_label = f"{section}_table_{i+1}"
+
+                                    # Extract coordinates from clean dual coordinates format
+                                    try:
+                                        from clean_region_utils import get_drawing_coordinates, get_region_name
+                                        rect = get_drawing_coordinates(region_item)
+                                        name = get_region_name(region_item)
+                                    except ImportError:
+                                        # Fallback for when clean_region_utils is not available
+                                        logger.warning("clean_region_utils not available, using fallback for %s[%s]", section, i)
+                                        # Handle StandardRegion objects from database
+                                        if hasattr(region_item, 'rect') and hasattr(region_item, 'label'):
+                                            rect = region_item.rect
+                                            name = region_item.label
+                                        elif isinstance(region_item, dict) and 'rect' in region_item:
+                                            rect = region_item['rect']
+                                            name = region_item.get('label', f"{section}_{i}")
+                                        else:
+                                            logger.debug("Skipping invalid region in %s[%s]: unsupported format", section, i)
+                                            continue
+                                    except ValueError as e:
+                                        logger.debug("Skipping invalid region in %s[%s]: %s", section, i, e)
+                                        continue
 
-                # Ask user to select a PDF file
-                file_path, _ = QFileDialog.getOpenFileName(
-                    self, "Select PDF File to Apply Template", "", "PDF Files (*.pdf)"
-                )
+                                    # Get columns for this table - use dual coordinate data if available;
+                                    # a line belongs to it if it has no region index or this table's index
+                                    columns = sorted(line_data[0].x() for line_data in drawing_column_lines.get(section, ())
+                                                     if len(line_data) == 2 or (len(line_data) == 3 and line_data[2] == i))
+
+                                    # Create the table area entry
+                                    pdf_processor.table_areas[table_label] = {
+                                        'type': section,
+                                        'index': i,
+                                        'rect': rect,
+                                        'name': name,
+                                        'columns': columns
+                                    }
+                                    logger.debug("Created table_area: %s with %s columns, name='%s'", table_label, len(columns), name)
+
+                        # For multi-page templates, table_areas will be set up when pages are displayed
+
+                    # Check for YAML/JSON template - always use the latest from database
+                    yaml_template = None
+
+                    # First try to get the template from the database
+                    if db_template and 'json_template' in db_template:
+                        yaml_template = db_template['json_template']
+                        logger.debug("YAML template found in database: %s", yaml_template is not None)
+                        template_source = "database"
+                    # Fallback to template data if database doesn't have it
+                    elif 'json_template' in template:
+                        yaml_template = template['json_template']
+                        logger.debug("YAML template found in template data: %s", yaml_template is not None)
+                        template_source = "template data"
+
+                    if yaml_template:
+                        logger.debug("YAML template type: %s", type(yaml_template))
+                        if isinstance(yaml_template, dict):
+                            logger.debug("YAML template keys: %s", list(yaml_template.keys()))
+
+                            # Format as YAML (preferred)
+                            try:
+                                formatted_yaml = yaml.dump(yaml_template, default_flow_style=False, allow_unicode=True)
+                                logger.debug("YAML template preview from %s (first 200 chars): %s...", template_source, formatted_yaml[:200])
 
-                if not file_path:
-                    # User cancelled, don't apply template
-                    QMessageBox.information(
-                        self,
-                        "Template Application Cancelled",
-                        "You need to select a PDF file to apply the template."
+                                # Set the YAML template in the PDF processor if it has the attribute
+                                if pdf_processor and hasattr(pdf_processor, 'template_preview'):
+                                    logger.debug("Setting YAML template in PDF processor's template_preview")
+                                    pdf_processor.template_preview.setText(formatted_yaml)
+                            except Exception as e:
+                                # Fallback to JSON if YAML formatting fails
+                                logger.debug("Failed to format as YAML, using JSON: %s", str(e))
+                                formatted_json = json.dumps(yaml_template, indent=2)
+                                logger.debug("JSON template preview from %s (first 200 chars): %s...", template_source, formatted_json[:200])
+
+                                # Set the JSON template in the PDF processor if it has the attribute
+                                if pdf_processor and hasattr(pdf_processor, 'template_preview'):
+                                    logger.debug("Setting JSON template in PDF processor's template_preview")
+                                    pdf_processor.template_preview.setText(formatted_json)
+                    else:
+                        logger.debug("YAML/JSON template is None or empty")
+
+                    # Add debugging information; the dump walks every region, so skip it unless it is logged
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Template data that will be applied:")
+                        if template.get('template_type') == 'single':
+                            # Use dual coordinate regions if available, otherwise use legacy regions
+                            regions_data = template.get('drawing_regions', template.get('regions', {}))
+                            for section, rects in regions_data.items():
+                                logger.debug("Section: %s - %s regions", section, len(rects))
+                                for i, rect_item in enumerate(rects):
+                                    # Handle clean dual coordinates format
+                                    try:
+                                        from clean_region_utils import get_drawing_coordinates, get_region_name
+                                        rect = get_drawing_coordinates(rect_item)
+                                        name = get_region_name(rect_item)
+                                        logger.debug("  Region %s: x=%s, y=%s, width=%s, height=%s, name='%s'", i, rect.x(), rect.y(), rect.width(), rect.height(), name)
+                                    except ImportError:
+                                        # Fallback for when clean_region_utils is not available
+                                        logger.debug("  Region %s: clean_region_utils not available, using fallback", i)
+                                        # Handle StandardRegion objects from database
+                                        if hasattr(rect_item, 'rect') and hasattr(rect_item, 'label'):
+                                            rect = rect_item.rect
+                                            name = rect_item.label
+                                            logger.debug("  Region %s: x=%s, y=%s, width=%s, height=%s, name='%s'", i, rect.x(), rect.y(), rect.width(), rect.height(), name)
+                                        elif isinstance(rect_item, dict) and 'rect' in rect_item:
+                                            rect = rect_item['rect']
+                                            name = rect_item.get('label', f"{section}_{i}")
+                                            logger.debug("  Region %s: x=%s, y=%s, width=%s, height=%s, name='%s'", i, rect.x(), rect.y(), rect.width(), rect.height(), name)
+                                        else:
+                                            logger.debug("  Region %s: Unable to parse region format", i)
+                                    except ValueError:
+                                        # Fallback for any format issues
+                                        logger.debug("  Region %s: Unable to parse region format", i)
+
+                            # Use dual coordinate column lines if available, otherwise use legacy column lines
+                            column_lines_data = template.get('drawing_column_lines') or template.get('column_lines') or {}
+                            for section, lines in column_lines_data.items():
+                                logger.debug("Column lines for section: %s - %s lines", section, len(lines))
+                                for i, line in enumerate(lines):
+                                    if hasattr(line, 'drawing_start_x'):  # DualCoordinateColumnLine
+                                        logger.debug("  Line %s: start=(%s, %s), end=(%s, %s)", i, line.drawing_start_x, line.drawing_start_y, line.drawing_end_x, line.drawing_end_y)
+                                    elif len(line) == 2:  # Legacy format
+                                        logger.debug("  Line %s: start=(%s, %s), end=(%s, %s)", i, line[0].x(), line[0].y(), line[1].x(), line[1].y())
+                                    elif len(line) == 3:  # Legacy format with rect_index
+                                        logger.debug("  Line %s: start=(%s, %s), end=(%s, %s), rect_index=%s", i, line[0].x(), line[0].y(), line[1].x(), line[1].y(), line[2])
+                        else:
+                            logger.debug("Multi-page template with %s pages", template.get('page_count', 1))
+                            for page_idx, page_regions in enumerate(template.get('page_regions', [])):
+                                logger.debug("Page %s regions:", page_idx + 1)
+                                for section, rects in page_regions.items():
+                                    logger.debug("  Section: %s - %s regions", section, len(rects))
+                                    for i, rect_item in enumerate(rects):
+                                        # Handle clean dual coordinates format
+                                        try:
+                                            from clean_region_utils import get_drawing_coordinates, get_region_name
+                                            rect = get_drawing_coordinates(rect_item)
+                                            name = get_region_name(rect_item)
+                                            logger.debug("    Region %s: x=%s, y=%s, width=%s, height=%s, name='%s'", i, rect.x(), rect.y(), rect.width(), rect.height(), name)
+                                        except ImportError:
+                                            # Fallback for when clean_region_utils is not available
+                                            logger.debug("    Region %s: clean_region_utils not available, using fallback", i)
+                                            # Handle StandardRegion objects from database
+                                            if hasattr(rect_item, 'rect') and hasattr(rect_item, 'label'):
+                                                rect = rect_item.rect
+                                                name = rect_item.label
+                                                logger.debug("    Region %s: x=%s, y=%s, width=%s, height=%s, name='%s'", i, rect.x(), rect.y(), rect.width(), rect.height(), name)
+                                            elif isinstance(rect_item, dict) and 'rect' in rect_item:
+                                                rect = rect_item['rect']
+                                                name = rect_item.get('label', f"{section}_{i}")
+                                                logger.debug("    Region %s: x=%s, y=%s, width=%s, height=%s, name='%s'", i, rect.x(), rect.y(), rect.width(), rect.height(), name)
+                                            else:
+                                                logger.debug("    Region %s: Unable to parse region format", i)
+                                        except ValueError:
+                                            # Fallback for any format issues
+                                            logger.debug("    Region %s: Unable to parse region format", i)
+
+                    # Ask user to select a PDF file
+                    file_path, _ = QFileDialog.getOpenFileName(
+                        self, "Select PDF File to Apply Template", "", "PDF Files (*.pdf)"
                     )
-                    return
 
-                # Add the file path to the template data
-                template['selected_pdf_path'] = file_path
-                print(f"\n[DEBUG] Selected PDF file: {file_path}")
-                print(f"[DEBUG] Template data: {template['name']}, type: {template.get('template_type', 'single')}")
-                # Use dual coordinate data for counts
-                drawing_regions = template.get('drawing_regions', template.get('regions', {}))
-                drawing_column_lines = template.get('drawing_column_lines', template.get('column_lines', {}))
-                print(f"[DEBUG] Regions count: {len(drawing_regions)}")
-                print(f"[DEBUG] Column lines count: {len(drawing_column_lines)}")
-                if template.get('template_type') == 'multi':
-                    print(f"[DEBUG] Page regions count: {len(template.get('page_regions', []))}")
-                    print(f"[DEBUG] Page column lines count: {len(template.get('page_column_lines', []))}")
-                    print(f"[DEBUG] Page configs count: {len(template.get('page_configs', []))}")
-                print(f"[DEBUG] Config: {template.get('config', {})}")
-
-                # Make sure multi-page settings are properly included
-                if template.get('template_type') == 'multi':
-                    # Set is_multi_page flag
-                    template['is_multi_page'] = True
-
-                    # Multi-page options removed - using simplified page-wise approach
-
-                print("[DEBUG] Emitting template_selected signal...")
-
-
-                # Ensure page_configs are properly included in the template data
-                if template.get('template_type') == 'multi' and 'page_configs' in template:
-                    print(f"[DEBUG] Ensuring page_configs are properly included: {len(template['page_configs'])} configs")
-                    # Make sure page_configs are properly formatted and accessible
-                    for i, page_config in enumerate(template['page_configs']):
-                        if page_config and 'original_regions' in page_config:
-                            print(f"[DEBUG] Page {i+1} has original_regions with {len(page_config['original_regions'])} sections")
-
-                # Emit the template selection signal with the template data
-                # The PDFProcessor will receive this data and apply it to the PDF
-                # The PDFLabel will handle the scaling when drawing the regions
-                # Add a flag to force extraction to ensure results are updated immediately
-                template['force_extraction'] = True
-                self.template_selected.emit(template)
-
-                # Show success message - commented out as requested
-                # success_msg = QMessageBox(self)
-                # success_msg.setWindowTitle("Template Applied")
-                # success_msg.setText("Template Applied Successfully")
-                # success_msg.setInformativeText(f"The template '{template['name']}' has been applied to '{os.path.basename(file_path)}'. You can now use it for PDF processing.")
-                # success_msg.setIcon(QMessageBox.Information)
-                # success_msg.setStyleSheet("QLabel { color: black; }")
-                # success_msg.exec()
+                    if not file_path:
+                        # User cancelled, don't apply template
+                        QMessageBox.information(
+                            self,
+                            "Template Application Cancelled",
+                            "You need to select a PDF file to apply the template."
+                        )
+                        return
+
+                    # Add the file path to the template data
+                    template['selected_pdf_path'] = file_path
+                    logger.debug("Selected PDF file: %s", file_path)
+                    logger.debug("Template data: %s, type: %s", template['name'], template.get('template_type', 'single'))
+                    # Use dual coordinate data for counts
+                    drawing_regions = template.get('drawing_regions', template.get('regions', {}))
+                    drawing_column_lines = template.get('drawing_column_lines') or template.get('column_lines') or {}
+                    logger.debug("Regions count: %s", len(drawing_regions))
+                    logger.debug("Column lines count: %s", len(drawing_column_lines))
+                    if template.get('template_type') == 'multi':
+                        logger.debug("Page regions count: %s", len(template.get('page_regions', [])))
+                        logger.debug("Page column lines count: %s", len(template.get('page_column_lines', [])))
+                        logger.debug("Page configs count: %s", len(template.get('page_configs', [])))
+                    logger.debug("Config: %s", template.get('config', {}))
+
+                    # Make sure multi-page settings are properly included
+                    if template.get('template_type') == 'multi':
+                        # Set is_multi_page flag
+                        template['is_multi_page'] = True
+
+                        # Multi-page options removed - using simplified page-wise approach
+
+                    logger.debug("Emitting template_selected signal...")
+
+
+                    # Ensure page_configs are properly included in the template data
+                    if template.get('template_type') == 'multi' and 'page_configs' in template:
+                        logger.debug("Ensuring page_configs are properly included: %s configs", len(template['page_configs']))
+                        # Make sure page_configs are properly formatted and accessible
+                        for i, page_config in enumerate(template['page_configs']):
+                            if page_config and 'original_regions' in page_config:
+                                logger.debug("Page %s has original_regions with %s sections", i+1, len(page_config['original_regions']))
+
+                    # Emit the template selection signal with the template data
+                    # The PDFProcessor will receive this data and apply it to the PDF
+                    # The PDFLabel will handle the scaling when drawing the regions
+                    # Add a flag to force extraction to ensure results are updated immediately
+                    template['force_extraction'] = True
+                    self.template_selected.emit(template)
+
+                    # Show success message - commented out as requested
+                    # success_msg = QMessageBox(self)
+                    # success_msg.setWindowTitle("Template Applied")
+                    # success_msg.setText("Template Applied Successfully")
+                    # success_msg.setInformativeText(f"The template '{template['name']}' has been applied to '{os.path.basename(file_path)}'. You can now use it for PDF processing.")
+                    # success_msg.setIcon(QMessageBox.Information)
+                    # success_msg.setStyleSheet("QLabel { color: black; }")
+                    # success_msg.exec()
+
+                except Exception as e:
+                    self._report_apply_error(e)
+
+            self._preview_callback = apply_confirmed
+            preview.open()
 
         except Exception as e:
-            error_dialog = QMessageBox(self)
-            error_dialog.setWindowTitle("Error")
-            error_dialog.setText("Error Applying Template")
-            error_dialog.setInformativeText(f"An error occurred: {str(e)}")
-            error_dialog.setIcon(QMessageBox.Critical)
-            error_dialog.setStyleSheet("QLabel { color: black; }")
-            error_dialog.exec()
-            # Print detailed error information to help with debugging
-            import traceback
+            self._report_apply_error(e)
+
+    def _get_preview_box(self):
+        """The template preview message box, built once and reused by every apply_template call"""
+        if self._preview_box is None:
+            preview = QMessageBox(self)
+            preview.setWindowTitle("Template Preview")
+            preview.setText("Template Preview")
+            preview.setStandardButtons(QMessageBox.Apply | QMessageBox.Cancel)
+            preview.setDefaultButton(QMessageBox.Apply)
+            preview.setStyleSheet("QLabel { color: black; }")
+            preview.finished.connect(self._on_preview_finished)
+            self._preview_box = preview
+        return self._preview_box
+
+    def _on_preview_finished(self, result):
+        callback, self._preview_callback = self._preview_callback, None
+        if callback is not None:
+            callback(result)
+
+    def _report_apply_error(self, e):
+        """Show the error dialog for a template that could not be applied"""
+        error_dialog = QMessageBox(self)
+        error_dialog.setWindowTitle("Error")
+        error_dialog.setText("Error Applying Template")
+        error_dialog.setInformativeText(f"An error occurred: {str(e)}")
+        error_dialog.setIcon(QMessageBox.Critical)
+        error_dialog.setStyleSheet("QLabel { color: black; }")
+        self._open_dialog(error_dialog)
+        # Print detailed error information to help with debugging
+        if logger.isEnabledFor(logging.DEBUG):
             traceback.print_exc()
 
     def closeEvent(self, event):
@@ -4635,8 +4800,9 @@ class TemplateManager(QWidget):
                     else:
                         raise Exception("Failed to create new database after multiple attempts")
 
-            # Refresh the templates table
-            self.templates_table.setRowCount(0)
+            # Refresh the templates table from the new, empty database
+            self._invalidate_templates_cache()
+            self.load_templates()
 
             QMessageBox.information(
                 self,
@@ -4660,7 +4826,6 @@ class TemplateManager(QWidget):
             )
             QMessageBox.critical(self, "Error", error_msg)
             print(f"Error resetting database: {str(e)}")
-            import traceback
             traceback.print_exc()
 
     def close_all_connections(self):
@@ -4707,7 +4872,6 @@ class TemplateManager(QWidget):
 
         except Exception as e:
             print(f"Error in close_all_connections: {str(e)}")
-            import traceback
             traceback.print_exc()  # Add this method to the TemplateManager class
     def validate_template_data(self, template_data):
         """Validate template data before saving to database"""
@@ -4825,7 +4989,6 @@ class TemplateManager(QWidget):
             )
 
             print(f"Error in add_template: {str(e)}")
-            import traceback
             traceback.print_exc()
 
     def export_template(self):
@@ -4948,7 +5111,6 @@ class TemplateManager(QWidget):
             )
 
             print(f"Error in export_template: {str(e)}")
-            import traceback
             traceback.print_exc()
 
     def import_template(self):
@@ -5033,13 +5195,9 @@ class TemplateManager(QWidget):
             progress.setStyleSheet("QLabel { color: black; }")
             progress.show()
 
-            # Process events to ensure the dialog is displayed
-            QApplication.processEvents()
-
             try:
-                # Update progress
+                # Update progress; setValue() on a modal progress dialog already repaints it
                 progress.setValue(30)
-                QApplication.processEvents()
 
                 # Save the template using factory pattern
                 db_factory = get_database_factory(self.db)
@@ -5078,14 +5236,12 @@ class TemplateManager(QWidget):
 
                 # Update progress
                 progress.setValue(70)
-                QApplication.processEvents()
 
                 # Refresh the template list
                 self.load_templates()
 
                 # Update progress to completion
                 progress.setValue(100)
-                QApplication.processEvents()
 
                 # Show success message using factory
                 UIMessageFactory.show_info(
@@ -5097,7 +5253,6 @@ class TemplateManager(QWidget):
             except Exception as inner_e:
                 # Close the progress dialog
                 progress.close()
-                QApplication.processEvents()
 
                 error_message = f"""
 <h3>Error Importing Template</h3>
@@ -5114,16 +5269,11 @@ class TemplateManager(QWidget):
                 error_dialog.exec()
 
                 print(f"Error in import_template save operation: {str(inner_e)}")
-                import traceback
                 traceback.print_exc()
 
             finally:
-                # Make sure progress dialog is closed
-                try:
-                    progress.close()
-                    QApplication.processEvents()
-                except Exception as close_e:
-                    print(f"Error closing progress dialog: {str(close_e)}")
+                # Make sure progress dialog is closed; close() is a no-op once it already is
+                progress.close()
 
         except json.JSONDecodeError as json_e:
             QMessageBox.warning(
@@ -5148,5 +5298,4 @@ class TemplateManager(QWidget):
             error_dialog.exec()
 
             print(f"Error in import_template: {str(e)}")
-            import traceback
             traceback.print_exc()